@@ -13,3 +13,4 @@
 """Qiskit Ignis Root."""
 
 from .version import __version__
+from .counts_array import CountsArray
@@ -23,8 +23,7 @@ from scipy.optimize import curve_fit
 import numpy as np
 from qiskit import QiskitError
 from qiskit.result import Result
-from ..verification.tomography import marginal_counts
-from ..utils import build_counts_dict_from_list
+from ..counts_array import CountsArray
 
 try:
     from matplotlib import pyplot as plt
@@ -39,7 +38,8 @@ class BaseFitter:
 
     Args:
         description: description of the fitter's purpose, e.g. 'T1'.
-        backend_result: result of execution on the backend.
+        backend_result: result of execution on the backend, or its
+            counts as a CountsArray.
         xdata: a list of the independent parameter
                (which will be fit against).
         qubits: the qubits to be characterized.
@@ -54,7 +54,7 @@ class BaseFitter:
     """
 
     def __init__(self, description: str,
-                 backend_result: Union[Result, List[Result]],
+                 backend_result: Union[Result, CountsArray, List[Result]],
                  xdata: Union[List[float], np.array],
                  qubits: List[int],
                  fit_fun: Callable[..., float],
@@ -76,6 +76,7 @@ class BaseFitter:
         self._circuit_names = circuit_names
 
         self._backend_result_list = []
+        self._counts = CountsArray()
         autofit = False
 
         if backend_result is not None:
@@ -85,6 +86,7 @@ class BaseFitter:
                     self._backend_result_list.append(result)
             else:
                 self._backend_result_list.append(backend_result)
+            self._counts.add(backend_result)
 
         self._description = description
         self._expected_state = expected_state
@@ -216,7 +218,7 @@ class BaseFitter:
         return param_list
 
     def add_data(self,
-                 results: Union[Result, List[Result]],
+                 results: Union[Result, CountsArray, List[Result]],
                  recalc: bool = True,
                  refit: bool = True):
         """
@@ -233,6 +235,7 @@ class BaseFitter:
                 self._backend_result_list.append(result)
         else:
             self._backend_result_list.append(results)
+        self._counts.add(results)
 
         if recalc:
             self._calc_data()  # computes self._ydata
@@ -251,20 +254,6 @@ class BaseFitter:
 
         """
 
-        circ_counts = {}
-        for _, serieslbl in enumerate(self._series):
-            for circ, _ in enumerate(self._xdata):
-                circname = self._circuit_names[circ] + serieslbl
-                count_list = []
-                for result in self._backend_result_list:
-                    try:
-                        count_list.append(result.get_counts(circname))
-                    except (QiskitError, KeyError):
-                        pass
-
-                circ_counts[circname] = \
-                    build_counts_dict_from_list(count_list)
-
         self._ydata = {}
         for _, serieslbl in enumerate(self._series):
             self._ydata[serieslbl] = []
@@ -272,11 +261,13 @@ class BaseFitter:
                 self._ydata[serieslbl].append({'mean': [], 'std': []})
                 for circ, _ in enumerate(self._xdata):
                     circname = self._circuit_names[circ] + serieslbl
-                    shots = sum(circ_counts[circname].values())
-                    counts_subspace = \
-                        marginal_counts(circ_counts[circname], [qind])
-                    success_prob = \
-                        counts_subspace.get(self._expected_state, 0) / shots
+                    if circname not in self._counts:
+                        self._ydata[serieslbl][-1]['mean'].append(np.nan)
+                        self._ydata[serieslbl][-1]['std'].append(np.nan)
+                        continue
+                    shots = self._counts.shots(circname)
+                    success_prob = self._counts.probabilities(
+                        circname, [qind])[int(self._expected_state)]
                     self._ydata[serieslbl][-1]['mean'].append(success_prob)
                     self._ydata[serieslbl][-1]['std'].append(
                         np.sqrt(success_prob * (1-success_prob) / shots))
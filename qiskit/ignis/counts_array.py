@@ -0,0 +1,427 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Integer-indexed counts of the experiments of execution results
+"""
+
+from typing import Dict, List, Optional, Union
+import numpy as np
+from qiskit import QiskitError, QuantumCircuit
+from qiskit.result import Result
+
+
+class CountsArray:
+    """The measurement counts of a set of experiments, stored as arrays.
+
+    The outcomes of an experiment are integers with clbit-0 as least
+    significant bit. The counts of an experiment with at most
+    ``dense_clbits`` clbits are stored as a dense vector of length
+    ``2 ** num_clbits``; the counts of wider experiments are stored as
+    sorted (outcome, count) pairs of the observed outcomes only.
+
+    The counts of a ``Result`` are read once from the hexadecimal counts
+    of its experiments, without formatting them as bitstrings. Counts of
+    experiments with the same name are added together, so a
+    ``CountsArray`` can gather the counts of several jobs.
+
+    Example:
+        >>> counts = CountsArray.from_result(result)
+        >>> counts.marginal('rb_length_0_seed_0', [0, 1])
+        array([921,  35,  40,   4])
+        >>> counts.probabilities('rb_length_0_seed_0', [0, 1])[0]
+        0.921
+    """
+
+    def __init__(self, dense_clbits: int = 10):
+        """
+        Args:
+            dense_clbits: the maximal number of clbits of an experiment
+                whose counts are stored as a dense vector.
+        """
+        self._dense_clbits = dense_clbits
+        self._names = []
+        self._index = {}
+        self._num_clbits = []
+        self._counts = []
+
+    @classmethod
+    def from_result(cls,
+                    result: Union[Result, List[Result]],
+                    dense_clbits: int = 10) -> 'CountsArray':
+        """Create the counts of the experiments of results.
+
+        Args:
+            result: a result or a list of results.
+            dense_clbits: the maximal number of clbits of an experiment
+                whose counts are stored as a dense vector.
+
+        Returns:
+            The counts of the experiments of the results.
+        """
+        counts = cls(dense_clbits)
+        counts.add(result)
+        return counts
+
+    @classmethod
+    def from_counts(cls,
+                    counts: Dict[str, Dict[str, int]],
+                    dense_clbits: int = 10) -> 'CountsArray':
+        """Create the counts of experiments from counts dictionaries.
+
+        Args:
+            counts: a dictionary of the counts dictionary of each
+                experiment name.
+            dense_clbits: the maximal number of clbits of an experiment
+                whose counts are stored as a dense vector.
+
+        Returns:
+            The counts of the experiments.
+        """
+        ret = cls(dense_clbits)
+        for name, exp_counts in counts.items():
+            ret.add_counts(name, exp_counts)
+        return ret
+
+    @property
+    def names(self) -> List[str]:
+        """Return the experiment names, in the order they were added."""
+        return list(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __repr__(self):
+        return '{}({} experiments)'.format(type(self).__name__, len(self))
+
+    def add(self,
+            data: Union['CountsArray', Result, List[Result]]) -> List[str]:
+        """Add the counts of results or of another ``CountsArray``.
+
+        Args:
+            data: a result, a ``CountsArray`` or a list of them.
+
+        Returns:
+            The names of the experiments of ``data``.
+        """
+        if isinstance(data, list):
+            names = []
+            for item in data:
+                names += self.add(item)
+            return names
+        if isinstance(data, CountsArray):
+            for name in data.names:
+                self.add_outcomes(name, *data.outcomes(name),
+                                  num_clbits=data.num_clbits(name))
+            return data.names
+        return self.add_result(data)
+
+    def add_result(self, result: Result) -> List[str]:
+        """Add the counts of the experiments of a result.
+
+        Experiments without counts are skipped. If several experiments of
+        the result have the same name, only the first one is added, as in
+        ``Result.get_counts``.
+
+        Args:
+            result: a result.
+
+        Returns:
+            The names of the experiments of the result.
+        """
+        names = []
+        seen = set()
+        for experiment in result.results:
+            name = experiment.header.name
+            if name in seen:
+                continue
+            seen.add(name)
+            names.append(name)
+            counts = getattr(experiment.data, 'counts', None)
+            if counts is None:
+                continue
+            self.add_counts(name, counts,
+                            num_clbits=_header_clbits(experiment.header))
+        return names
+
+    def add_counts(self,
+                   name: str,
+                   counts: Dict[str, int],
+                   num_clbits: Optional[int] = None):
+        """Add the counts dictionary of an experiment.
+
+        Args:
+            name: the experiment name.
+            counts: a counts dictionary, with bitstring (possibly with
+                whitespace between registers) or hexadecimal keys.
+            num_clbits: the number of clbits of the experiment. By default
+                the length of the bitstring keys, or the number of bits of
+                the largest hexadecimal key.
+        """
+        if counts and next(iter(counts)).startswith('0x'):
+            outcomes = [int(key, 16) for key in counts]
+            values = np.array(list(counts.values()))
+            if num_clbits is None:
+                num_clbits = max(outcomes).bit_length()
+        else:
+            if num_clbits is None:
+                num_clbits = len(next(iter(counts)).replace(' ', '')) \
+                    if counts else 0
+            outcomes, values = _counts_to_arrays(counts)
+        self.add_outcomes(name, outcomes, values, num_clbits)
+
+    def add_outcomes(self,
+                     name: str,
+                     outcomes: Union[List[int], np.ndarray],
+                     values: Union[List[int], np.ndarray],
+                     num_clbits: int):
+        """Add the counts of integer outcomes of an experiment.
+
+        Args:
+            name: the experiment name.
+            outcomes: the integer outcomes, with clbit-0 as least significant
+                bit.
+            values: the counts of the outcomes.
+            num_clbits: the number of clbits of the experiment.
+
+        Raises:
+            QiskitError: if the experiment was added with a different
+                number of clbits.
+        """
+        values = np.asarray(values)
+        outcomes = np.asarray(outcomes,
+                              dtype=np.int64 if num_clbits < 64 else object)
+
+        if name in self._index:
+            idx = self._index[name]
+            if self._num_clbits[idx] != num_clbits:
+                raise QiskitError(
+                    'Experiment "{}" has {} clbits, not {}'.format(
+                        name, self._num_clbits[idx], num_clbits))
+            old = self._counts[idx]
+            if isinstance(old, np.ndarray):
+                dense = old.astype(np.result_type(old, values))
+                np.add.at(dense, outcomes, values)
+                self._counts[idx] = dense
+                return
+            outcomes = np.concatenate([old[0], outcomes])
+            values = np.concatenate([old[1], values])
+        else:
+            idx = len(self._names)
+            self._index[name] = idx
+            self._names.append(name)
+            self._num_clbits.append(num_clbits)
+            self._counts.append(None)
+
+        if num_clbits <= self._dense_clbits:
+            dense = np.zeros(2 ** num_clbits, dtype=values.dtype)
+            np.add.at(dense, outcomes, values)
+            self._counts[idx] = dense
+        else:
+            unique, inverse = np.unique(outcomes, return_inverse=True)
+            summed = np.zeros(len(unique), dtype=values.dtype)
+            np.add.at(summed, inverse.reshape(-1), values)
+            self._counts[idx] = (unique, summed)
+
+    def _get(self, experiment):
+        """Return the index of an experiment."""
+        if isinstance(experiment, QuantumCircuit):
+            experiment = experiment.name
+        if isinstance(experiment, (int, np.integer)) \
+                and not isinstance(experiment, bool):
+            if 0 <= experiment < len(self._names):
+                return int(experiment)
+        elif experiment in self._index:
+            return self._index[experiment]
+        raise QiskitError('No counts for experiment "{}"'.format(experiment))
+
+    def num_clbits(self,
+                   experiment: Union[str, int, QuantumCircuit]) -> int:
+        """Return the number of clbits of an experiment.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+
+        Returns:
+            The number of clbits.
+        """
+        return self._num_clbits[self._get(experiment)]
+
+    def shots(self,
+              experiment: Union[str, int, QuantumCircuit]
+              ) -> Union[int, float]:
+        """Return the total counts of an experiment.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+
+        Returns:
+            The sum of the counts.
+        """
+        counts = self._counts[self._get(experiment)]
+        if isinstance(counts, np.ndarray):
+            return counts.sum().item()
+        return counts[1].sum().item()
+
+    def outcomes(self, experiment: Union[str, int, QuantumCircuit]):
+        """Return the observed outcomes of an experiment and their counts.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+
+        Returns:
+            tuple: (outcomes, values) arrays of the sorted outcomes with a
+            nonzero count and of their counts.
+        """
+        counts = self._counts[self._get(experiment)]
+        if isinstance(counts, np.ndarray):
+            outcomes = np.flatnonzero(counts)
+            return outcomes, counts[outcomes]
+        nonzero = counts[1] != 0
+        return counts[0][nonzero], counts[1][nonzero]
+
+    def marginal(self,
+                 experiment: Union[str, int, QuantumCircuit],
+                 qubits: Optional[List[int]] = None) -> np.ndarray:
+        """Return the dense marginal counts of an experiment.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+            qubits: the clbits to NOT be marginalized over. By default
+                all the clbits of the experiment.
+
+        Returns:
+            The array of the ``2 ** len(qubits)`` marginal counts, where the
+            bit ``j`` of the index is the outcome of ``qubits[j]``.
+        """
+        idx = self._get(experiment)
+        num_clbits = self._num_clbits[idx]
+        counts = self._counts[idx]
+        if qubits is None:
+            qubits = range(num_clbits)
+        qubits = [int(qubit) for qubit in qubits]
+        if not isinstance(counts, np.ndarray):
+            return _marginalize(counts[0], counts[1], qubits)
+        if qubits == list(range(num_clbits)):
+            return counts.copy()
+        # Axis i of the reshaped counts is the outcome of clbit
+        # num_clbits - 1 - i
+        axes = [num_clbits - 1 - qubit for qubit in reversed(qubits)]
+        summed = counts.reshape([2] * num_clbits).sum(
+            axis=tuple(set(range(num_clbits)) - set(axes)))
+        # The remaining axes are in ascending order
+        perm = np.argsort(np.argsort(axes))
+        return np.transpose(summed, perm).reshape(-1)
+
+    def probabilities(self,
+                      experiment: Union[str, int, QuantumCircuit],
+                      qubits: Optional[List[int]] = None) -> np.ndarray:
+        """Return the marginal probabilities of an experiment.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+            qubits: the clbits to NOT be marginalized over. By default
+                all the clbits of the experiment.
+
+        Returns:
+            The marginal counts (see :meth:`marginal`) divided by the
+            number of shots.
+        """
+        return self.marginal(experiment, qubits) / self.shots(experiment)
+
+    def get_counts(self,
+                   experiment: Union[str, int, QuantumCircuit],
+                   qubits: Optional[List[int]] = None) -> Dict[str, int]:
+        """Return the counts dictionary of an experiment.
+
+        The keys have no whitespace between registers, as the keys
+        returned by :func:`~qiskit.ignis.verification.marginal_counts`.
+
+        Args:
+            experiment: the experiment name, index or circuit.
+            qubits: the clbits to NOT be marginalized over. By default
+                all the clbits of the experiment.
+
+        Returns:
+            The counts dictionary of the observed outcomes.
+        """
+        if qubits is None:
+            num_bits = self.num_clbits(experiment)
+            outcomes, values = self.outcomes(experiment)
+        else:
+            num_bits = len(qubits)
+            values = self.marginal(experiment, qubits)
+            outcomes = np.flatnonzero(values)
+            values = values[outcomes]
+        return {bin(outcome)[2:].zfill(num_bits): value
+                for outcome, value in zip(outcomes.tolist(), values.tolist())}
+
+
+def _header_clbits(header):
+    """Return the number of clbits of an experiment header."""
+    num_clbits = getattr(header, 'memory_slots', None)
+    if num_clbits is None and getattr(header, 'creg_sizes', None):
+        num_clbits = sum(size for _, size in header.creg_sizes)
+    return num_clbits
+
+
+def _counts_to_arrays(counts: Dict[str, int]):
+    """Parse the keys of a counts dictionary into integer outcomes.
+
+    Args:
+        counts: a counts dictionary.
+
+    Returns:
+        tuple: (outcomes, values) arrays of the outcomes (with qubit-0 as
+        least significant bit) and of their counts. The outcomes are
+        ``int64`` if they fit in 63 bits, otherwise Python integers.
+    """
+    keys = [key.replace(' ', '') for key in counts]
+    values = np.array(list(counts.values()))
+    if keys and len(keys[0]) < 64:
+        outcomes = np.array([int(key, 2) for key in keys], dtype=np.int64)
+    else:
+        outcomes = np.array([int(key, 2) for key in keys], dtype=object)
+    return outcomes, values
+
+
+def _marginalize(outcomes: np.ndarray,
+                 values: np.ndarray,
+                 qubits: List[int]
+                 ) -> np.ndarray:
+    """Sum the counts of the outcomes over all but the given qubits.
+
+    Args:
+        outcomes: the integer outcomes.
+        values: the counts of the outcomes.
+        qubits: the measured qubits.
+
+    Returns:
+        The array of the ``2 ** len(qubits)`` marginal counts, where the
+        bit ``j`` of the index is the outcome of ``qubits[j]``.
+    """
+    index = np.zeros(len(outcomes), dtype=np.int64)
+    for bit, qubit in enumerate(qubits):
+        index |= ((outcomes >> int(qubit)) & 1).astype(np.int64) << bit
+    if values.dtype.kind in 'iu':
+        ret = np.zeros(2 ** len(qubits), dtype=values.dtype)
+        np.add.at(ret, index, values)
+        return ret
+    return np.bincount(index, weights=values, minlength=2 ** len(qubits))
@@ -25,6 +25,7 @@ import numpy as np
 from qiskit import QiskitError
 from qiskit.result import Result
 from .filters import MeasurementFilter, TensoredFilter
+from ...counts_array import CountsArray
 from ...verification.tomography import count_keys
 
 try:
@@ -40,7 +41,7 @@ class CompleteMeasFitter:
     """
 
     def __init__(self,
-                 results: Union[Result, List[Result]],
+                 results: Union[Result, CountsArray, List[Result]],
                  state_labels: List[str],
                  qubit_list: List[int] = None,
                  circlabel: str = ''):
@@ -106,8 +107,8 @@ class CompleteMeasFitter:
         Add measurement calibration data
 
         Args:
-            new_results (list or qiskit.result.Result): a single result or list
-                of result objects.
+            new_results (list or qiskit.result.Result or CountsArray): a
+                single result or list of result objects.
             rebuild_cal_matrix (bool): rebuild the calibration matrix
         """
 
@@ -226,7 +227,7 @@ class TensoredMeasFitter():
     """
 
     def __init__(self,
-                 results: Union[Result, List[Result]],
+                 results: Union[Result, CountsArray, List[Result]],
                  mit_pattern: List[List[int]],
                  substate_labels_list: List[List[str]] = None,
                  circlabel: str = ''):
@@ -255,6 +256,7 @@ class TensoredMeasFitter():
         """
 
         self._result_list = []
+        self._counts = CountsArray()
         self._cal_matrices = None
         self._circlabel = circlabel
 
@@ -309,8 +311,8 @@ class TensoredMeasFitter():
         Add measurement calibration data
 
         Args:
-            new_results (list or qiskit.result.Result): a single result or list
-                of Result objects.
+            new_results (list or qiskit.result.Result or CountsArray): a
+                single result or list of Result objects.
             rebuild_cal_matrix (bool): rebuild the calibration matrix
         """
 
@@ -322,6 +324,7 @@ class TensoredMeasFitter():
 
         for result in new_results:
             self._result_list.append(result)
+            self._counts.add(result)
 
         if rebuild_cal_matrix:
             self._build_calibration_matrices()
@@ -398,39 +401,45 @@ class TensoredMeasFitter():
             self._cal_matrices.append(np.zeros([2**list_size, 2**list_size],
                                                dtype=float))
 
+        # the index of each integer substate outcome
+        outcome_indices = [{int(label, 2): ind for label, ind in indices.items()}
+                           for indices in self._indices_list]
+
         # go through for each calibration experiment
-        for result in self._result_list:
-            for experiment in result.results:
-                circ_name = experiment.header.name
-                # extract the state from the circuit name
-                # this was the prepared state
-                circ_search = re.search('(?<=' + self._circlabel + 'cal_)\\w+',
-                                        circ_name)
-
-                # this experiment is not one of the calcs so skip
-                if circ_search is None:
-                    continue
-
-                state = circ_search.group(0)
-
-                # get the counts from the result
-                state_cnts = result.get_counts(circ_name)
-                for measured_state, counts in state_cnts.items():
-                    end_index = self.nqubits
-                    for cal_ind, cal_mat in enumerate(self._cal_matrices):
-
-                        start_index = end_index - \
-                            self._qubit_list_sizes[cal_ind]
-
-                        substate_index = self._indices_list[cal_ind][
-                            state[start_index:end_index]]
-                        measured_substate_index = \
-                            self._indices_list[cal_ind][
-                                measured_state[start_index:end_index]]
-                        end_index = start_index
-
-                        cal_mat[measured_substate_index][substate_index] += \
-                            counts
+        for circ_name in self._counts:
+            # extract the state from the circuit name
+            # this was the prepared state
+            circ_search = re.search('(?<=' + self._circlabel + 'cal_)\\w+',
+                                    circ_name)
+
+            # this experiment is not one of the calcs so skip
+            if circ_search is None:
+                continue
+
+            state = circ_search.group(0)
+
+            # get the counts from the result
+            outcomes, values = self._counts.outcomes(circ_name)
+            num_clbits = self._counts.num_clbits(circ_name)
+            end_index = self.nqubits
+            for cal_ind, cal_mat in enumerate(self._cal_matrices):
+
+                start_index = end_index - self._qubit_list_sizes[cal_ind]
+
+                substate_index = self._indices_list[cal_ind][
+                    state[start_index:end_index]]
+                # the bits of the measured bitstring from start_index
+                # to end_index
+                measured_substates = \
+                    (outcomes >> (num_clbits - end_index)) & \
+                    ((1 << self._qubit_list_sizes[cal_ind]) - 1)
+                measured_substate_indices = [
+                    outcome_indices[cal_ind][substate]
+                    for substate in measured_substates.tolist()]
+                end_index = start_index
+
+                np.add.at(cal_mat, (measured_substate_indices, substate_index),
+                          values)
 
         for mat_index, _ in enumerate(self._cal_matrices):
             sums_of_columns = np.sum(self._cal_matrices[mat_index], axis=0)
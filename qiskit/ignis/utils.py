@@ -14,6 +14,8 @@
 
 """Utility functions"""
 
+import numpy as np
+
 
 def build_counts_dict_from_list(count_list):
     """
@@ -35,3 +37,29 @@ def build_counts_dict_from_list(count_list):
             new_count_dict[item] = countdict[item]+new_count_dict.get(item, 0)
 
     return new_count_dict
+
+
+def walsh_hadamard(vec):
+    """
+    Return the Walsh-Hadamard transform of the last axis of an array.
+
+    Entry i of the transform of a vector v of length 2^n is
+    sum_j (-1)^popcount(i & j) v[j], the expectation value of the
+    Z-correlator i for the probability vector v.
+
+    Parameters:
+        vec (array): array whose last axis has a length of a power of 2.
+
+    Returns:
+        numpy.ndarray: the transform, of the shape of vec.
+    """
+    vec = np.asarray(vec, dtype=float)
+    shape = vec.shape
+    half = 1
+    while half < shape[-1]:
+        # butterflies on bit log2(half) of the index
+        vec = vec.reshape(shape[:-1] + (-1, 2, half))
+        vec = np.stack((vec[..., 0, :] + vec[..., 1, :],
+                        vec[..., 0, :] - vec[..., 1, :]), axis=-2)
+        half *= 2
+    return vec.reshape(shape)
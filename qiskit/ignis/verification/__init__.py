@@ -39,21 +39,30 @@ as well as performing interleaved RB, purity RB and RB on the non-Clifford CNOT-
    :toctree: ../stubs/
 
    randomized_benchmarking_seq
+   randomized_benchmarking_seq_iter
    RBFitter
    InterleavedRBFitter
    PurityRBFitter
    CNOTDihedralRBFitter
    BasicUtils
    Clifford
+   PackedClifford
    CliffordUtils
+   CliffordGroup
    CNOTDihedral
    DihedralUtils
+   clear_group_tables
+   tables_dir
+   BinaryGroupTable
+   convert_pickled_table
    count_gates
    gates_per_clifford
+   expected_gates_per_clifford
    calculate_1q_epg
    calculate_2q_epg
    calculate_1q_epc
    calculate_2q_epc
+   calculate_device_epgs
    coherence_limit
    twoQ_clifford_error
 
@@ -71,6 +80,7 @@ Tomography
    ProcessTomographyFitter
    TomographyFitter
    marginal_counts
+   marginal_counts_array
    combine_counts
    expectation_counts
    count_keys
@@ -101,15 +111,22 @@ Accreditation
 
 """
 from .quantum_volume import qv_circuits, QVFitter
-from .randomized_benchmarking import (Clifford, BasicUtils, CliffordUtils,
+from .randomized_benchmarking import (Clifford, PackedClifford,
+                                      BasicUtils, CliffordUtils,
+                                      CliffordGroup,
                                       CNOTDihedral, DihedralUtils,
+                                      clear_group_tables, tables_dir,
+                                      BinaryGroupTable, convert_pickled_table,
                                       randomized_benchmarking_seq,
+                                      randomized_benchmarking_seq_iter,
                                       RBFitter, InterleavedRBFitter,
                                       PurityRBFitter, CNOTDihedralRBFitter,
                                       count_gates, gates_per_clifford,
+                                      expected_gates_per_clifford,
                                       coherence_limit, twoQ_clifford_error,
                                       calculate_1q_epg, calculate_2q_epg,
-                                      calculate_1q_epc, calculate_2q_epc)
+                                      calculate_1q_epc, calculate_2q_epc,
+                                      calculate_device_epgs)
 from .topological_codes import (RepetitionCode, GraphDecoder,
                                 lookuptable_decoding,
                                 postselection_decoding)
@@ -118,6 +135,7 @@ from .tomography import (state_tomography_circuits,
                          StateTomographyFitter,
                          ProcessTomographyFitter,
                          TomographyFitter,
-                         marginal_counts, combine_counts,
+                         marginal_counts, marginal_counts_array,
+                         combine_counts,
                          expectation_counts, count_keys)
 from .accreditation import AccreditationCircuits, AccreditationFitter, QOTP, QOTPCorrectCounts
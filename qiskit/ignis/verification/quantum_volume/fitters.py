@@ -22,7 +22,7 @@ randomized model circuits", arXiv:1811.12926
 import math
 import numpy as np
 from qiskit import QiskitError
-from ...utils import build_counts_dict_from_list
+from ...counts_array import CountsArray
 
 try:
     from matplotlib import pyplot as plt
@@ -49,6 +49,7 @@ class QVFitter:
         self._ntrials = 0
 
         self._result_list = []
+        self._counts = CountsArray()
         self._heavy_output_counts = {}
         self._circ_shots = {}
         self._heavy_output_prob_ideal = {}
@@ -147,6 +148,7 @@ class QVFitter:
 
         Args:
             new_backend_result (list): list of qv results
+                (qiskit.Result or CountsArray)
             rerun_fit (bool): re calculate the means and fit the result
 
         Raises:
@@ -168,12 +170,12 @@ class QVFitter:
 
             # update the number of trials *if* new ones
             # added.
-            for qvcirc in result.results:
-                ntrials_circ = int(qvcirc.header.name.split('_')[-1])
+            for circ_name in self._counts.add(result):
+                ntrials_circ = int(circ_name.split('_')[-1])
                 if (ntrials_circ+1) > self._ntrials:
                     self._ntrials = ntrials_circ+1
 
-                if qvcirc.header.name not in self._heavy_output_prob_ideal:
+                if circ_name not in self._heavy_output_prob_ideal:
                     raise QiskitError('Ideal distribution '
                                       'must be loaded first')
 
@@ -192,30 +194,23 @@ class QVFitter:
             the output of circuits generated by qv_circuits,
         """
 
-        circ_counts = {}
         for trialidx in range(self._ntrials):
             for _, depth in enumerate(self._depths):
                 circ_name = 'qv_depth_%d_trial_%d' % (depth, trialidx)
 
-                # get the counts form ALL executed circuits
-                count_list = []
-                for result in self._result_list:
-                    try:
-                        count_list.append(result.get_counts(circ_name))
-                    except (QiskitError, KeyError):
-                        pass
-
-                circ_counts[circ_name] = \
-                    build_counts_dict_from_list(count_list)
-
-                self._circ_shots[circ_name] = \
-                    sum(circ_counts[circ_name].values())
+                # the counts from ALL executed circuits
+                if circ_name not in self._counts:
+                    self._circ_shots[circ_name] = 0
+                    self._heavy_output_counts[circ_name] = 0
+                    continue
+                circ_counts = self._counts.marginal(circ_name)
+                self._circ_shots[circ_name] = circ_counts.sum().item()
 
                 # calculate the heavy output probability
+                heavy_outputs = [int(output, 2) for output in
+                                 self._heavy_outputs[circ_name]]
                 self._heavy_output_counts[circ_name] = \
-                    self._subset_probability(
-                        self._heavy_outputs[circ_name],
-                        circ_counts[circ_name])
+                    circ_counts[heavy_outputs].sum().item()
 
     def calc_statistics(self):
         """
@@ -219,16 +219,7 @@ class Clifford:
         Returns:
             int: A unique index (integer) for the Clifford object.
         """
-        mat = self.table
-        mat = mat.reshape(mat.size)
-        ret = int(0)
-        for bit in mat:
-            ret = (ret << 1) | int(bit)
-        mat = self.phases
-        mat = mat.reshape(mat.size)
-        for bit in mat:
-            ret = (ret << 1) | int(bit)
-        return ret
+        return _bits_to_int(self.table, self.phases)
 
     # ---------------------------------------------------------------------
     # Canonical gate operations
@@ -236,57 +227,61 @@ class Clifford:
 
     # NOTE: These might change based on changes to QuantumCircuit API.
     # They should mimic the circuit API as much as possible.
+    # The gates only index the last axis of the table, so they can also
+    # be applied to a stack of tables of the same shape.
     def x(self, qubit):
         """Apply a Pauli "x" gate to a qubit."""
-        self._phases = np.logical_xor(self._phases, self._table[:, qubit])
+        self._phases = np.logical_xor(self._phases, self._table[..., qubit])
 
     def y(self, qubit):
         """Apply an Pauli "y" gate to a qubit."""
         iz, ix = qubit, self._num_qubits + qubit
-        zx_xor = np.logical_xor(self._table[:, iz], self._table[:, ix])
+        zx_xor = np.logical_xor(self._table[..., iz], self._table[..., ix])
         self._phases = np.logical_xor(self._phases, zx_xor)
 
     def z(self, qubit):
         """Apply an Pauli "z" gate to qubit."""
         ix = self._num_qubits + qubit
-        self._phases = np.logical_xor(self._phases, self._table[:, ix])
+        self._phases = np.logical_xor(self._phases, self._table[..., ix])
 
     def h(self, qubit):
         """Apply an Hadamard "h" gate to qubit."""
         iz, ix = qubit, self._num_qubits + qubit
-        zx_and = np.logical_and(self._table[:, ix], self._table[:, iz])
+        zx_and = np.logical_and(self._table[..., ix], self._table[..., iz])
         self._phases = np.logical_xor(self._phases, zx_and)
         # Cache X column for qubit
-        x_cache = self._table[:, ix].copy()
+        x_cache = self._table[..., ix].copy()
         # Swap X and Z columns for qubit
-        self._table[:, ix] = self._table[:, iz]  # Does this need to be a copy?
-        self._table[:, iz] = x_cache
+        self._table[..., ix] = self._table[..., iz]  # Does this need to be a copy?
+        self._table[..., iz] = x_cache
 
     def s(self, qubit):
         """Apply a phase "s" gate to qubit."""
         iz, ix = qubit, self._num_qubits + qubit
-        zx_and = np.logical_and(self._table[:, ix], self._table[:, iz])
+        zx_and = np.logical_and(self._table[..., ix], self._table[..., iz])
         self._phases = np.logical_xor(self._phases, zx_and)
-        self._table[:, iz] = np.logical_xor(self._table[:, ix],
-                                            self._table[:, iz])
+        self._table[..., iz] = np.logical_xor(self._table[..., ix],
+                                              self._table[..., iz])
 
     def sdg(self, qubit):
         """Apply an adjoint phase "sdg" gate to qubit."""
-        # TODO: change direct table update if more efficient
-        self.z(qubit)
-        self.s(qubit)
+        iz, ix = qubit, self._num_qubits + qubit
+        self._phases ^= self._table[..., ix] & ~self._table[..., iz]
+        self._table[..., iz] ^= self._table[..., ix]
 
     def v(self, qubit):
         """Apply v gate v = sdg.h ."""
-        # TODO: change direct table update if more efficient
-        self.sdg(qubit)
-        self.h(qubit)
+        iz, ix = qubit, self._num_qubits + qubit
+        # (z, x) -> (x, z ^ x), the phases are unchanged
+        self._table[..., ix] ^= self._table[..., iz]
+        self._table[..., iz] ^= self._table[..., ix]
 
     def w(self, qubit):
         """Apply w gate w = v.v ."""
-        # TODO: change direct table update if more efficient
-        self.h(qubit)
-        self.s(qubit)
+        iz, ix = qubit, self._num_qubits + qubit
+        # (z, x) -> (z ^ x, z), the phases are unchanged
+        self._table[..., iz] ^= self._table[..., ix]
+        self._table[..., ix] ^= self._table[..., iz]
 
     def cx(self, qubit_ctrl, qubit_trgt):
         """Apply a Controlled-NOT "cx" gate."""
@@ -294,27 +289,52 @@ class Clifford:
         iz_c, ix_c = qubit_ctrl, self.num_qubits + qubit_ctrl
         iz_t, ix_t = qubit_trgt, self.num_qubits + qubit_trgt
         # Compute phase
-        tmp = np.logical_xor(self._table[:, ix_t], self._table[:, iz_c])
+        tmp = np.logical_xor(self._table[..., ix_t], self._table[..., iz_c])
         tmp = np.logical_xor(1, tmp)  # Shelly: fixed misprint in logical
-        tmp = np.logical_and(self._table[:, iz_t], tmp)
-        tmp = np.logical_and(self._table[:, ix_c], tmp)
+        tmp = np.logical_and(self._table[..., iz_t], tmp)
+        tmp = np.logical_and(self._table[..., ix_c], tmp)
         self._phases ^= tmp
         # Update stabilizers
-        self._table[:, ix_t] = np.logical_xor(self._table[:, ix_t],
-                                              self._table[:, ix_c])
-        self._table[:, iz_c] = np.logical_xor(self._table[:, iz_t],
-                                              self._table[:, iz_c])
+        self._table[..., ix_t] ^= self._table[..., ix_c]
+        self._table[..., iz_c] ^= self._table[..., iz_t]
 
     def cz(self, qubit_ctrl, qubit_trgt):
         """Apply a Controlled-z "cz" gate."""
-        # TODO: change direct table update if more efficient
-        self.h(qubit_trgt)
-        self.cx(qubit_ctrl, qubit_trgt)
-        self.h(qubit_trgt)
+        iz_c, ix_c = qubit_ctrl, self.num_qubits + qubit_ctrl
+        iz_t, ix_t = qubit_trgt, self.num_qubits + qubit_trgt
+        self._phases ^= (self._table[..., ix_c] & self._table[..., ix_t] &
+                         (self._table[..., iz_c] ^ self._table[..., iz_t]))
+        self._table[..., iz_c] ^= self._table[..., ix_t]
+        self._table[..., iz_t] ^= self._table[..., ix_c]
 
     def swap(self, qubit0, qubit1):
         """Apply SWAP gate between two qubits."""
-        # TODO: change direct swap of required rows and cols in table
-        self.cx(qubit0, qubit1)
-        self.cx(qubit1, qubit0)
-        self.cx(qubit0, qubit1)
+        num_qubits = self.num_qubits
+        cols0 = [qubit0, num_qubits + qubit0]
+        cols1 = [qubit1, num_qubits + qubit1]
+        self._table[..., cols0 + cols1] = self._table[..., cols1 + cols0]
+
+
+class _CliffordStack(Clifford):
+    """A stack of Clifford tables that are updated together.
+
+    The table may also hold any number of rows of a single tableau,
+    e.g. to apply gates to a few Pauli rows only.
+    """
+
+    def __init__(self, table, phases):
+        super().__init__()
+        self._num_qubits = table.shape[-1] // 2
+        self._table = table
+        self._phases = phases
+
+
+def _bits_to_int(table, phases):
+    """Pack a symplectic table and phases into a single integer.
+
+    The table is read in row-major order followed by the phases,
+    with the first bit being the most significant one.
+    """
+    bits = np.concatenate((np.ravel(table), np.ravel(phases))).astype(bool)
+    pad = (-bits.size) % 8
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big') >> pad
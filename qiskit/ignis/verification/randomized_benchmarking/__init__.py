@@ -19,13 +19,19 @@ Randomized Benchmarking module
 
 # Randomized Benchmarking functions
 from .Clifford import Clifford
+from .packed_clifford import PackedClifford
 from .basic_utils import BasicUtils
 from .clifford_utils import CliffordUtils
+from .clifford_group import CliffordGroup
 from .dihedral import CNOTDihedral
 from .dihedral_utils import DihedralUtils
-from .circuits import randomized_benchmarking_seq
+from .group_tables import clear_group_tables, tables_dir
+from .binary_tables import BinaryGroupTable, convert_pickled_table
+from .circuits import randomized_benchmarking_seq, randomized_benchmarking_seq_iter
 from .fitters import (RBFitter, InterleavedRBFitter, PurityRBFitter,
                       CNOTDihedralRBFitter)
 from .rb_utils import (count_gates, gates_per_clifford,
+                       expected_gates_per_clifford,
                        coherence_limit, twoQ_clifford_error,
-                       calculate_1q_epg, calculate_2q_epg, calculate_1q_epc, calculate_2q_epc)
+                       calculate_1q_epg, calculate_2q_epg, calculate_1q_epc, calculate_2q_epc,
+                       calculate_device_epgs)
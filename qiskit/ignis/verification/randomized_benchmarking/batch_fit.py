@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Batched fitting of RB decay curves
+"""
+
+import warnings
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+
+def decay_fit_guess(xdata, ydata, b_guess):
+    """Closed form guess for the fit of ``a * alpha ** x + b``.
+
+    Fits ``log(y - b_guess)`` to a line in ``x``, for all the curves at once.
+
+    Args:
+        xdata (array): (curves, points) the x values of each curve.
+        ydata (array): (curves, points) the y values of each curve,
+            ``nan`` values are ignored.
+        b_guess (array): (curves,) the guess of the asymptote of each curve.
+
+    Returns:
+        numpy.ndarray: (curves, 3) the guess values ``[a, alpha, b]``,
+        strictly inside the ``[0, 1]`` bounds.
+    """
+    xdata = np.asarray(xdata, dtype=float)
+    ydata = np.asarray(ydata, dtype=float)
+    b_guess = np.asarray(b_guess, dtype=float)
+
+    diff = ydata - b_guess[:, None]
+    valid = np.isfinite(diff) & (diff > 0)
+    weights = valid.astype(float)
+    logs = np.log(np.where(valid, diff, 1))
+
+    # weighted least squares line through (x, log(y - b)) per curve
+    npoints = weights.sum(1)
+    xmean = (weights * xdata).sum(1) / np.maximum(npoints, 1)
+    ymean = (weights * logs).sum(1) / np.maximum(npoints, 1)
+    dx = np.where(valid, xdata - xmean[:, None], 0)
+    sxx = (dx ** 2).sum(1)
+    sxy = (dx * (logs - ymean[:, None])).sum(1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where((npoints > 1) & (sxx > 0), sxy / sxx, np.nan)
+    intercept = ymean - slope * xmean
+
+    eps = 1e-6
+    alpha = np.where(np.isfinite(slope), np.exp(slope), 0.99)
+    amp = np.where(np.isfinite(intercept), np.exp(intercept), 0.95)
+    return np.stack([np.clip(amp, eps, 1 - eps),
+                     np.clip(alpha, eps, 1 - eps),
+                     np.clip(b_guess, eps, 1 - eps)], axis=1)
+
+
+def fit_decays(xdata, ydata, sigma=None, p0=None, max_iter=200,
+               tol=1e-10):
+    """Fit a batch of curves to ``a * alpha ** x + b`` at once.
+
+    Runs a Levenberg-Marquardt least squares fit of all the curves
+    together, with the parameters kept in the ``[0, 1]`` bounds.
+    The covariances are calculated as :func:`scipy.optimize.curve_fit`
+    does with ``absolute_sigma=False``.
+
+    Args:
+        xdata (array): (curves, points) the x values of each curve.
+        ydata (array): (curves, points) the y values of each curve,
+            ``nan`` values are ignored (e.g. to pad curves of fewer points).
+        sigma (array): (curves, points) the std of the y values, or ``None``
+            for an unweighted fit. Rows with a ``nan`` are fit unweighted.
+        p0 (array): (curves, 3) the guess values ``[a, alpha, b]``.
+            By default use :func:`decay_fit_guess` with ``b = 0``.
+        max_iter (int): the maximal number of iterations.
+        tol (float): the fit converges when a step changes the cost or
+            the parameters by less than this relative tolerance
+            (as ``ftol`` and ``xtol`` of :func:`scipy.optimize.curve_fit`).
+
+    Returns:
+        tuple: ``(params, pcov, success)`` arrays of shapes (curves, 3),
+        (curves, 3, 3) and (curves,). ``success`` is ``False`` for the
+        curves whose fit did not converge to a minimum inside the bounds,
+        or whose covariance cannot be estimated; these should be refit
+        with :func:`scipy.optimize.curve_fit`.
+    """
+    xdata = np.asarray(xdata, dtype=float)
+    ydata = np.asarray(ydata, dtype=float)
+    ncurves = ydata.shape[0]
+    mask = np.isfinite(ydata)
+
+    if sigma is None:
+        weights = np.ones_like(ydata)
+    else:
+        sigma = np.asarray(sigma, dtype=float)
+        with np.errstate(divide='ignore'):
+            weights = 1 / sigma
+        weighted = np.all(np.isfinite(weights) | ~mask, axis=1)
+        weights[~weighted] = 1
+    weights = np.where(mask, weights, 0)
+    ydata = np.where(mask, ydata, 0)
+    npoints = mask.sum(1)
+
+    if p0 is None:
+        p0 = decay_fit_guess(xdata, np.where(mask, ydata, np.nan),
+                             np.zeros(ncurves))
+    params = np.clip(np.array(p0, dtype=float), 0, 1)
+
+    converged = np.zeros(ncurves, dtype=bool)
+    eye = np.eye(3)
+
+    # the curves that are still fit, compacted as they converge
+    rows = np.arange(ncurves)
+    xrows, wrows, yrows = xdata, weights, ydata
+    par = params.copy()
+    res = _decay_residuals(par, xrows, wrows, yrows)
+    cost = (res ** 2).sum(1)
+    damping = np.full(ncurves, 1e-3)
+
+    for _ in range(max_iter):
+        if rows.size == 0:
+            break
+        jac = _decay_jacobian(par, xrows, wrows)
+        jtj = np.swapaxes(jac, 1, 2) @ jac
+        grad = (res[:, None, :] @ jac)[:, 0]
+        # keep the parameters at a bound that the step would cross fixed
+        free = ~(((par <= 0) & (grad > 0)) | ((par >= 1) & (grad < 0)))
+        grad = grad * free
+        jtj = jtj * free[:, :, None] * free[:, None, :]
+        diag = np.einsum('cii->ci', jtj) + 1e-300
+        lhs = jtj + damping[:, None, None] * diag[..., None] * eye
+        try:
+            step = -np.linalg.solve(lhs, grad[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            step = -np.einsum('cij,cj->ci', np.linalg.pinv(lhs), grad)
+
+        new_par = _decay_linear_params(np.clip(par + step, 0, 1),
+                                       xrows, wrows, yrows)
+        new_res = _decay_residuals(new_par, xrows, wrows, yrows)
+        new_cost = (new_res ** 2).sum(1)
+        improved = new_cost < cost
+
+        # converged when an accepted step no longer changes the fit,
+        # or when no step can decrease the cost any further
+        small = ((cost - new_cost <= tol * cost) |
+                 np.all(np.abs(new_par - par) <=
+                        tol * (np.abs(par) + tol), axis=1))
+        done = (improved & small) | (~improved & (damping > 1e12))
+
+        par[improved] = new_par[improved]
+        res[improved] = new_res[improved]
+        cost[improved] = new_cost[improved]
+        damping = np.where(improved, damping / 10, damping * 10)
+
+        if done.any():
+            params[rows] = par
+            converged[rows[done]] = True
+            keep = ~done
+            rows, xrows, wrows, yrows = \
+                rows[keep], xrows[keep], wrows[keep], yrows[keep]
+            par, res, cost, damping = \
+                par[keep], res[keep], cost[keep], damping[keep]
+    params[rows] = par
+
+    jac = _decay_jacobian(params, xdata, weights)
+    jtj = np.swapaxes(jac, 1, 2) @ jac
+    cost = (_decay_residuals(params, xdata, weights, ydata) ** 2).sum(1)
+    dof = npoints - 3
+    success = converged & (dof > 0) & np.all(np.isfinite(params), axis=1)
+    # the bounds are active: leave the fit to curve_fit
+    success &= np.all((params > 1e-8) & (params < 1 - 1e-8), axis=1)
+    eigs = np.linalg.eigvalsh(np.where(np.isfinite(jtj), jtj, 0))
+    success &= eigs[:, 0] > np.finfo(float).eps * eigs[:, -1]
+
+    pcov = np.full((ncurves, 3, 3), np.inf)
+    if success.any():
+        pcov[success] = np.linalg.inv(jtj[success]) * \
+            (cost[success] / dof[success])[:, None, None]
+
+    return params, pcov, success
+
+
+def _decay_residuals(par, xdata, weights, ydata):
+    """Weighted residuals of ``a * alpha ** x + b``."""
+    return weights * (par[:, 0:1] * par[:, 1:2] ** xdata +
+                      par[:, 2:3] - ydata)
+
+
+def _decay_jacobian(par, xdata, weights):
+    """Weighted jacobian of ``a * alpha ** x + b`` in ``[a, alpha, b]``."""
+    power = par[:, 1:2] ** xdata
+    with np.errstate(divide='ignore', invalid='ignore'):
+        dalpha = np.where(xdata > 0,
+                          par[:, 0:1] * xdata * par[:, 1:2] ** (xdata - 1), 0)
+    return weights[..., None] * np.stack(
+        [power, dalpha, np.ones_like(power)], axis=-1)
+
+
+def _decay_linear_params(par, xdata, weights, ydata):
+    """Replace ``a`` and ``b`` with their least squares values for ``alpha``.
+
+    The model is linear in ``a`` and ``b``, so they are solved exactly
+    (and clipped to the bounds) for the current ``alpha``.
+    """
+    basis = weights * par[:, 1:2] ** xdata
+    target = weights * ydata
+    uu = (basis * basis).sum(1)
+    uv = (basis * weights).sum(1)
+    vv = (weights * weights).sum(1)
+    uy = (basis * target).sum(1)
+    vy = (weights * target).sum(1)
+    det = uu * vv - uv ** 2
+    solvable = det > 1e-12 * uu * vv
+    det = np.where(solvable, det, 1)
+    par = par.copy()
+    par[:, 0] = np.where(solvable, (vv * uy - uv * vy) / det, par[:, 0])
+    par[:, 2] = np.where(solvable, (uu * vy - uv * uy) / det, par[:, 2])
+    return np.clip(par, 0, 1)
+
+
+def bootstrap_decays(resamples, entropy, xdata, probs, shots, p0,
+                     resample_seeds=True, resample_shots=True):
+    """Fit bootstrap resamples of RB data.
+
+    Resample ``i`` is drawn from an independent ``numpy.random.Generator``
+    spawned from the root seed ``entropy`` with the spawn key ``i``, so it
+    does not depend on which process fits it.
+
+    Args:
+        resamples (list): the indices of the resamples to fit.
+        entropy (int): the entropy of the root ``numpy.random.SeedSequence``.
+        xdata (array): (patterns, lengths) the lengths of each pattern.
+        probs (array): (patterns, seeds, lengths) the measured probabilities,
+            ``nan`` for missing circuits.
+        shots (array): (seeds, lengths) the number of shots of each circuit.
+        p0 (array): (patterns, 3) the guess values of the fits.
+        resample_seeds (bool): resample the seeds with replacement.
+        resample_shots (bool): resample the shots of each circuit from
+            a binomial distribution with the measured probability.
+
+    Returns:
+        numpy.ndarray: (resamples, patterns, 3) the fit parameters. The
+        resamples whose batched fit fails are refit with
+        :func:`scipy.optimize.curve_fit`, and their parameters are ``nan``
+        if this fit fails too.
+    """
+    npatt, nseeds, _ = probs.shape
+    missing = np.isnan(probs)
+    means = []
+    sigmas = []
+    for resample in resamples:
+        rng = np.random.default_rng(np.random.SeedSequence(
+            entropy, spawn_key=(resample,)))
+        sample = probs
+        if resample_shots:
+            sample = rng.binomial(shots, np.where(missing, 0, probs)) / \
+                np.maximum(shots, 1)
+            sample[missing] = np.nan
+        if resample_seeds:
+            sample = sample[:, rng.integers(nseeds, size=nseeds)]
+        with warnings.catch_warnings():
+            # lengths whose circuits are all missing have nan statistics
+            warnings.simplefilter('ignore', RuntimeWarning)
+            means.append(np.nanmean(sample, 1))
+            std = np.nanstd(sample, 1)
+        sigma = np.full(means[-1].shape, np.nan)
+        if nseeds > 1:
+            # fit without sigma if one of the std values is zero
+            weighted = np.all((std != 0) | np.isnan(std), axis=1)
+            sigma[weighted] = std[weighted]
+        sigmas.append(sigma)
+
+    xdata = np.tile(xdata, (len(resamples), 1))
+    ydata = np.concatenate(means)
+    sigma = np.concatenate(sigmas)
+    p0 = np.tile(p0, (len(resamples), 1))
+    params, _, success = fit_decays(xdata, ydata, sigma, p0)
+    for row in np.flatnonzero(~success):
+        params[row] = _curve_fit_decay(xdata[row], ydata[row], sigma[row],
+                                       p0[row])
+    return params.reshape(len(resamples), npatt, 3)
+
+
+def _decay(x, a, alpha, b):
+    """The RB decay ``a * alpha ** x + b``."""
+    return a * alpha ** x + b
+
+
+def _curve_fit_decay(xdata, ydata, sigma, p0):
+    """Fit a single curve with :func:`scipy.optimize.curve_fit`.
+
+    As :func:`fit_decays`, ``nan`` values are ignored and the curve is fit
+    unweighted if one of the sigma values of the other points is ``nan``.
+
+    Returns:
+        numpy.ndarray: the fit parameters, ``nan`` if the fit fails.
+    """
+    mask = np.isfinite(ydata)
+    sigma = sigma[mask]
+    if not np.all(np.isfinite(sigma)):
+        sigma = None
+    try:
+        with warnings.catch_warnings():
+            # the covariance is not used
+            warnings.simplefilter('ignore')
+            return curve_fit(_decay, xdata[mask], ydata[mask], sigma=sigma,
+                             p0=np.clip(p0, 0, 1),
+                             bounds=([0, 0, 0], [1, 1, 1]))[0]
+    except (RuntimeError, ValueError):
+        return np.full(3, np.nan)
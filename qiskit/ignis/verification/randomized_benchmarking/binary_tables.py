@@ -0,0 +1,374 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Compact binary format of the Clifford and CNOT-dihedral group tables.
+
+A table file holds the keys of the table as sorted ``uint64`` integers
+and the gates of every element as ``(opcode, arg1, arg2)`` byte records
+in a single arena. The file is memory-mapped with ``numpy.memmap``, so
+worker processes that load the same table share its pages, and an
+element is only decoded when it is looked up.
+
+File layout (little endian, every section aligned to 8 bytes)::
+
+    magic            8 bytes   b'IGNISGT' + format version
+    header           uint64[4] kind, num_qubits, num_entries, num_records
+    keys             uint64[num_entries]      sorted keys
+    order            uint32[num_entries]      position of the i-th key of
+                                              the original table in keys
+    offsets          uint32[num_entries + 1]  first record of each entry
+    records          uint8[num_records, 3]    gates of the entries
+"""
+
+import ast
+import os
+from collections.abc import Mapping
+
+import numpy as np
+
+from .dihedral import CNOTDihedral
+from .group_tables import table_path
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+BINARY_FORMAT_VERSION = 1
+_MAGIC = b'IGNISGT' + bytes([BINARY_FORMAT_VERSION])
+
+# Kinds of tables
+CLIFFORD_TABLE = 0
+CNOT_DIHEDRAL_TABLE = 1
+
+# Gate opcodes
+_OPCODES = ('x', 'y', 'z', 'h', 's', 'sdg', 'v', 'w',
+            'cx', 'cz', 'swap', 'u1')
+_OPCODE_INDEX = {name: code for code, name in enumerate(_OPCODES)}
+
+
+def _aligned(size):
+    """Round a size in bytes up to a multiple of 8."""
+    return (size + 7) // 8 * 8
+
+
+# ----------------------------------------------------------------------
+# Keys
+# ----------------------------------------------------------------------
+
+def _dihedral_fields(num_qubits):
+    """Return the number of Z8 weights and the number of bits
+    of the linear and shift parts of a CNOT-dihedral key."""
+    nc2 = num_qubits * (num_qubits - 1) // 2
+    nc3 = num_qubits * (num_qubits - 1) * (num_qubits - 2) // 6
+    return (1, num_qubits, nc2, nc3), num_qubits ** 2, num_qubits
+
+
+def encode_key(key, kind, num_qubits):
+    """
+    Encode a key of a group table as an integer.
+
+    Args:
+        key (int or str): a Clifford index or a CNOT-dihedral key.
+        kind (int): the kind of the table.
+        num_qubits (int): the number of qubits.
+
+    Returns:
+        int: the encoded key.
+
+    Raises:
+        ValueError: if the key cannot be encoded in 64 bits.
+    """
+    if kind == CLIFFORD_TABLE:
+        ret = int(key)
+    else:
+        poly, linear, shift = ast.literal_eval(key)
+        weight_0, weight_1, weight_2, weight_3 = ast.literal_eval(poly)
+        ret = 0
+        for weight in [weight_0] + list(weight_1 + weight_2 + weight_3):
+            ret = (ret << 3) | weight
+        for bit in [b for row in linear for b in row] + list(shift):
+            ret = (ret << 1) | bit
+    if ret < 0 or ret >= 1 << 64:
+        raise ValueError("The key does not fit in 64 bits")
+    return ret
+
+
+def decode_key(value, kind, num_qubits):
+    """
+    Decode an integer key of a group table.
+
+    Args:
+        value (int): the encoded key.
+        kind (int): the kind of the table.
+        num_qubits (int): the number of qubits.
+
+    Returns:
+        int or str: the Clifford index or the CNOT-dihedral key.
+    """
+    if kind == CLIFFORD_TABLE:
+        return value
+    weight_sizes, num_linear, num_shift = _dihedral_fields(num_qubits)
+    shift = []
+    for _ in range(num_shift):
+        shift.insert(0, value & 1)
+        value >>= 1
+    bits = []
+    for _ in range(num_linear):
+        bits.insert(0, value & 1)
+        value >>= 1
+    linear = tuple(tuple(bits[row * num_qubits:(row + 1) * num_qubits])
+                   for row in range(num_qubits))
+    weights = []
+    for _ in range(sum(weight_sizes)):
+        weights.insert(0, value & 7)
+        value >>= 3
+    weight_1 = tuple(weights[1:1 + weight_sizes[1]])
+    weight_2 = tuple(weights[1 + weight_sizes[1]:
+                             1 + weight_sizes[1] + weight_sizes[2]])
+    weight_3 = tuple(weights[1 + weight_sizes[1] + weight_sizes[2]:])
+    # Same format as CNOTDihedral.key
+    poly = str((weights[0], weight_1, weight_2, weight_3))
+    return str((poly, linear, tuple(shift)))
+
+
+# ----------------------------------------------------------------------
+# Gates
+# ----------------------------------------------------------------------
+
+def _encode_gates(value, kind):
+    """Encode the gates of a table entry as byte records."""
+    records = []
+    if kind == CLIFFORD_TABLE:
+        for op in value:
+            split = op.split()
+            args = [int(q) for q in split[1:]] + [0, 0]
+            records.append((_OPCODE_INDEX[split[0]], args[0], args[1]))
+    else:
+        for gate in value[1]:
+            args = list(gate[1:]) + [0, 0]
+            records.append((_OPCODE_INDEX[gate[0]], args[0], args[1]))
+    return records
+
+
+def _decode_gates(records, kind, num_qubits):
+    """Decode byte records into the value of a table entry."""
+    if kind == CLIFFORD_TABLE:
+        gatelist = []
+        for code, arg1, arg2 in records.tolist():
+            name = _OPCODES[code]
+            if name in ('cx', 'cz', 'swap'):
+                gatelist.append('%s %d %d' % (name, arg1, arg2))
+            else:
+                gatelist.append('%s %d' % (name, arg1))
+        return gatelist
+    # Rebuild the CNOT-dihedral element from its gates, in the same
+    # way as make_dict_0 and make_dict_next
+    elem = CNOTDihedral(num_qubits)
+    circ = []
+    for code, arg1, arg2 in records.tolist():
+        name = _OPCODES[code]
+        if name == 'u1':
+            elem.phase(arg1, arg2)
+            circ.append(('u1', arg1, arg2))
+        elif name == 'x':
+            elem.flip(arg1)
+            circ.append(('x', arg1))
+        else:
+            elem.cnot(arg1, arg2)
+            circ.append(('cx', arg1, arg2))
+    return elem, circ
+
+
+# ----------------------------------------------------------------------
+# Reading and writing table files
+# ----------------------------------------------------------------------
+
+def write_binary_table(filename, table, kind, num_qubits):
+    """
+    Write a group table in the binary format.
+
+    Args:
+        filename (str): the file name.
+        table (dict): a Clifford table (keys are ``Clifford.index()``
+            values and values are lists of gates) or a CNOT-dihedral table
+            (keys are ``CNOTDihedral.key`` strings and values are pairs
+            of a CNOTDihedral object and a list of gates).
+        kind (int): ``CLIFFORD_TABLE`` or ``CNOT_DIHEDRAL_TABLE``.
+        num_qubits (int): the number of qubits of the table.
+    """
+    num_entries = len(table)
+    keys = np.array([encode_key(key, kind, num_qubits) for key in table],
+                    dtype=np.uint64)
+    sort = np.argsort(keys, kind='stable')
+    order = np.empty(num_entries, dtype=np.uint32)
+    order[sort] = np.arange(num_entries, dtype=np.uint32)
+    values = list(table.values())
+    records = []
+    offsets = np.zeros(num_entries + 1, dtype=np.uint32)
+    for pos, idx in enumerate(sort):
+        records.extend(_encode_gates(values[idx], kind))
+        offsets[pos + 1] = len(records)
+    records = np.array(records, dtype=np.uint8).reshape(-1, 3)
+
+    header = np.array([kind, num_qubits, num_entries, len(records)],
+                      dtype='<u8')
+    with open(filename, 'wb') as fd:
+        for section in (header, keys[sort].astype('<u8'),
+                        order.astype('<u4'), offsets.astype('<u4'),
+                        records):
+            if fd.tell() == 0:
+                fd.write(_MAGIC)
+            data = section.tobytes()
+            fd.write(data)
+            fd.write(bytes(_aligned(len(data)) - len(data)))
+
+
+class BinaryGroupTable(Mapping):
+    """A memory-mapped group table in the binary format.
+
+    It is a read-only mapping with the same keys, values and iteration
+    order as the dict the table was written from.
+    """
+
+    def __init__(self, filename):
+        """
+        Args:
+            filename (str): the file name of the table.
+
+        Raises:
+            ValueError: if the file is not a group table of this format.
+        """
+        data = np.memmap(filename, dtype=np.uint8, mode='r')
+        if data.size < 40 or data[:8].tobytes() != _MAGIC:
+            raise ValueError("Not a binary group table: %s" % filename)
+        kind, num_qubits, num_entries, num_records = \
+            [int(x) for x in data[8:40].view('<u8')]
+        self._kind = kind
+        self._num_qubits = num_qubits
+        pos = 40
+        sections = []
+        for dtype, count in (('<u8', num_entries), ('<u4', num_entries),
+                             ('<u4', num_entries + 1),
+                             (np.uint8, 3 * num_records)):
+            size = np.dtype(dtype).itemsize * count
+            if pos + size > data.size:
+                raise ValueError("Truncated binary group table: %s"
+                                 % filename)
+            sections.append(data[pos:pos + size].view(dtype))
+            pos += _aligned(size)
+        self._keys, self._order, self._offsets, records = sections
+        self._records = records.reshape(-1, 3)
+        self._key_list = None
+        self._values = {}
+
+    @property
+    def kind(self):
+        """Return the kind of the table."""
+        return self._kind
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits of the table."""
+        return self._num_qubits
+
+    def _find(self, key):
+        """Return the sorted position of a key, or -1 if not found."""
+        try:
+            value = encode_key(key, self._kind, self._num_qubits)
+        except (ValueError, TypeError, SyntaxError):
+            return -1
+        pos = int(np.searchsorted(self._keys, np.uint64(value)))
+        if pos < len(self._keys) and int(self._keys[pos]) == value:
+            return pos
+        return -1
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return self._find(key) >= 0
+
+    def __iter__(self):
+        if self._key_list is None:
+            self._key_list = [
+                decode_key(int(self._keys[pos]), self._kind, self._num_qubits)
+                for pos in self._order]
+        return iter(self._key_list)
+
+    def __getitem__(self, key):
+        pos = self._find(key)
+        if pos < 0:
+            raise KeyError(key)
+        if pos not in self._values:
+            records = self._records[self._offsets[pos]:
+                                    self._offsets[pos + 1]]
+            self._values[pos] = _decode_gates(records, self._kind,
+                                              self._num_qubits)
+        return self._values[pos]
+
+
+def load_binary_table(filename, kind, num_qubits, make_table):
+    """
+    Load a binary group table from the tables directory.
+    If the file does not exist, generate the table and save it
+    (if the directory is writable).
+
+    Args:
+        filename (str): the file name of the table.
+        kind (int): the kind of the table.
+        num_qubits (int): the number of qubits of the table.
+        make_table (callable): a function with no arguments that
+            generates the table as a dict.
+
+    Returns:
+        Mapping: the group table.
+    """
+    filename = table_path(filename)
+    try:
+        return BinaryGroupTable(filename)
+    except (OSError, ValueError):
+        pass
+
+    # table doesn't exist (or is corrupt), so make it and save it
+    # this will save time next run
+    table = make_table()
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        # write to a temporary file first, so that other processes
+        # never read a partially written table
+        tmpfile = '%s.%d.tmp' % (filename, os.getpid())
+        write_binary_table(tmpfile, table, kind, num_qubits)
+        os.replace(tmpfile, filename)
+    except OSError:
+        return table
+    return BinaryGroupTable(filename)
+
+
+def convert_pickled_table(picklefile, filename, kind, num_qubits):
+    """
+    Convert a pickled group table (as written by
+    ``CliffordUtils.pickle_clifford_table`` or
+    ``DihedralUtils.pickle_dihedral_table``) to the binary format.
+
+    Args:
+        picklefile (str): the file name of the pickled table.
+        filename (str): the file name of the binary table.
+        kind (int): ``CLIFFORD_TABLE`` or ``CNOT_DIHEDRAL_TABLE``.
+        num_qubits (int): the number of qubits of the table.
+    """
+    with open(picklefile, 'rb') as pf:
+        table = pickle.load(pf)
+    write_binary_table(filename, table, kind, num_qubits)
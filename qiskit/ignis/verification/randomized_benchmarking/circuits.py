@@ -19,15 +19,17 @@
 Generates randomized benchmarking sequences
 """
 
-import copy
-from typing import List, Optional
+from typing import Iterator, List, Optional
 import numpy as np
 import qiskit
+from qiskit.tools import parallel_map
 
 from .Clifford import Clifford
+from .clifford_group import CliffordGroup
 from .clifford_utils import CliffordUtils as clutils
 from .dihedral import CNOTDihedral
 from .dihedral_utils import DihedralUtils as dutils
+from .group_tables import get_group_table
 
 
 def handle_length_multiplier(length_multiplier, len_pattern,
@@ -135,7 +137,10 @@ def randomized_benchmarking_seq(nseeds: int = 1,
                                 align_cliffs: bool = False,
                                 interleaved_gates: Optional[List[List[str]]] = None,
                                 is_purity: bool = False,
-                                group_gates: Optional[str] = None) -> \
+                                group_gates: Optional[str] = None,
+                                rand_seed: Optional[int] = None,
+                                num_processes: Optional[int] = None,
+                                basis_gates: Optional[List[str]] = None) -> \
         (List[List[qiskit.QuantumCircuit]], List[List[int]],
          Optional[List[List[qiskit.QuantumCircuit]]],
          Optional[List[List[List[qiskit.QuantumCircuit]]]],
@@ -207,11 +212,35 @@ def randomized_benchmarking_seq(nseeds: int = 1,
             (the default is the Clifford group).
 
             * ``group_gates='0'`` or ``group_gates=None`` or \
-            ``group_gates='Clifford'`` -- Clifford group.
+            ``group_gates='Clifford'`` -- Clifford group. Patterns of more
+            than 2 qubits draw uniformly random Cliffords by
+            :meth:`CliffordUtils.random_clifford_gates`.
 
             * ``group_gates='1'`` or ``group_gates='CNOT-Dihedral'`` \
             or ``group_gates='Non-Clifford'`` -- CNOT-Dihedral group.
 
+        rand_seed: The seed of the root ``numpy.random.SeedSequence``.
+            If ``rand_seed`` or ``num_processes`` is not ``None``, the
+            sequences of each seed are drawn from an independent
+            ``numpy.random.Generator`` spawned from this root, with the
+            spawn key ``seed + seed_offset``. The output then only depends
+            on ``rand_seed`` (and not on ``num_processes``).
+            Otherwise (the default) the sequences are drawn from the
+            global ``numpy.random`` state.
+
+        num_processes: The number of worker processes. If it is bigger
+            than 1, the seeds are sharded across a process pool
+            (see ``qiskit.tools.parallel_map``).
+
+        basis_gates: If not ``None``, the circuits are generated in these
+            basis gates (e.g. ``['u1', 'u2', 'u3', 'cx']``), so that they
+            do not need to be transpiled to the basis (only mapped to the
+            coupling map of a device, if needed). Each distinct group
+            element is transpiled once per process (with
+            ``optimization_level=1``) and cached, instead of transpiling
+            every circuit. The gates per Clifford of these circuits are
+            given by :func:`~qiskit.ignis.verification.expected_gates_per_clifford`.
+
     Returns:
         A tuple of different fields depending on the inputs.
         The different fields are:
@@ -287,21 +316,209 @@ def randomized_benchmarking_seq(nseeds: int = 1,
         The output is ``npurity = 9`` in this case.
 
     """
+    g_utils, group_gates_type, length_vector, rb_pattern, \
+        length_multiplier, xdata, npurity = _check_rb_args(
+            length_vector, rb_pattern, length_multiplier, is_purity,
+            group_gates)
+
+    pattern_sizes = [len(pat) for pat in rb_pattern]
+    max_nrb = np.max(pattern_sizes)
+
+    # load the group tables before the worker processes are started,
+    # so that they are shared with the workers
+    _load_group_tables(g_utils, group_gates_type, max_nrb)
+
+    # with rand_seed or num_processes, each seed draws from its own
+    # random number generator, spawned from a root SeedSequence
+    entropy = None
+    if rand_seed is not None or num_processes is not None:
+        entropy = np.random.SeedSequence(rand_seed).entropy
+
+    seed_args = (entropy, length_vector, rb_pattern, length_multiplier,
+                 seed_offset, align_cliffs, interleaved_gates, is_purity,
+                 group_gates_type, basis_gates)
+    if num_processes is None or num_processes <= 1 or nseeds <= 1:
+        seed_circuits = _rb_seeds(list(range(nseeds)), *seed_args)
+    else:
+        # shard the seeds across the worker processes
+        shards = [[int(seed) for seed in shard] for shard in
+                  np.array_split(np.arange(nseeds),
+                                 min(num_processes, nseeds))]
+        seed_circuits = [
+            circs for shard_circuits in parallel_map(
+                _rb_seeds, shards, task_args=seed_args,
+                num_processes=num_processes)
+            for circs in shard_circuits]
+
+    # rb, interleaved rb, non-clifford cnot-dihedral rb,
+    # non-clifford cnot-dihedral interleaved rb and purity rb sequences
+    circuits, circuits_interleaved, circuits_cnotdihedral, \
+        circuits_cnotdihedral_interleaved, circuits_purity = \
+        [[circs[i] for circs in seed_circuits] for i in range(5)]
+
+    # output of purity rb
+    if is_purity:
+        return circuits_purity, xdata, npurity
+    # output of non-clifford cnot-dihedral interleaved rb
+    if interleaved_gates is not None and group_gates_type == 1:
+        return circuits, xdata, circuits_cnotdihedral, circuits_interleaved, \
+               circuits_cnotdihedral_interleaved
+    # output of interleaved rb
+    if interleaved_gates is not None:
+        return circuits, xdata, circuits_interleaved
+    # output of Non-Clifford cnot-dihedral rb
+    if group_gates_type == 1:
+        return circuits, xdata, circuits_cnotdihedral
+    # output of standard (simultaneous) rb
+    return circuits, xdata
+
+
+def randomized_benchmarking_seq_iter(
+        nseeds: int = 1,
+        length_vector: Optional[List[int]] = None,
+        rb_pattern: Optional[List[List[int]]] = None,
+        length_multiplier: Optional[List[int]] = 1,
+        seed_offset: int = 0,
+        align_cliffs: bool = False,
+        interleaved_gates: Optional[List[List[str]]] = None,
+        is_purity: bool = False,
+        group_gates: Optional[str] = None,
+        rand_seed: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        basis_gates: Optional[List[str]] = None) -> \
+        (Iterator[List[qiskit.QuantumCircuit]], List[List[int]],
+         Optional[int]):
+    """Generate randomized benchmarking (RB) sequences lazily.
+
+    The same as :func:`randomized_benchmarking_seq`, but the circuits are
+    generated one seed at a time by an iterator, so that they can be
+    executed (and freed) while the next seeds are generated. The circuits
+    have the same names as those of :func:`randomized_benchmarking_seq`,
+    so their results can be added to the RB fitters.
+
+    For each seed, the iterator yields the circuits of all the variants
+    in the order: rb (or cnot-dihedral rb ``Z``), cnot-dihedral rb ``X``,
+    interleaved rb (``Z`` and then ``X`` for cnot-dihedral); or for
+    purity rb the circuits of each of the :math:`3^n` purity variants.
+    Within a variant the circuits are ordered by length.
+
+    Args:
+        nseeds: The number of seeds.
+        length_vector: Length vector of the RB sequence lengths.
+        rb_pattern: A list of the lists of integers representing the
+            qubits indexes.
+        length_multiplier: An array that scales each RB sequence by
+            the multiplier.
+        seed_offset: What to start the seeds at.
+        align_cliffs: If ``True`` adds a barrier across all qubits in
+            the pattern after each set of group elements.
+        interleaved_gates: A list of lists of gates that will be
+            interleaved.
+        is_purity: ``True`` only for purity randomized benchmarking.
+        group_gates: On which group (or set of gates) we perform RB.
+        rand_seed: The seed of the root ``numpy.random.SeedSequence``.
+            The sequences of a seed are the same as those of
+            :func:`randomized_benchmarking_seq` with the same
+            ``rand_seed``. If ``None`` the sequences are drawn from the
+            global ``numpy.random`` state.
+        batch_size: If not ``None``, yield lists of ``batch_size``
+            circuits (the last list may be shorter) instead of one list
+            per seed, e.g. ``backend.configuration().max_experiments``.
+        basis_gates: If not ``None``, the circuits are generated in these
+            basis gates.
+
+    See :func:`randomized_benchmarking_seq` for a detailed description
+    of the arguments.
+
+    Returns:
+        A tuple of the form (``circuits``, ``xdata``), or
+        (``circuits``, ``xdata``, ``npurity``) if ``is_purity=True``:
+
+         * ``circuits``: an iterator of lists of circuits.
+
+         * ``xdata``: the sequences lengths (with multiplier if applicable).
+
+         * ``npurity``: (only if ``is_purity=True``): \
+            the number of purity RB circuits (per seed).
+
+    Raises:
+        ValueError: if the arguments are not valid.
+    """
+    g_utils, group_gates_type, length_vector, rb_pattern, \
+        length_multiplier, xdata, npurity = _check_rb_args(
+            length_vector, rb_pattern, length_multiplier, is_purity,
+            group_gates)
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("The batch size should be positive")
+    _load_group_tables(g_utils, group_gates_type,
+                       np.max([len(pat) for pat in rb_pattern]))
+
+    entropy = None
+    if rand_seed is not None:
+        entropy = np.random.SeedSequence(rand_seed).entropy
+    seed_iter = _rb_seed_iter(
+        range(nseeds), entropy, length_vector, rb_pattern,
+        length_multiplier, seed_offset, align_cliffs, interleaved_gates,
+        is_purity, group_gates_type, basis_gates)
+
+    def seed_circuits():
+        for circuits, circuits_interleaved, circuits_cnotdihedral, \
+                circuits_cnotdihedral_interleaved, circuits_purity in \
+                seed_iter:
+            if is_purity:
+                yield [circ for circs in circuits_purity for circ in circs]
+                continue
+            circs = list(circuits)
+            if group_gates_type == 1:
+                circs += circuits_cnotdihedral
+            if interleaved_gates is not None:
+                circs += circuits_interleaved
+                if group_gates_type == 1:
+                    circs += circuits_cnotdihedral_interleaved
+            yield circs
+
+    def batches():
+        batch = []
+        for circs in seed_circuits():
+            batch.extend(circs)
+            while len(batch) >= batch_size:
+                yield batch[:batch_size]
+                batch = batch[batch_size:]
+        if batch:
+            yield batch
+
+    circuits = seed_circuits() if batch_size is None else batches()
+    if is_purity:
+        return circuits, xdata, npurity
+    return circuits, xdata
+
+
+def _check_rb_args(length_vector, rb_pattern, length_multiplier, is_purity,
+                   group_gates):
+    """
+    Check the arguments of :func:`randomized_benchmarking_seq`
+    and set their default values.
+
+    Returns:
+        tuple: of the form (``g_utils``, ``group_gates_type``,
+        ``length_vector``, ``rb_pattern``, ``length_multiplier``,
+        ``xdata``, ``npurity``), where ``group_gates_type`` is 0 for
+        the Clifford group and 1 for the CNOT-dihedral group.
+
+    Raises:
+        ValueError: if the arguments are not valid.
+    """
     # Set modules (default is Clifford)
     if group_gates is None or group_gates in ('0',
                                               'Clifford',
                                               'clifford'):
         g_utils = clutils()
-        g_group = Clifford
-        rb_circ_type = 'rb'
         group_gates_type = 0
     elif group_gates in ('1', 'Non-Clifford',
                          'NonClifford'
                          'CNOTDihedral',
                          'CNOT-Dihedral'):
         g_utils = dutils()
-        g_group = CNOTDihedral
-        rb_circ_type = 'rb_cnotdihedral'
         group_gates_type = 1
     else:
         raise ValueError("Unknown group or set of gates.")
@@ -311,7 +528,7 @@ def randomized_benchmarking_seq(nseeds: int = 1,
     if length_vector is None:
         length_vector = [1, 10, 20]
 
-    qlist_flat, n_q_max, max_dim = check_pattern(rb_pattern, is_purity)
+    _, _, max_dim = check_pattern(rb_pattern, is_purity)
     length_multiplier = handle_length_multiplier(length_multiplier,
                                                  len(rb_pattern),
                                                  is_purity)
@@ -320,44 +537,145 @@ def randomized_benchmarking_seq(nseeds: int = 1,
 
     xdata = calc_xdata(length_vector, length_multiplier)
 
-    pattern_sizes = [len(pat) for pat in rb_pattern]
-    max_nrb = np.max(pattern_sizes)
+    return g_utils, group_gates_type, length_vector, rb_pattern, \
+        length_multiplier, xdata, npurity
+
+
+def _load_group_tables(g_utils, group_gates_type, max_nrb):
+    """
+    Load the group tables for 1 up to max_nrb qubits.
+
+    Args:
+        g_utils (BasicUtils): the utils class of the group.
+        group_gates_type (int): 0 for the Clifford group
+            and 1 for the CNOT-dihedral group.
+        max_nrb (int): the maximal number of qubits.
 
-    # load group tables
+    Returns:
+        list: the group tables. The Clifford group tables are
+        :class:`CliffordGroup` objects, and ``None`` for more than 2 qubits
+        where the Clifford elements are :class:`Clifford` tableaus.
+    """
     group_tables = [[] for _ in range(max_nrb)]
     for rb_num in range(max_nrb):
-        group_tables[rb_num] = g_utils.load_tables(rb_num+1)
-
-    # initialization: rb sequences
-    circuits = [[] for e in range(nseeds)]
-    # initialization: interleaved rb sequences
-    circuits_interleaved = [[] for e in range(nseeds)]
-    # initialization: non-clifford cnot-dihedral
-    # rb sequences
-    circuits_cnotdihedral = [[] for e in range(nseeds)]
-    # initialization: non-clifford cnot-dihedral
-    # interleaved rb sequences
-    circuits_cnotdihedral_interleaved = [[] for e in range(nseeds)]
-    # initialization: purity rb sequences
-    circuits_purity = [[[] for d in range(npurity)]
-                       for e in range(nseeds)]
+        if group_gates_type == 0 and rb_num >= 2:
+            group_tables[rb_num] = None
+        elif group_gates_type == 0:
+            group_tables[rb_num] = get_group_table(
+                'clifford_group_%d' % (rb_num+1),
+                lambda num_qubits=rb_num+1: CliffordGroup(num_qubits))
+        else:
+            group_tables[rb_num] = g_utils.load_tables(rb_num+1)
+    return group_tables
+
+
+def _rb_seeds(seeds, *seed_args):
+    """
+    Generate the RB sequences of a shard of seeds.
+
+    Returns:
+        list: the sequences yielded by :func:`_rb_seed_iter`.
+    """
+    return list(_rb_seed_iter(seeds, *seed_args))
+
+
+def _rb_seed_iter(seeds, entropy, length_vector, rb_pattern,
+                  length_multiplier, seed_offset, align_cliffs,
+                  interleaved_gates, is_purity, group_gates_type,
+                  basis_gates=None):
+    """
+    Generate the RB sequences of a list of seeds, one seed at a time.
+
+    The arguments are the (validated) arguments of
+    :func:`randomized_benchmarking_seq`, and:
+
+    Args:
+        seeds (list): the indices of the seeds of the shard.
+        entropy (int): the entropy of the root ``SeedSequence``. The
+            sequences of the seed ``seed`` are drawn from a generator
+            with spawn key ``(seed + seed_offset,)``, so they do not depend
+            on how the seeds are sharded. If ``None`` the sequences are
+            drawn from the global ``np.random`` state.
+        group_gates_type (int): 0 for the Clifford group
+            and 1 for the CNOT-dihedral group.
+        basis_gates (list): the basis gates of the circuits, or ``None``.
+
+    Yields:
+        tuple: for each seed, a tuple of the lists of rb, interleaved rb,
+        cnot-dihedral rb and cnot-dihedral interleaved rb circuits,
+        and of the list of lists of purity rb circuits.
+    """
+    if group_gates_type == 0:
+        g_utils = clutils()
+        # the Clifford group elements are indices in a CliffordGroup,
+        # or tableaus for more than 2 qubits
+        g_group = Clifford
+        rb_circ_type = 'rb'
+    else:
+        g_utils = dutils()
+        g_group = CNOTDihedral
+        rb_circ_type = 'rb_cnotdihedral'
+
+    qlist_flat, n_q_max, max_dim = check_pattern(rb_pattern, is_purity)
+    # number of purity rb circuits per seed
+    npurity = 3**max_dim
+    pattern_sizes = [len(pat) for pat in rb_pattern]
+    group_tables = _load_group_tables(g_utils, group_gates_type,
+                                      np.max(pattern_sizes))
+    # whether the elements are indices in a CliffordGroup
+    is_indexed = [isinstance(table, CliffordGroup) for table in group_tables]
+    # the instructions of each distinct element, built once per process
+    # (see _template_data)
+    templates = _templates_table(basis_gates)
+    if group_gates_type == 0 and interleaved_gates is not None:
+        interleaved_elmnts = [
+            group_tables[rb_q_num-1].index_from_gates(
+                interleaved_gates[rb_pattern_index])
+            if rb_q_num <= 2 else None
+            for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes)]
 
     # go through for each seed
-    for seed in range(nseeds):
+    for seed in seeds:
+        rng = None
+        if entropy is not None:
+            rng = np.random.default_rng(np.random.SeedSequence(
+                entropy, spawn_key=(seed + seed_offset,)))
+
+        # initialization: rb sequences
+        circuits = []
+        # initialization: interleaved rb sequences
+        circuits_interleaved = []
+        # initialization: non-clifford cnot-dihedral
+        # rb sequences
+        circuits_cnotdihedral = []
+        # initialization: non-clifford cnot-dihedral
+        # interleaved rb sequences
+        circuits_cnotdihedral_interleaved = []
+        # initialization: purity rb sequences
+        circuits_purity = [[] for d in range(npurity)]
+
         qr = qiskit.QuantumRegister(n_q_max+1, 'qr')
         cr = qiskit.ClassicalRegister(len(qlist_flat), 'cr')
-        general_circ = qiskit.QuantumCircuit(qr, cr)
-        interleaved_circ = qiskit.QuantumCircuit(qr, cr)
+        # the instructions of the sequences are appended to lists that
+        # are shared by the circuits of all the lengths (and variants),
+        # instead of copying circuits
+        general_data = []
+        interleaved_data = []
+        # barriers after each element, and across all the patterns
+        barriers = [_barrier_data(qr, pat) for pat in rb_pattern]
+        align_barrier = _barrier_data(qr, qlist_flat)
+        pattern_qubits = [[qr[q] for q in pat] for pat in rb_pattern]
 
         # make sequences for each of the separate sequences in
         # rb_pattern
         Elmnts = []
         for rb_q_num in pattern_sizes:
-            Elmnts.append(g_group(rb_q_num))
+            Elmnts.append(0 if is_indexed[rb_q_num-1] else g_group(rb_q_num))
         # Sequences for interleaved rb sequences
-            Elmnts_interleaved = []
+        Elmnts_interleaved = []
         for rb_q_num in pattern_sizes:
-            Elmnts_interleaved.append(g_group(rb_q_num))
+            Elmnts_interleaved.append(
+                0 if is_indexed[rb_q_num-1] else g_group(rb_q_num))
 
         # go through and add elements to RB sequences
         length_index = 0
@@ -365,91 +683,117 @@ def randomized_benchmarking_seq(nseeds: int = 1,
             for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes):
 
                 for _ in range(length_multiplier[rb_pattern_index]):
-                    new_elmnt_gatelist = g_utils.random_gates(
-                        rb_q_num)
-                    Elmnts[rb_pattern_index] = g_utils.compose_gates(
-                        Elmnts[rb_pattern_index], new_elmnt_gatelist)
-                    general_circ += replace_q_indices(
-                        get_quantum_circuit(g_utils.gatelist(),
-                                            rb_q_num),
-                        rb_pattern[rb_pattern_index], qr)
+                    if is_indexed[rb_q_num-1]:
+                        # draw the same random numbers as random_gates
+                        group = group_tables[rb_q_num-1]
+                        if rng is None:
+                            new_elmnt = np.random.randint(0, group.size)
+                        else:
+                            new_elmnt = int(rng.integers(group.size))
+                        Elmnts[rb_pattern_index] = group.compose(
+                            Elmnts[rb_pattern_index], new_elmnt)
+                        new_gates = group.gatelist(new_elmnt)
+                    else:
+                        new_elmnt = g_utils.random_gates(rb_q_num, rng=rng)
+                        Elmnts[rb_pattern_index] = g_utils.compose_gates(
+                            Elmnts[rb_pattern_index], new_elmnt)
+                        new_gates = g_utils.gatelist()
+                    new_data = _template_data(
+                        templates,
+                        _element_key(is_indexed[rb_q_num-1], rb_q_num,
+                                     new_elmnt, new_gates),
+                        new_gates, pattern_qubits[rb_pattern_index],
+                        basis_gates)
+                    general_data.extend(new_data)
 
                     # add a barrier
-                    general_circ.barrier(
-                        *[qr[x] for x in rb_pattern[rb_pattern_index]])
+                    general_data.append(barriers[rb_pattern_index])
 
                     # interleaved rb sequences
                     if interleaved_gates is not None:
-                        Elmnts_interleaved[rb_pattern_index] = \
-                            g_utils.compose_gates(
-                                Elmnts_interleaved[rb_pattern_index],
-                                new_elmnt_gatelist)
-                        interleaved_circ += replace_q_indices(
-                            get_quantum_circuit(g_utils.gatelist(),
-                                                rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
-                        Elmnts_interleaved[rb_pattern_index] = \
-                            g_utils.compose_gates(
-                                Elmnts_interleaved[rb_pattern_index],
-                                interleaved_gates[rb_pattern_index])
+                        if is_indexed[rb_q_num-1]:
+                            Elmnts_interleaved[rb_pattern_index] = \
+                                group.compose(
+                                    group.compose(
+                                        Elmnts_interleaved[rb_pattern_index],
+                                        new_elmnt),
+                                    interleaved_elmnts[rb_pattern_index])
+                            new_interleaved_gates = \
+                                interleaved_gates[rb_pattern_index]
+                        else:
+                            Elmnts_interleaved[rb_pattern_index] = \
+                                g_utils.compose_gates(
+                                    Elmnts_interleaved[rb_pattern_index],
+                                    new_elmnt)
+                            Elmnts_interleaved[rb_pattern_index] = \
+                                g_utils.compose_gates(
+                                    Elmnts_interleaved[rb_pattern_index],
+                                    interleaved_gates[rb_pattern_index])
+                            new_interleaved_gates = g_utils.gatelist()
+                        # the same element as in the rb sequence
+                        interleaved_data.extend(new_data)
                         # add a barrier - interleaved rb
-                        interleaved_circ.barrier(
-                            *[qr[x] for x in rb_pattern[rb_pattern_index]])
-                        interleaved_circ += replace_q_indices(
-                            get_quantum_circuit(g_utils.gatelist(),
-                                                rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
+                        interleaved_data.append(barriers[rb_pattern_index])
+                        interleaved_data.extend(_template_data(
+                            templates,
+                            _element_key(False, rb_q_num, None,
+                                         new_interleaved_gates),
+                            new_interleaved_gates,
+                            pattern_qubits[rb_pattern_index], basis_gates))
                         # add a barrier - interleaved rb
-                        interleaved_circ.barrier(
-                            *[qr[x] for x in rb_pattern[rb_pattern_index]])
+                        interleaved_data.append(barriers[rb_pattern_index])
 
             if align_cliffs:
                 # if align at a barrier across all patterns
-                general_circ.barrier(
-                    *[qr[x] for x in qlist_flat])
+                general_data.append(align_barrier)
                 # align for interleaved rb
                 if interleaved_gates is not None:
-                    interleaved_circ.barrier(
-                        *[qr[x] for x in qlist_flat])
+                    interleaved_data.append(align_barrier)
 
             # if the number of elements matches one of the sequence lengths
             # then calculate the inverse and produce the circuit
             if (elmnts_index+1) == length_vector[length_index]:
-                # circ for rb:
-                circ = qiskit.QuantumCircuit(qr, cr)
-                circ += general_circ
-                # circ_interleaved for interleaved rb:
-                circ_interleaved = qiskit.QuantumCircuit(qr, cr)
-                circ_interleaved += interleaved_circ
+                # the sequences share the instructions of the prefix
+                circ_data = list(general_data)
+                circ_interleaved_data = list(interleaved_data)
 
                 for (rb_pattern_index, rb_q_num) in enumerate(pattern_sizes):
-                    inv_key = g_utils.find_key(Elmnts[rb_pattern_index],
-                                               rb_q_num)
-                    inv_circuit = g_utils.find_inverse_gates(
-                        rb_q_num,
-                        group_tables[rb_q_num-1][inv_key])
-                    circ += replace_q_indices(
-                        get_quantum_circuit(inv_circuit, rb_q_num),
-                        rb_pattern[rb_pattern_index], qr)
+                    inv_circuit = find_inverse_gatelist(
+                        g_utils, group_tables[rb_q_num-1],
+                        Elmnts[rb_pattern_index], rb_q_num)
+                    circ_data.extend(_template_data(
+                        templates,
+                        _element_key(is_indexed[rb_q_num-1], rb_q_num,
+                                     Elmnts[rb_pattern_index], inv_circuit,
+                                     inverse=True),
+                        inv_circuit, pattern_qubits[rb_pattern_index],
+                        basis_gates))
                     # calculate the inverse and produce the circuit
                     # for interleaved rb
                     if interleaved_gates is not None:
-                        inv_key = g_utils.find_key(Elmnts_interleaved
-                                                   [rb_pattern_index],
-                                                   rb_q_num)
-                        inv_circuit = g_utils.find_inverse_gates(
-                            rb_q_num,
-                            group_tables[rb_q_num - 1][inv_key])
-                        circ_interleaved += replace_q_indices(
-                            get_quantum_circuit(inv_circuit, rb_q_num),
-                            rb_pattern[rb_pattern_index], qr)
+                        inv_circuit = find_inverse_gatelist(
+                            g_utils, group_tables[rb_q_num-1],
+                            Elmnts_interleaved[rb_pattern_index], rb_q_num)
+                        circ_interleaved_data.extend(_template_data(
+                            templates,
+                            _element_key(is_indexed[rb_q_num-1], rb_q_num,
+                                         Elmnts_interleaved[rb_pattern_index],
+                                         inv_circuit, inverse=True),
+                            inv_circuit, pattern_qubits[rb_pattern_index],
+                            basis_gates))
+
+                # circ for rb:
+                circ = _append_data(qiskit.QuantumCircuit(qr, cr), circ_data)
+                # circ_interleaved for interleaved rb:
+                circ_interleaved = _append_data(
+                    qiskit.QuantumCircuit(qr, cr), circ_interleaved_data)
 
                 # Circuits for purity rb
                 if is_purity:
                     circ_purity = [[] for d in range(npurity)]
                     for d in range(npurity):
-                        circ_purity[d] = qiskit.QuantumCircuit(qr, cr)
-                        circ_purity[d] += circ
+                        circ_purity[d] = _append_data(
+                            qiskit.QuantumCircuit(qr, cr), circ_data)
                         circ_purity[d].name = rb_circ_type + '_purity_'
                         ind_d = d
                         purity_qubit_num = 0
@@ -462,15 +806,31 @@ def randomized_benchmarking_seq(nseeds: int = 1,
                                 circ_purity[d].name += 'Z'
                             if purity_qubit_rot == 1:  # add rx(pi/2)
                                 for pat in rb_pattern:
-                                    circ_purity[d].rx(np.pi / 2,
-                                                      qr[pat[
-                                                          purity_qubit_num]])
+                                    if basis_gates is None:
+                                        circ_purity[d].rx(
+                                            np.pi / 2,
+                                            qr[pat[purity_qubit_num]])
+                                    else:
+                                        _append_data(
+                                            circ_purity[d], _template_data(
+                                                templates, None,
+                                                _PURITY_GATES['rx'],
+                                                [qr[pat[purity_qubit_num]]],
+                                                basis_gates))
                                 circ_purity[d].name += 'X'
                             if purity_qubit_rot == 2:  # add ry(pi/2)
                                 for pat in rb_pattern:
-                                    circ_purity[d].ry(np.pi / 2,
-                                                      qr[pat[
-                                                          purity_qubit_num]])
+                                    if basis_gates is None:
+                                        circ_purity[d].ry(
+                                            np.pi / 2,
+                                            qr[pat[purity_qubit_num]])
+                                    else:
+                                        _append_data(
+                                            circ_purity[d], _template_data(
+                                                templates, None,
+                                                _PURITY_GATES['ry'],
+                                                [qr[pat[purity_qubit_num]]],
+                                                basis_gates))
                                 circ_purity[d].name += 'Y'
                             purity_qubit_num = purity_qubit_num + 1
                             if ind_d == 0:
@@ -492,18 +852,24 @@ def randomized_benchmarking_seq(nseeds: int = 1,
                 cnotdihedral_circ = qiskit.QuantumCircuit(qr, cr)
                 cnotdihedral_interleaved_circ = qiskit.QuantumCircuit(qr, cr)
                 if group_gates_type == 1:
+                    h_data = {qb: _template_data(templates, None, ['h 0'],
+                                                 [qr[qb]], basis_gates)
+                              for qb in qlist_flat}
                     for _, qb in enumerate(qlist_flat):
-                        cnotdihedral_circ.h(qr[qb])
+                        _append_data(cnotdihedral_circ, h_data[qb])
                         cnotdihedral_circ.barrier(qr[qb])
-                        cnotdihedral_interleaved_circ.h(qr[qb])
+                        _append_data(cnotdihedral_interleaved_circ,
+                                     h_data[qb])
                         cnotdihedral_interleaved_circ.barrier(qr[qb])
-                    cnotdihedral_circ += circ
-                    cnotdihedral_interleaved_circ += circ_interleaved
+                    _append_data(cnotdihedral_circ, circ_data)
+                    _append_data(cnotdihedral_interleaved_circ,
+                                 circ_interleaved_data)
                     for _, qb in enumerate(qlist_flat):
                         cnotdihedral_circ.barrier(qr[qb])
-                        cnotdihedral_circ.h(qr[qb])
+                        _append_data(cnotdihedral_circ, h_data[qb])
                         cnotdihedral_interleaved_circ.barrier(qr[qb])
-                        cnotdihedral_interleaved_circ.h(qr[qb])
+                        _append_data(cnotdihedral_interleaved_circ,
+                                     h_data[qb])
                     for qind, qb in enumerate(qlist_flat):
                         cnotdihedral_circ.measure(qr[qb], cr[qind])
                         cnotdihedral_interleaved_circ.measure(qr[qb], cr[qind])
@@ -536,32 +902,84 @@ def randomized_benchmarking_seq(nseeds: int = 1,
                         rb_circ_type + '_interleaved_X_length_%d_seed_%d' % \
                         (length_index, seed + seed_offset)
 
-                circuits[seed].append(circ)
-                circuits_interleaved[seed].append(circ_interleaved)
-                circuits_cnotdihedral[seed].append(cnotdihedral_circ)
-                circuits_cnotdihedral_interleaved[seed].append(
+                circuits.append(circ)
+                circuits_interleaved.append(circ_interleaved)
+                circuits_cnotdihedral.append(cnotdihedral_circ)
+                circuits_cnotdihedral_interleaved.append(
                     cnotdihedral_interleaved_circ)
 
                 if is_purity:
                     for d in range(npurity):
-                        circuits_purity[seed][d].append(circ_purity[d])
+                        circuits_purity[d].append(circ_purity[d])
                 length_index += 1
 
-    # output of purity rb
-    if is_purity:
-        return circuits_purity, xdata, npurity
-    # output of non-clifford cnot-dihedral interleaved rb
-    if interleaved_gates is not None and group_gates_type == 1:
-        return circuits, xdata, circuits_cnotdihedral, circuits_interleaved, \
-               circuits_cnotdihedral_interleaved
-    # output of interleaved rb
-    if interleaved_gates is not None:
-        return circuits, xdata, circuits_interleaved
-    # output of Non-Clifford cnot-dihedral rb
-    if group_gates_type == 1:
-        return circuits, xdata, circuits_cnotdihedral
-    # output of standard (simultaneous) rb
-    return circuits, xdata
+        yield (circuits, circuits_interleaved, circuits_cnotdihedral,
+               circuits_cnotdihedral_interleaved, circuits_purity)
+
+
+def find_inverse_gatelist(g_utils, group_table, elmnt, num_qubits):
+    """
+    Return the list of gates of the inverse of a group element.
+
+    Args:
+        g_utils (BasicUtils): the utils class of the group.
+        group_table (CliffordGroup or dict or None): the group table. The
+            Clifford group elements are integer indices in a
+            :class:`CliffordGroup`, or :class:`Clifford` tableaus for more
+            than 2 qubits (with no group table).
+        elmnt (int or Clifford or CNOTDihedral): the group element.
+        num_qubits (int): the number of qubits (dimension).
+
+    Returns:
+        list: A list of gates of the inverse element.
+    """
+    if isinstance(group_table, CliffordGroup):
+        return group_table.inverse_gatelist(elmnt)
+    if group_table is None:
+        return g_utils.find_inverse_clifford_gates(elmnt)
+    inv_key = g_utils.find_key(elmnt, num_qubits)
+    return g_utils.find_inverse_gates(num_qubits, group_table[inv_key])
+
+
+def clifford_instructions(num_qubits, basis_gates=None, inverse=False):
+    """
+    Return the instructions of all the elements of the Clifford group of
+    1 or 2 qubits, as they are appended to the RB sequences.
+
+    The instructions are taken from (and added to) the same process-wide
+    cache as those of :func:`randomized_benchmarking_seq`, so each element
+    is converted (and transpiled to ``basis_gates``) only once.
+
+    Args:
+        num_qubits (int): the number of qubits, 1 or 2.
+        basis_gates (list): if not ``None``, the instructions are in
+            these basis gates, as with the ``basis_gates`` argument of
+            :func:`randomized_benchmarking_seq`.
+        inverse (bool): return the instructions of the inverses of
+            the elements.
+
+    Returns:
+        list: for the index of each element in the :class:`CliffordGroup`,
+        a list of ``(instruction, qargs, cargs)`` tuples where ``qargs``
+        are the positions ``0, ..., num_qubits - 1`` of the qubits.
+
+    Raises:
+        QiskitError: if the number of qubits is not 1 or 2.
+    """
+    if num_qubits not in (1, 2):
+        raise qiskit.QiskitError("Only the Clifford groups of 1 and 2 "
+                                 "qubits are cached.")
+    group = _load_group_tables(clutils(), 0, num_qubits)[num_qubits - 1]
+    templates = _templates_table(basis_gates)
+    qubits = list(range(num_qubits))
+    instructions = []
+    for idx in range(group.size):
+        gatelist = group.inverse_gatelist(idx) if inverse \
+            else group.gatelist(idx)
+        instructions.append(_template_data(
+            templates, _element_key(True, num_qubits, idx, gatelist, inverse),
+            gatelist, qubits, basis_gates))
+    return instructions
 
 
 def replace_q_indices(circuit, q_nums, qr):
@@ -578,14 +996,169 @@ def replace_q_indices(circuit, q_nums, qr):
         QuantumCircuit: updated circuit
     """
 
-    new_circuit = qiskit.QuantumCircuit(qr)
-    for instr, qargs, cargs in circuit.data:
-        new_qargs = [
-            qr[q_nums[x]] for x in [arg.index for arg in qargs]]
-        new_op = copy.deepcopy((instr, new_qargs, cargs))
-        new_circuit.data.append(new_op)
+    return _append_data(qiskit.QuantumCircuit(qr),
+                        _map_q_indices(circuit, q_nums, qr))
+
+
+def _map_q_indices(circuit, q_nums, qr):
+    """
+    Return the instructions of a circuit that is ordered from 0,1,2 qubits,
+    with the qubit i replaced by the qubit ``qr[q_nums[i]]``.
+    The operations are not copied.
+
+    Args:
+        circuit (QuantumCircuit): circuit to operate on
+        q_nums (list): list of qubit indices
+        qr (QuantumRegister): the quantum register of the new qubits
+
+    Returns:
+        list: a list of ``(instruction, qargs, cargs)`` tuples.
+    """
+    qubit_indices = {qubit: index
+                     for index, qubit in enumerate(circuit.qubits)}
+    return [(instr, [qr[q_nums[qubit_indices[arg]]] for arg in qargs], cargs)
+            for instr, qargs, cargs in circuit.data]
+
+
+# The purity rotations rx(pi/2) and ry(pi/2) as Clifford gates (up to
+# a global phase), for the circuits in basis gates
+_PURITY_GATES = {'rx': ['h 0', 's 0', 'h 0'],
+                 'ry': ['sdg 0', 'h 0', 's 0', 'h 0', 's 0']}
+
+
+def _element_key(indexed, num_qubits, elmnt, gatelist, inverse=False):
+    """
+    Return the key of the instructions of a group element (or of its
+    inverse) in the templates of :func:`_template_data`.
+
+    The elements of a :class:`CliffordGroup` are keyed by their index,
+    and the other elements of 1 and 2 qubits by their gates. The elements
+    of more than 2 qubits are rarely repeated, and are not cached.
+    """
+    if indexed:
+        return ('clifford', num_qubits, inverse, elmnt)
+    if num_qubits <= 2:
+        return ('gates', num_qubits, tuple(gatelist))
+    return None
+
 
-    return new_circuit
+def _template_data(templates, key, gatelist, qubits, basis_gates=None):
+    """
+    Return the instructions of a list of gates on the given qubits.
+
+    The gates are converted to instructions (by :func:`_gates_template`)
+    once per ``key``, and stored in ``templates`` with the positions of
+    their qubits, so that later calls only map the positions to ``qubits``.
+    The operations are shared by all the calls. If ``key`` is ``None``
+    the list of instructions is not cached.
+
+    Args:
+        templates (dict): the cache of the instructions, by key. The
+            RB sequences use the process-wide table of
+            :func:`_templates_table`.
+        key (tuple): the key of the gates, e.g. from :func:`_element_key`.
+        gatelist (list): a list of gates.
+        qubits (list): the qubits of the gates, in order.
+        basis_gates (list): if not ``None``, the instructions are in
+            these basis gates. The templates must be those of this basis.
+
+    Returns:
+        list: a list of ``(instruction, qargs, cargs)`` tuples.
+    """
+    template = templates.get(key) if key is not None else None
+    if template is None:
+        template = _gates_template(templates, gatelist, len(qubits),
+                                   basis_gates)
+        if key is not None:
+            templates[key] = template
+    return [(instr, [qubits[pos] for pos in qargs], cargs)
+            for instr, qargs, cargs in template]
+
+
+def _templates_table(basis_gates=None):
+    """Return the process-wide templates of :func:`_template_data`
+    for the given basis gates."""
+    name = 'rb_templates'
+    if basis_gates is not None:
+        name += '_' + '_'.join(basis_gates)
+    return get_group_table(name, dict)
+
+
+def _gates_template(templates, gatelist, num_qubits, basis_gates):
+    """
+    Return the instructions of a list of gates, with the positions of
+    their qubits.
+
+    The instructions of each gate are converted once and cached in
+    ``templates``, so that a new list only concatenates them. With
+    ``basis_gates``, each multi-qubit gate and each maximal run of
+    1-qubit gates on a qubit are transpiled once to the basis instead,
+    with ``optimization_level=1`` which merges the gates of a run as a
+    full transpilation would.
+    """
+    def piece(gates, piece_qubits):
+        # the cached template of gates that act on piece_qubits
+        gates = tuple(gates)
+        if ('piece', gates) not in templates:
+            circuit = get_quantum_circuit(list(gates), piece_qubits)
+            if basis_gates is not None:
+                circuit = qiskit.transpile(circuit, basis_gates=basis_gates,
+                                           optimization_level=1)
+            positions = {qubit: pos
+                         for pos, qubit in enumerate(circuit.qubits)}
+            templates[('piece', gates)] = [
+                (instr, [positions[arg] for arg in qargs], cargs)
+                for instr, qargs, cargs in circuit.data]
+        return templates[('piece', gates)]
+
+    def run(qubit):
+        # the 1-qubit gates are cached on qubit 0, the last argument
+        gates = [' '.join(gate.split()[:-1] + ['0'])
+                 for gate in runs.pop(qubit, [])]
+        return [(instr, [qubit], cargs)
+                for instr, _, cargs in piece(gates, 1)] if gates else []
+
+    template = []
+    runs = {}
+    for gate in gatelist:
+        split = gate.split()
+        if basis_gates is None:
+            template.extend(piece([gate], num_qubits))
+        elif split[0] == 'u1' or len(split) == 2:
+            runs.setdefault(int(split[-1]), []).append(gate)
+        else:
+            gate_qubits = [int(q) for q in split[1:]]
+            for qubit in gate_qubits:
+                template.extend(run(qubit))
+            template.extend(piece([gate], max(gate_qubits) + 1))
+    for qubit in sorted(runs):
+        template.extend(run(qubit))
+    return template
+
+
+def _barrier_data(qr, q_nums):
+    """Return a barrier instruction on the qubits ``qr[q_nums]``."""
+    circuit = qiskit.QuantumCircuit(qr)
+    circuit.barrier(*[qr[x] for x in q_nums])
+    instr, qargs, cargs = circuit.data[0]
+    return instr, list(qargs), list(cargs)
+
+
+def _append_data(circuit, data):
+    """
+    Append a list of instructions to a circuit, without copying them.
+
+    Args:
+        circuit (QuantumCircuit): the circuit, which has all the
+            qubits and clbits of the instructions.
+        data (list): a list of ``(instruction, qargs, cargs)`` tuples.
+
+    Returns:
+        QuantumCircuit: the circuit.
+    """
+    for instr, qargs, cargs in data:
+        circuit._append(instr, qargs, cargs)
+    return circuit
 
 
 def get_quantum_circuit(gatelist, num_qubits):
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=invalid-name
+
+"""
+Integer-indexed 1 and 2-qubit Clifford groups for randomized benchmarking.
+"""
+
+import numpy as np
+from .Clifford import Clifford, _CliffordStack
+from .clifford_utils import CliffordUtils
+
+
+class CliffordGroup:
+    """The 1 or 2-qubit Clifford group with integer-indexed elements.
+
+    The element with index ``idx`` is the Clifford given by the gates
+    ``CliffordUtils().clifford1_gates(idx)`` for 1 qubit
+    (``clifford2_gates`` for 2 qubits), which apply a symplectic part
+    ``idx // 4**n`` followed by a Pauli ``idx % 4**n``.
+
+    The group product is stored in factored form: a multiplication
+    table of the symplectic parts and a table of the conjugation of the
+    Paulis by the symplectic parts (for 1 qubit the full multiplication
+    table is stored as well). Together with precomputed arrays of the
+    inverses and of the gate lists, composing and inverting elements are
+    array lookups instead of tableau simulations.
+    """
+
+    def __init__(self, num_qubits):
+        """
+        Args:
+            num_qubits (int): the number of qubits (1 or 2).
+
+        Raises:
+            ValueError: number of qubits bigger than 2 is
+                not supported.
+        """
+        utils = CliffordUtils()
+        if num_qubits == 1:
+            self._size = 24
+            gates_fn = utils.clifford1_gates
+        elif num_qubits == 2:
+            self._size = 11520
+            gates_fn = utils.clifford2_gates
+        else:
+            raise ValueError("The number of qubits should be only 1 or 2")
+
+        self._num_qubits = num_qubits
+        self._num_paulis = 4 ** num_qubits
+        self._num_symp = self._size // self._num_paulis
+
+        # Gate lists of the elements and of their inverses
+        self._gatelists = [gates_fn(idx) for idx in range(self._size)]
+        self._inverse_gatelists = [
+            utils.find_inverse_gates(num_qubits, gatelist)
+            for gatelist in self._gatelists]
+
+        # Simulate all the elements at once to get their keys
+        # (the Clifford.index of their tableau)
+        table, phases = self._apply_gates(
+            np.tile(Clifford(num_qubits).table, (self._size, 1, 1)),
+            np.zeros((self._size, 2 * num_qubits), dtype=bool),
+            self._gatelists)
+        self._keys = self._table_keys(table, phases)
+        self._key_order = np.argsort(self._keys)
+        self._key_to_index = {int(key): idx
+                              for idx, key in enumerate(self._keys)}
+
+        # Action of every gate in the gate lists on all the elements
+        gate_tables = {}
+        for op in sorted({op for gates in self._gatelists for op in gates}):
+            gate_tables[op] = self._find_indices(
+                *self._apply_gates(table.copy(), phases.copy(), [[op]]))
+
+        def apply(indices, gatelist):
+            for op in gatelist:
+                indices = gate_tables[op][indices]
+            return indices
+
+        # Product of symplectic parts: _symp_mult[s1, s2] is the index of
+        # the symplectic part s1 followed by the symplectic part s2.
+        # Conjugation of Paulis: the Pauli p followed by the symplectic
+        # part s equals s followed by the Pauli _pauli_conj[s, p].
+        num_paulis = self._num_paulis
+        symp_reps = num_paulis * np.arange(self._num_symp)
+        self._symp_mult = np.empty((self._num_symp, self._num_symp),
+                                   dtype=int)
+        self._pauli_conj = np.empty((self._num_symp, num_paulis),
+                                    dtype=int)
+        for symp in range(self._num_symp):
+            symp_gates = self._gatelists[num_paulis * symp]
+            self._symp_mult[:, symp] = apply(symp_reps, symp_gates)
+            self._pauli_conj[symp] = apply(np.arange(num_paulis),
+                                           symp_gates) % num_paulis
+
+        # Nested lists for fast lookups of single elements
+        self._symp_mult_list = self._symp_mult.tolist()
+        self._pauli_conj_list = self._pauli_conj.tolist()
+
+        # Full multiplication table for 1 qubit
+        self._mult = None
+        self._mult_list = None
+        if num_qubits == 1:
+            idx = np.arange(self._size)
+            self._mult = self.compose(idx[:, np.newaxis], idx[np.newaxis, :])
+            self._mult_list = self._mult.tolist()
+
+        # Inverses: find the inverse symplectic part and then fix the Pauli
+        symp_inv = np.argmax(self._symp_mult < num_paulis, axis=1)
+        symp, pauli = np.divmod(np.arange(self._size), num_paulis)
+        prod_pauli = self._symp_mult[symp, symp_inv[symp]] % num_paulis
+        self._inverse = num_paulis * symp_inv[symp] + (
+            prod_pauli ^ self._pauli_conj[symp_inv[symp], pauli])
+
+    @staticmethod
+    def _apply_gates(table, phases, gatelists):
+        """Apply a gate list to each table in a stack of tables."""
+        for step in range(max(len(gates) for gates in gatelists)):
+            stacks = {}
+            for idx, gates in enumerate(gatelists):
+                if step < len(gates):
+                    stacks.setdefault(gates[step], []).append(idx)
+            if len(gatelists) == 1:
+                stacks = {op: slice(None) for op in stacks}
+            for op, idx in stacks.items():
+                split = op.split()
+                stack = _CliffordStack(table[idx], phases[idx])
+                getattr(stack, split[0])(*[int(q) for q in split[1:]])
+                table[idx] = stack.table
+                phases[idx] = stack.phases
+        return table, phases
+
+    @staticmethod
+    def _table_keys(table, phases):
+        """Return the Clifford.index of each table in a stack of tables."""
+        bits = np.concatenate((table.reshape(len(table), -1), phases),
+                              axis=1).astype(np.int64)
+        return bits @ (1 << np.arange(bits.shape[1] - 1, -1, -1))
+
+    def _find_indices(self, table, phases):
+        """Return the element index of each table in a stack of tables."""
+        keys = self._table_keys(table, phases)
+        pos = np.searchsorted(self._keys, keys, sorter=self._key_order)
+        return self._key_order[pos]
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits."""
+        return self._num_qubits
+
+    @property
+    def size(self):
+        """Return the number of elements of the group."""
+        return self._size
+
+    @property
+    def keys(self):
+        """Return the array of the Clifford.index of the elements."""
+        return self._keys
+
+    def compose(self, idx1, idx2):
+        """
+        Compose two group elements.
+
+        Args:
+            idx1 (int or array): index of the first element.
+            idx2 (int or array): index of the element applied after it.
+
+        Returns:
+            int or array: the index of the element ``idx1``
+            followed by ``idx2``.
+        """
+        num_paulis = self._num_paulis
+        if isinstance(idx1, int) and isinstance(idx2, int):
+            if self._mult_list is not None:
+                return self._mult_list[idx1][idx2]
+            symp1, pauli1 = divmod(idx1, num_paulis)
+            symp2, pauli2 = divmod(idx2, num_paulis)
+            prod = self._symp_mult_list[symp1][symp2]
+            prod_pauli = prod % num_paulis
+            return prod - prod_pauli + (
+                prod_pauli ^ self._pauli_conj_list[symp2][pauli1] ^ pauli2)
+        if self._mult is not None:
+            return self._mult[idx1, idx2]
+        symp1, pauli1 = np.divmod(idx1, num_paulis)
+        symp2, pauli2 = np.divmod(idx2, num_paulis)
+        prod = self._symp_mult[symp1, symp2]
+        prod_pauli = prod % num_paulis
+        return prod - prod_pauli + (
+            prod_pauli ^ self._pauli_conj[symp2, pauli1] ^ pauli2)
+
+    def inverse(self, idx):
+        """Return the index of the inverse of an element."""
+        if isinstance(idx, int):
+            return int(self._inverse[idx])
+        return self._inverse[idx]
+
+    def gatelist(self, idx):
+        """Return the list of gates of an element."""
+        return self._gatelists[idx]
+
+    def inverse_gatelist(self, idx):
+        """Return the list of gates of the inverse of an element,
+        as given by ``CliffordUtils.find_inverse_gates``."""
+        return self._inverse_gatelists[idx]
+
+    def index(self, clifford):
+        """Return the index of a Clifford object."""
+        return self._key_to_index[clifford.index()]
+
+    def index_from_gates(self, gatelist):
+        """Return the index of the element given by a list of gates."""
+        return self.index(CliffordUtils().clifford_from_gates(
+            self._num_qubits, gatelist))
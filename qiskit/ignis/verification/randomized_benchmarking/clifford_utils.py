@@ -22,8 +22,11 @@
 """Advanced Clifford operations needed for randomized benchmarking."""
 
 import numpy as np
-from .Clifford import Clifford
+from .Clifford import Clifford, _CliffordStack
+from .packed_clifford import PackedClifford
 from .basic_utils import BasicUtils
+from .group_tables import get_group_table
+from .binary_tables import load_binary_table, CLIFFORD_TABLE
 
 try:
     import cPickle as pickle
@@ -34,8 +37,14 @@ except ImportError:
 class CliffordUtils(BasicUtils):
     """Class for util functions for the Clifford group."""
 
+    # Gates that can be composed into a Clifford object
+    _gate_names = ('x', 'y', 'z', 'h', 's', 'sdg', 'v', 'w',
+                   'cx', 'cz', 'swap')
+    # The gates whose inverse is another gate
+    _inverse_names = {'s': 'sdg', 'sdg': 's', 'v': 'w', 'w': 'v'}
+
     def __init__(self, num_qubits=2, group_tables=None, elmnt=None,
-                 gatelist=None, elmnt_key=None):
+                 gatelist=None, elmnt_key=None, packed=False):
         """
         Args:
             num_qubits (int): number of qubits, dimension of
@@ -46,6 +55,10 @@ class CliffordUtils(BasicUtils):
             elmnt_key (str): a unique index of a Clifford object.
             gatelist (list): a list of gates corresponding to a
                 Clifford object.
+            packed (bool): if True, new Clifford objects use the
+                bit-packed :class:`PackedClifford` tableau instead of
+                :class:`Clifford` (default is False). Both give the same
+                tables and indices.
         """
 
         self._num_qubits = num_qubits
@@ -53,6 +66,7 @@ class CliffordUtils(BasicUtils):
         self._elmnt = elmnt
         self._elmnt_key = elmnt_key
         self._gatelist = gatelist
+        self._clifford_class = PackedClifford if packed else Clifford
 
     def num_qubits(self):
         """Return the number of qubits of the Clifford object."""
@@ -95,27 +109,9 @@ class CliffordUtils(BasicUtils):
 
         for op in gatelist:
             split = op.split()
-            q1 = int(split[1])
-            if split[0] == 'v':
-                cliff.v(q1)
-            elif split[0] == 'w':
-                cliff.w(q1)
-            elif split[0] == 'x':
-                cliff.x(q1)
-            elif split[0] == 'y':
-                cliff.y(q1)
-            elif split[0] == 'z':
-                cliff.z(q1)
-            elif split[0] == 'cx':
-                cliff.cx(q1, int(split[2]))
-            elif split[0] == 'h':
-                cliff.h(q1)
-            elif split[0] == 's':
-                cliff.s(q1)
-            elif split[0] == 'sdg':
-                cliff.sdg(q1)
-            else:
+            if split[0] not in self._gate_names:
                 raise ValueError("Unknown gate type: ", op)
+            getattr(cliff, split[0])(*[int(q) for q in split[1:]])
 
         self._gatelist = gatelist
         self._elmnt = cliff
@@ -134,7 +130,7 @@ class CliffordUtils(BasicUtils):
             the given list of gates.
         """
 
-        cliff = Clifford(num_qubits)
+        cliff = self._clifford_class(num_qubits)
         new_cliff = self.compose_gates(cliff, gatelist)
         return new_cliff
 
@@ -442,30 +438,24 @@ class CliffordUtils(BasicUtils):
         """
 
         # load the clifford tables, but only if we're using that particular
-        # num_qubits
+        # num_qubits. The tables are cached for the whole process.
         if num_qubits == 1:
             # 1Q Cliffords, load table programmatically
-            clifford_tables = self.clifford1_gates_table()
+            clifford_tables = get_group_table(
+                'cliffords1', self.clifford1_gates_table)
 
         elif num_qubits == 2:
             # 2Q Cliffords
-            # Try to load the table in from file. If it doesn't exist then make
-            # the file
-            try:
-                clifford_tables = self.load_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits)
-            except (OSError, EOFError):
-                # table doesn't exist, so save it
-                # this will save time next run
+            # Try to load the table in from file. If it doesn't exist then
+            # make the file
+            def make_table():
                 print('Making the n=%d Clifford Table' % num_qubits)
-                self.pickle_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits,
-                    num_qubits=num_qubits)
-                clifford_tables = self.load_clifford_table(
-                    picklefile='cliffords%d.pickle' % num_qubits)
-            except pickle.UnpicklingError:
-                # handle error
-                clifford_tables = self.clifford2_gates_table()
+                return self.clifford2_gates_table()
+
+            clifford_tables = get_group_table(
+                'cliffords2', lambda: load_binary_table(
+                    'cliffords%d.bin' % num_qubits, CLIFFORD_TABLE, num_qubits,
+                    make_table))
 
         else:
             raise ValueError("The number of qubits should be only 1 or 2")
@@ -473,23 +463,83 @@ class CliffordUtils(BasicUtils):
         self._group_tables = clifford_tables
         return clifford_tables
 
+    # --------------------------------------------------------
+    # Create a random Clifford on any number of qubits
+    # --------------------------------------------------------
+    def random_clifford_gates(self, num_qubits, rng=None):
+        """
+        Pick a uniformly random Clifford gate on num_qubits, without
+        enumerating the Clifford group.
+
+        A Clifford is fixed (up to a Pauli) by the images of ``X_i`` and
+        ``Z_i``, which are anticommuting Paulis that commute with the
+        images of the other qubits. The images are drawn qubit by qubit:
+        for qubit ``i`` a uniformly random pair of anticommuting Paulis on
+        the qubits ``i, ..., n-1`` is drawn, and the gates that map
+        ``X_i`` and ``Z_i`` to this pair are synthesized on these qubits.
+        The gates are followed by a uniformly random Pauli. This takes
+        ``O(n^3)`` time and gives ``O(n^2)`` gates.
+
+        Args:
+            num_qubits (int): dimension of the Clifford.
+            rng (numpy.random.Generator): a random number generator to
+                draw from instead of the global ``numpy.random`` state
+
+        Returns:
+            list: A random Clifford gate, with ``h``, ``s``, ``sdg``,
+            ``cx``, ``swap`` and Pauli gates.
+        """
+
+        randint = np.random.randint if rng is None else rng.integers
+        gatelist = []
+        for qubit in range(num_qubits):
+            size = num_qubits - qubit
+            # a random non-identity Pauli, as (z, x) bits
+            destab = np.zeros(2 * size, dtype=bool)
+            while not destab.any():
+                destab = randint(2, size=2 * size).astype(bool)
+            # a random Pauli that anticommutes with it
+            while True:
+                stab = randint(2, size=2 * size).astype(bool)
+                overlap = np.count_nonzero(destab[:size] & stab[size:]) + \
+                    np.count_nonzero(destab[size:] & stab[:size])
+                if overlap % 2:
+                    break
+
+            rows = np.zeros((2, 2 * num_qubits), dtype=bool)
+            rows[:, qubit:num_qubits] = [destab[:size], stab[:size]]
+            rows[:, num_qubits + qubit:] = [destab[size:], stab[size:]]
+            reduction = []
+            _reduce_qubit(_CliffordStack(rows, np.zeros(2, dtype=bool)),
+                          qubit, 0, 1, reduction)
+            # the gates of the later qubits are applied first
+            gatelist = self.find_inverse_gates(num_qubits, reduction) + \
+                gatelist
+
+        for qubit, pauli in enumerate(randint(4, size=num_qubits)):
+            self.pauli_gates(gatelist, qubit, pauli)
+
+        self._gatelist = gatelist
+        return gatelist
+
     # --------------------------------------------------------
     # Main function that generates a random clifford gate
     # --------------------------------------------------------
-    def random_gates(self, num_qubits, rand_seed=None):
+    def random_gates(self, num_qubits, rand_seed=None, rng=None):
         """
         Pick a random Clifford gate on num_qubits.
 
         Args:
             num_qubits (int): dimension of the Clifford.
-            rand_seed (int): seed for the random number generator
+            rand_seed (int): seed for the global random number generator
+            rng (numpy.random.Generator): a random number generator to
+                draw from instead of the global ``numpy.random`` state
 
         Returns:
-            list: A 1 or 2 qubit random Clifford gate.
+            list: A random Clifford gate. For more than 2 qubits it is
+            drawn by :meth:`random_clifford_gates`.
 
         Raises:
-            ValueError: number of qubits bigger than 2 is
-                not supported.
             TypeError: If rand_seed is not an integer
         """
         if rand_seed is not None:
@@ -498,11 +548,21 @@ class CliffordUtils(BasicUtils):
             np.random.seed(rand_seed)
 
         if num_qubits == 1:
-            cliff_gatelist = self.clifford1_gates(np.random.randint(0, 24))
+            size = 24
+            gates_fn = self.clifford1_gates
         elif num_qubits == 2:
-            cliff_gatelist = self.clifford2_gates(np.random.randint(0, 11520))
+            size = 11520
+            gates_fn = self.clifford2_gates
         else:
-            raise ValueError("The number of qubits should be only 1 or 2")
+            # the group is too large to be indexed by a table
+            cliff_gatelist = self.random_clifford_gates(num_qubits, rng=rng)
+            self._gatelist = cliff_gatelist
+            return cliff_gatelist
+
+        if rng is None:
+            cliff_gatelist = gates_fn(np.random.randint(0, size))
+        else:
+            cliff_gatelist = gates_fn(int(rng.integers(size)))
 
         self._gatelist = cliff_gatelist
         return cliff_gatelist
@@ -520,24 +580,63 @@ class CliffordUtils(BasicUtils):
 
         Returns:
             list: An inverse Clifford gate.
+        """
 
-        Raises:
-            ValueError: number of qubits bigger than 2 is
-                not supported.
+        inv_gatelist = gatelist.copy()
+        inv_gatelist.reverse()
+        # replace v by w, s by sdg and vice versa
+        for i, _ in enumerate(inv_gatelist):
+            split = inv_gatelist[i].split()
+            if split[0] in self._inverse_names:
+                inv_gatelist[i] = ' '.join(
+                    [self._inverse_names[split[0]]] + split[1:])
+        return inv_gatelist
+
+    def find_inverse_clifford_gates(self, cliff):
+        """
+        Find a gate of the inverse of a Clifford object.
+
+        The gate is synthesized from the tableau of the Clifford by
+        Gaussian elimination, in ``O(n^3)`` time, so it does not need the
+        group tables and works for any number of qubits.
+
+        Args:
+            cliff (Clifford): a Clifford object.
+
+        Returns:
+            list: A gate of the inverse of the Clifford, with
+            ``O(n^2)`` ``h``, ``s``, ``cx``, ``swap`` and Pauli gates.
         """
 
-        if num_qubits in (1, 2):
-            inv_gatelist = gatelist.copy()
-            inv_gatelist.reverse()
-            # replace v by w and w by v
-            for i, _ in enumerate(inv_gatelist):
-                split = inv_gatelist[i].split()
-                if split[0] == 'v':
-                    inv_gatelist[i] = 'w ' + split[1]
-                elif split[0] == 'w':
-                    inv_gatelist[i] = 'v ' + split[1]
-            return inv_gatelist
-        raise ValueError("The number of qubits should be only 1 or 2")
+        num_qubits = cliff.num_qubits
+        tableau = _CliffordStack(np.array(cliff.table, dtype=bool),
+                                 np.array(cliff.phases, dtype=bool))
+        gatelist = []
+        # the gates that map the tableau to the identity are its inverse
+        for qubit in range(num_qubits):
+            _reduce_qubit(tableau, qubit, qubit, num_qubits + qubit, gatelist)
+        for qubit in range(num_qubits):
+            # Z flips the sign of X_qubit and X the sign of Z_qubit
+            if tableau.phases[qubit]:
+                _apply_gate(tableau, gatelist, 'z', qubit)
+            if tableau.phases[num_qubits + qubit]:
+                _apply_gate(tableau, gatelist, 'x', qubit)
+        return gatelist
+
+    def clifford_gates(self, cliff):
+        """
+        Synthesize a gate of a Clifford object.
+
+        Args:
+            cliff (Clifford): a Clifford object.
+
+        Returns:
+            list: A gate of the Clifford, see
+            :meth:`find_inverse_clifford_gates`.
+        """
+
+        return self.find_inverse_gates(
+            cliff.num_qubits, self.find_inverse_clifford_gates(cliff))
 
     def find_key(self, cliff, num_qubits):
         """
@@ -551,7 +650,54 @@ class CliffordUtils(BasicUtils):
             int: An integer which is the Clifford index in the group table.
         """
 
+        # the tables are cached, so this does not read the table file
         G_table = self.load_tables(num_qubits)
         assert cliff.index() in G_table, \
             "inverse not found in lookup table!\n%s" % cliff
         return cliff.index()
+
+
+def _apply_gate(tableau, gatelist, name, *qubits):
+    """Apply a gate to a tableau and append it to a list of gates."""
+    getattr(tableau, name)(*qubits)
+    gatelist.append(' '.join([name] + [str(q) for q in qubits]))
+
+
+def _reduce_qubit(tableau, qubit, destab, stab, gatelist):
+    """Map two rows of a tableau to ``X_qubit`` and ``Z_qubit``.
+
+    The rows ``destab`` and ``stab`` must be anticommuting Paulis
+    without support on the qubits before ``qubit``. The gates, which
+    act on ``qubit`` and the qubits after it, are applied to the
+    tableau and appended to ``gatelist``. The signs of the rows are
+    not reduced.
+    """
+    num_qubits = tableau.num_qubits
+    table = tableau.table
+
+    # map the destabilizer to a product of X's
+    for q in range(qubit, num_qubits):
+        if table[destab, q]:
+            _apply_gate(tableau, gatelist,
+                        's' if table[destab, num_qubits + q] else 'h', q)
+    support = [q for q in range(qubit, num_qubits)
+               if table[destab, num_qubits + q]]
+    if support[0] != qubit:
+        _apply_gate(tableau, gatelist, 'swap', qubit, support[0])
+        support[0] = qubit
+    # and to X_qubit
+    for q in support[1:]:
+        _apply_gate(tableau, gatelist, 'cx', qubit, q)
+
+    # the stabilizer is now Z or Y on qubit, map Y to Z keeping X fixed
+    if table[stab, num_qubits + qubit]:
+        for name in ('h', 's', 'h'):
+            _apply_gate(tableau, gatelist, name, qubit)
+    # map the stabilizer on the other qubits to Z's, and clear them
+    for q in range(qubit + 1, num_qubits):
+        if table[stab, num_qubits + q]:
+            if table[stab, q]:
+                _apply_gate(tableau, gatelist, 's', q)
+            _apply_gate(tableau, gatelist, 'h', q)
+        if table[stab, q]:
+            _apply_gate(tableau, gatelist, 'cx', q, qubit)
@@ -34,10 +34,74 @@ Example:
  T^3 on qubit 0, T^3 on qubit 1, and CS_{0,1} BEFORE CNOT_{0,1}.
 """
 import itertools
-import copy
-from functools import reduce
+from functools import lru_cache, reduce
 from operator import mul
 
+import numpy as np
+
+# coefficients of the terms of degree 0, 1, 2, 3 of p_J (mod 8)
+_PJ_COEFFS = np.array([0, 1, 6, 4], dtype=np.uint8)
+
+
+@lru_cache(maxsize=None)
+def _poly_terms(n_vars):
+    """Return the terms of the special polynomials on n_vars variables.
+
+    Returns a tuple ``(terms, masks, degrees, index)``: the variables of
+    each term and their bitmask, in the order of the weights, the degree of
+    each term, and the index of the term of each bitmask (-1 for the
+    bitmasks of degree bigger than 3).
+    """
+    terms = [()]
+    for degree in (1, 2, 3):
+        terms += itertools.combinations(range(n_vars), degree)
+    masks = np.array([sum(1 << i for i in term) for term in terms],
+                     dtype=np.int64)
+    degrees = np.array([len(term) for term in terms], dtype=np.int64)
+    index = np.full(1 << n_vars, -1, dtype=np.int64)
+    index[masks] = np.arange(len(terms))
+    for array in (masks, degrees, index):
+        array.flags.writeable = False
+    return terms, masks, degrees, index
+
+
+@lru_cache(maxsize=None)
+def _points(n_vars):
+    """Return the (2^n_vars, n_vars) array of all the points of Z_2^n_vars,
+    where row x holds the bits of x."""
+    points = ((np.arange(1 << n_vars)[:, None] >> np.arange(n_vars)) & 1)
+    points = points.astype(np.uint8)
+    points.flags.writeable = False
+    return points
+
+
+@lru_cache(maxsize=None)
+def _pj_terms(n_vars, support):
+    """Return the indices of the terms of p_J, for the variables J in the
+    bitmask support, and their coefficients."""
+    _, masks, degrees, _ = _poly_terms(n_vars)
+    terms = np.flatnonzero(((masks & ~support) == 0) & (degrees > 0))
+    coeffs = _PJ_COEFFS[degrees[terms]]
+    terms.flags.writeable = False
+    coeffs.flags.writeable = False
+    return terms, coeffs
+
+
+def _subset_sums(values, n_vars, inverse=False):
+    """Sum values over all the subsets of each bitmask, mod 8.
+
+    The values are indexed by bitmasks of n_vars variables. With inverse,
+    compute the Moebius inversion instead (alternating sums).
+    """
+    values = values.copy()
+    for i in range(n_vars):
+        view = values.reshape(-1, 2, 1 << i)
+        if inverse:
+            view[:, 1] -= view[:, 0]
+        else:
+            view[:, 1] += view[:, 0]
+    return values % 8
+
 
 class SpecialPolynomial():
     """Multivariate polynomial with special form.
@@ -51,21 +115,70 @@ class SpecialPolynomial():
         #   n linear terms x_1, ..., x_n
         #   {n choose 2} quadratic terms x_1x_2, x_1x_3, ..., x_{n-1}x_n
         #   {n choose 3} cubic terms x_1x_2x_3, ..., x_{n-2}x_{n-1}x_n
-        # and coefficients in Z_8
+        # and coefficients in Z_8, packed in a single array
         assert n_vars >= 1, "n_vars too small!"
         self.n_vars = n_vars
         self.nc2 = int(n_vars * (n_vars-1) / 2)
         self.nc3 = int(n_vars * (n_vars-1) * (n_vars-2) / 6)
-        self.weight_0 = 0
-        self.weight_1 = n_vars * [0]
-        self.weight_2 = self.nc2 * [0]
-        self.weight_3 = self.nc3 * [0]
+        self.weights = np.zeros(1 + n_vars + self.nc2 + self.nc3,
+                                dtype=np.uint8)
 
-    def mul_monomial(self, indices):
-        """Multiply by a monomial given by indices.
+    @property
+    def weight_0(self):
+        """The constant term."""
+        return int(self.weights[0])
 
-        Returns the product.
-        """
+    @weight_0.setter
+    def weight_0(self, value):
+        self.weights[0] = value % 8
+
+    @property
+    def weight_1(self):
+        """The weights of the linear terms (a view of ``weights``)."""
+        return self.weights[1:1 + self.n_vars]
+
+    @weight_1.setter
+    def weight_1(self, value):
+        self.weights[1:1 + self.n_vars] = np.asarray(value) % 8
+
+    @property
+    def weight_2(self):
+        """The weights of the quadratic terms (a view of ``weights``)."""
+        return self.weights[1 + self.n_vars:1 + self.n_vars + self.nc2]
+
+    @weight_2.setter
+    def weight_2(self, value):
+        self.weights[1 + self.n_vars:1 + self.n_vars + self.nc2] = \
+            np.asarray(value) % 8
+
+    @property
+    def weight_3(self):
+        """The weights of the cubic terms (a view of ``weights``)."""
+        return self.weights[1 + self.n_vars + self.nc2:]
+
+    @weight_3.setter
+    def weight_3(self, value):
+        self.weights[1 + self.n_vars + self.nc2:] = np.asarray(value) % 8
+
+    def __setstate__(self, state):
+        # polynomials pickled by earlier versions hold lists of weights
+        state = dict(state)
+        if 'weights' not in state:
+            state['weights'] = np.array(
+                [state.pop('weight_0')] + list(state.pop('weight_1')) +
+                list(state.pop('weight_2')) + list(state.pop('weight_3')),
+                dtype=np.uint8)
+        self.__dict__.update(state)
+
+    def copy(self):
+        """Return a copy of the polynomial."""
+        result = SpecialPolynomial.__new__(SpecialPolynomial)
+        result.__dict__.update(self.__dict__)
+        result.weights = self.weights.copy()
+        return result
+
+    def _term_index(self, indices):
+        """Return the index in ``weights`` of the term of the variables."""
         length = len(indices)
         assert length < 4, "no term!"
         assert True not in [x < 0 or x >= self.n_vars for x in indices], \
@@ -73,51 +186,44 @@ class SpecialPolynomial():
         assert False not in [indices[i] < indices[i+1]
                              for i in range(length-1)], \
             "indices non-increasing!"
+        return int(_poly_terms(self.n_vars)[3][sum(1 << i for i in indices)])
+
+    def _add_terms(self, masks, values):
+        """Return the polynomial with the values added to the terms of
+        the bitmasks."""
+        index = _poly_terms(self.n_vars)[3][masks]
+        nonzero = values % 8 != 0
+        assert np.all(index[nonzero] >= 0), "no term!"
         result = SpecialPolynomial(self.n_vars)
-        if length == 0:
-            result = copy.deepcopy(self)
-        else:
-            terms0 = [[]]
-            terms1 = [[i] for i in range(self.n_vars)]
-            terms2 = [[i, j] for i in range(self.n_vars-1)
-                      for j in range(i+1, self.n_vars)]
-            terms3 = [[i, j, k] for i in range(self.n_vars-2)
-                      for j in range(i+1, self.n_vars-1)
-                      for k in range(j+1, self.n_vars)]
-            for term in terms0 + terms1 + terms2 + terms3:
-                value = self.get_term(term)
-                new_term = list(set(term).union(set(indices)))
-                result.set_term(new_term, (result.get_term(new_term) +
-                                           value) % 8)
+        np.add.at(result.weights, index[nonzero], values[nonzero])
+        result.weights %= 8
         return result
 
+    def mul_monomial(self, indices):
+        """Multiply by a monomial given by indices.
+
+        Returns the product.
+        """
+        self._term_index(indices)
+        if not indices:
+            return self.copy()
+        masks = _poly_terms(self.n_vars)[1]
+        return self._add_terms(masks | sum(1 << i for i in indices),
+                               self.weights)
+
     def __mul__(self, other):
         """Multiply two polynomials."""
         assert isinstance(other, (SpecialPolynomial, int)), \
             "other isn't poly or int!: %s" % str(other)
-        result = SpecialPolynomial(self.n_vars)
         if isinstance(other, int):
-            result.weight_0 = (self.weight_0 * other) % 8
-            result.weight_1 = [(x * other) % 8 for x in self.weight_1]
-            result.weight_2 = [(x * other) % 8 for x in self.weight_2]
-            result.weight_3 = [(x * other) % 8 for x in self.weight_3]
-        else:
-            assert self.n_vars == other.n_vars, "different n_vars!"
-            terms0 = [[]]
-            terms1 = [[i] for i in range(self.n_vars)]
-            terms2 = [[i, j] for i in range(self.n_vars-1)
-                      for j in range(i+1, self.n_vars)]
-            terms3 = [[i, j, k] for i in range(self.n_vars-2)
-                      for j in range(i+1, self.n_vars-1)
-                      for k in range(j+1, self.n_vars)]
-            for term in terms0 + terms1 + terms2 + terms3:
-                value = other.get_term(term)
-                if value != 0:
-                    temp = copy.deepcopy(self)
-                    temp = temp.mul_monomial(term)
-                    temp = temp * value
-                    result = result + temp
-        return result
+            result = SpecialPolynomial(self.n_vars)
+            result.weights = (self.weights * (other % 8)) % 8
+            return result
+        assert self.n_vars == other.n_vars, "different n_vars!"
+        masks = _poly_terms(self.n_vars)[1]
+        return self._add_terms(
+            (masks[:, None] | masks[None, :]).ravel(),
+            np.outer(self.weights, other.weights).ravel())
 
     def __rmul__(self, other):
         """Right multiplication.
@@ -131,13 +237,39 @@ class SpecialPolynomial():
         assert isinstance(other, SpecialPolynomial), "other isn't poly!"
         assert self.n_vars == other.n_vars, "different n_vars!"
         result = SpecialPolynomial(self.n_vars)
-        result.weight_0 = (self.weight_0 + other.weight_0) % 8
-        result.weight_1 = [(x[0] + x[1]) % 8
-                           for x in zip(self.weight_1, other.weight_1)]
-        result.weight_2 = [(x[0] + x[1]) % 8
-                           for x in zip(self.weight_2, other.weight_2)]
-        result.weight_3 = [(x[0] + x[1]) % 8
-                           for x in zip(self.weight_3, other.weight_3)]
+        result.weights = (self.weights + other.weights) % 8
+        return result
+
+    def values(self):
+        """Return the values of the polynomial at all the points.
+
+        Returns:
+            numpy.ndarray: the 2^n_vars values in Z_8, where the bits of
+            the index are the values of the variables.
+        """
+        masks = _poly_terms(self.n_vars)[1]
+        values = np.zeros(1 << self.n_vars, dtype=np.uint8)
+        values[masks] = self.weights
+        return _subset_sums(values, self.n_vars)
+
+    @classmethod
+    def from_values(cls, n_vars, values):
+        """Return the polynomial with the given values at all the points.
+
+        Args:
+            n_vars (int): the number of variables.
+            values (array): the 2^n_vars values in Z_8, where the bits of
+                the index are the values of the variables.
+
+        Returns:
+            SpecialPolynomial: the polynomial.
+        """
+        _, masks, _, index = _poly_terms(n_vars)
+        coeffs = _subset_sums(np.asarray(values, dtype=np.uint8), n_vars,
+                              inverse=True)
+        assert not np.any(coeffs[index < 0]), "no term!"
+        result = cls(n_vars)
+        result.weights = coeffs[masks]
         return result
 
     def evaluate(self, xval):
@@ -153,35 +285,21 @@ class SpecialPolynomial():
                               xval))
         assert False not in check_int or False not in check_poly, "wrong type!"
         is_int = (False not in check_int)
-        if not is_int:
-            assert False not in [i.n_vars == self.n_vars for i in xval], \
-                "incompatible polynomials!"
-        else:
-            xval = [x % 2 for x in xval]
-        # Examine each term of this polynomial
-        terms0 = [[]]
-        terms1 = [[i] for i in range(self.n_vars)]
-        terms2 = [[i, j] for i in range(self.n_vars-1)
-                  for j in range(i+1, self.n_vars)]
-        terms3 = [[i, j, k] for i in range(self.n_vars-2)
-                  for j in range(i+1, self.n_vars-1)
-                  for k in range(j+1, self.n_vars)]
-        # Set the initial result and start for each term
+        terms, masks, _, _ = _poly_terms(self.n_vars)
         if is_int:
-            result = 0
-            start = 1
-        else:
-            result = SpecialPolynomial(self.n_vars)
-            start = SpecialPolynomial(self.n_vars)
-            start.weight_0 = 1
+            # sum the terms whose variables are all 1
+            xmask = sum(1 << j for j, x in enumerate(xval) if x % 2)
+            return int(self.weights[(masks & ~xmask) == 0].sum()) % 8
+        assert False not in [i.n_vars == self.n_vars for i in xval], \
+            "incompatible polynomials!"
+        result = SpecialPolynomial(self.n_vars)
+        start = SpecialPolynomial(self.n_vars)
+        start.weight_0 = 1
         # Compute the new terms and accumulate
-        for term in terms0 + terms1 + terms2 + terms3:
-            value = self.get_term(term)
+        for term, value in zip(terms, self.weights.tolist()):
             if value != 0:
                 newterm = reduce(mul, [xval[j] for j in term], start)
                 result = result + value * newterm
-        if isinstance(result, int):
-            result = result % 8
         return result
 
     def set_pj(self, indices):
@@ -191,19 +309,10 @@ class SpecialPolynomial():
         """
         assert True not in [x < 0 or x >= self.n_vars for x in indices], \
             "indices out of bounds!"
-        indices = sorted(indices)
-        subsets_2 = itertools.combinations(indices, 2)
-        subsets_3 = itertools.combinations(indices, 3)
-        self.weight_0 = 0
-        self.weight_1 = self.n_vars * [0]
-        self.weight_2 = self.nc2 * [0]
-        self.weight_3 = self.nc3 * [0]
-        for j in indices:
-            self.set_term([j], 1)
-        for j in subsets_2:
-            self.set_term(list(j), 6)
-        for j in subsets_3:
-            self.set_term(list(j), 4)
+        terms, coeffs = _pj_terms(self.n_vars,
+                                  sum(1 << j for j in set(indices)))
+        self.weights = np.zeros_like(self.weights)
+        self.weights[terms] = coeffs
 
     def get_term(self, indices):
         """Get the value of a term given the list of variables.
@@ -217,34 +326,7 @@ class SpecialPolynomial():
         If the indices are out of bounds the method fails.
         If the indices are not increasing the method fails.
         """
-        length = len(indices)
-        assert length < 4, "no term!"
-        assert True not in [x < 0 or x >= self.n_vars for x in indices], \
-            "indices out of bounds!"
-        assert False not in [indices[i] < indices[i+1]
-                             for i in range(length-1)], \
-            "indices non-increasing!"
-        if length == 0:
-            return self.weight_0
-        if length == 1:
-            return self.weight_1[indices[0]]
-        if length == 2:
-            # sum(self.n_vars-j, {j, 1, indices[0]})
-            offset_1 = int(indices[0] * self.n_vars -
-                           ((indices[0] + 1) * indices[0])/2)
-            offset_2 = int(indices[1] - indices[0] - 1)
-            return self.weight_2[offset_1 + offset_2]
-
-        # sum({self.n_vars-j choose 2}, {j, 1, indices[0]})
-        offset_1 = int(indices[0] * (2 + indices[0]**2 - 3*indices[0] *
-                                     (self.n_vars - 1) -
-                                     6 * self.n_vars +
-                                     3 * self.n_vars**2)/6)
-        # sum(self.n_vars-j, {j, 2, indices[1]-indices[0]})
-        offset_2 = int((indices[1] - indices[0] - 1) *
-                       (2 * self.n_vars - indices[1] + indices[0] - 2)/2)
-        offset_3 = int(indices[2] - indices[1] - 1)
-        return self.weight_3[offset_1 + offset_2 + offset_3]
+        return int(self.weights[self._term_index(indices)])
 
     def set_term(self, indices, value):
         """Set the value of a term given the list of variables.
@@ -259,46 +341,23 @@ class SpecialPolynomial():
         If the indices are not increasing the method fails.
         The value is reduced modulo 8.
         """
-        length = len(indices)
-        assert length < 4, "no term!"
-        assert True not in [x < 0 or x >= self.n_vars for x in indices], \
-            "indices out of bounds!"
-        assert False not in [indices[i] < indices[i+1]
-                             for i in range(length-1)], \
-            "indices non-increasing!"
-        value = value % 8
-        if length == 0:
-            self.weight_0 = value
-        elif length == 1:
-            self.weight_1[indices[0]] = value
-        elif length == 2:
-            # sum(self.n_vars-j, {j, 1, indices[0]})
-            offset_1 = int(indices[0] * self.n_vars -
-                           ((indices[0] + 1) * indices[0])/2)
-            offset_2 = int(indices[1] - indices[0] - 1)
-            self.weight_2[offset_1 + offset_2] = value
-        else:
-            # sum({self.n_vars-j choose 2}, {j, 1, indices[0]})
-            offset_1 = int(indices[0] * (2 + indices[0]**2 - 3*indices[0] *
-                                         (self.n_vars - 1) -
-                                         6 * self.n_vars +
-                                         3 * self.n_vars**2)/6)
-            # sum(self.n_vars-j, {j, 2, indices[1]-indices[0]})
-            offset_2 = int((indices[1] - indices[0] - 1) *
-                           (2 * self.n_vars - indices[1] + indices[0] - 2)/2)
-            offset_3 = int(indices[2] - indices[1] - 1)
-            self.weight_3[offset_1 + offset_2 + offset_3] = value
+        self.weights[self._term_index(indices)] = value % 8
 
     @property
     def key(self):
         """Return a string representation."""
-        tup = (self.weight_0, tuple(self.weight_1),
-               tuple(self.weight_2), tuple(self.weight_3))
+        tup = (self.weight_0, tuple(self.weight_1.tolist()),
+               tuple(self.weight_2.tolist()), tuple(self.weight_3.tolist()))
         return str(tup)
 
     def __eq__(self, x):
         """Test equality."""
-        return isinstance(x, SpecialPolynomial) and self.key == x.key
+        return isinstance(x, SpecialPolynomial) and \
+            self.n_vars == x.n_vars and \
+            np.array_equal(self.weights, x.weights)
+
+    def __hash__(self):
+        return hash((self.n_vars, self.weights.tobytes()))
 
     def __str__(self):
         """Return formatted string representation."""
@@ -342,86 +401,79 @@ class CNOTDihedral():
         # phase polynomial
         self.poly = SpecialPolynomial(n_qubits)
         # n x n invertible matrix over Z_2
-        self.linear = [[int(r == c) for c in range(n_qubits)]
-                       for r in range(n_qubits)]
+        self.linear = np.eye(n_qubits, dtype=np.uint8)
         # binary shift, n coefficients in Z_2
-        self.shift = n_qubits * [0]
+        self.shift = np.zeros(n_qubits, dtype=np.uint8)
+
+    def __setstate__(self, state):
+        # elements pickled by earlier versions hold lists
+        state = dict(state)
+        state['linear'] = np.array(state['linear'], dtype=np.uint8)
+        state['shift'] = np.array(state['shift'], dtype=np.uint8)
+        self.__dict__.update(state)
+
+    def copy(self):
+        """Return a copy of the element."""
+        result = CNOTDihedral.__new__(CNOTDihedral)
+        result.n_qubits = self.n_qubits
+        result.poly = self.poly.copy()
+        result.linear = self.linear.copy()
+        result.shift = self.shift.copy()
+        return result
 
     def _z2matmul(self, left, right):
         """Compute product of two n x n z2 matrices."""
-        prod = [[0 for col in range(self.n_qubits)]
-                for row in range(self.n_qubits)]
-        for i in range(self.n_qubits):
-            for j in range(self.n_qubits):
-                for k in range(self.n_qubits):
-                    prod[i][j] = (prod[i][j] +
-                                  left[i][k]*right[k][j]) % 2
-        return prod
+        return np.dot(np.asarray(left, dtype=np.uint8),
+                      np.asarray(right, dtype=np.uint8)) % 2
 
     def _z2matvecmul(self, mat, vec):
         """Compute mat*vec of n x n z2 matrix and vector."""
-        prod = [0 for row in range(self.n_qubits)]
-        for i in range(self.n_qubits):
-            for j in range(self.n_qubits):
-                prod[i] = (prod[i] + mat[i][j] * vec[j]) % 2
-        return prod
+        return np.dot(np.asarray(mat, dtype=np.uint8),
+                      np.asarray(vec, dtype=np.uint8)) % 2
+
+    def _images(self):
+        """Return the index of the image B*x + c of each point x."""
+        images = (np.dot(_points(self.n_qubits), self.linear.T) +
+                  self.shift) % 2
+        return np.dot(images, 1 << np.arange(self.n_qubits))
 
     def __mul__(self, other):
         """Left multiplication self * other."""
         assert self.n_qubits == other.n_qubits, "not same n_qubits!"
         result = CNOTDihedral(self.n_qubits)
-        result.shift = [(x[0] + x[1]) % 2
-                        for x in zip(self._z2matvecmul(self.linear,
-                                                       other.shift),
-                                     self.shift)]
+        result.shift = (self._z2matvecmul(self.linear, other.shift) +
+                        self.shift) % 2
         result.linear = self._z2matmul(self.linear, other.linear)
-        # Compute x' = B1*x + c1 using the p_j identity
-        new_vars = []
-        for i in range(self.n_qubits):
-            support = [j for j, e in enumerate(other.linear[i]) if e != 0]
-            poly = SpecialPolynomial(self.n_qubits)
-            poly.set_pj(support)
-            if other.shift[i] == 1:
-                poly = -1 * poly
-                poly.weight_0 = (poly.weight_0 + 1) % 8
-            new_vars.append(poly)
-        # p' = p1 + p2(x')
-        result.poly = other.poly + self.poly.evaluate(new_vars)
+        # p'(x) = p2(x) + p1(B2*x + c2), on all the points x at once
+        result.poly = SpecialPolynomial.from_values(
+            self.n_qubits,
+            other.poly.values() + self.poly.values()[other._images()])
         return result
 
     def __rmul__(self, other):
         """Right multiplication other * self."""
-        assert self.n_qubits == other.n_qubits, "not same n_qubits!"
-        result = CNOTDihedral(self.n_qubits)
-        result.shift = [(x[0] + x[1]) % 2
-                        for x in zip(self._z2matvecmul(other.linear,
-                                                       self.shift),
-                                     other.shift)]
-        result.linear = self._z2matmul(other.linear, self.linear)
-        # Compute x' = B1*x + c1 using the p_j identity
-        new_vars = []
-        for i in range(self.n_qubits):
-            support = [j for j, e in enumerate(self.linear[i]) if e != 0]
-            poly = SpecialPolynomial(self.n_qubits)
-            poly.set_pj(support)
-            if other.shift[i] == 1:
-                poly = -1 * poly
-                poly.weight_0 = (poly.weight_0 + 1) % 8
-            new_vars.append(poly)
-        # p' = p1 + p2(x')
-        result.poly = self.poly + other.poly.evaluate(new_vars)
-        return result
+        return CNOTDihedral.__mul__(other, self)
 
     @property
     def key(self):
         """Return a string representation of a CNOT-dihedral object."""
-        tup = (self.poly.key, tuple(map(tuple, self.linear)),
-               tuple(self.shift))
+        tup = (self.poly.key, tuple(map(tuple, self.linear.tolist())),
+               tuple(self.shift.tolist()))
         return str(tup)
 
+    def _packed_key(self):
+        """Return the packed arrays of the element as bytes."""
+        return self.poly.weights.tobytes() + self.linear.tobytes() + \
+            self.shift.tobytes()
+
     def __eq__(self, x):
         """Test equality."""
-        return isinstance(x, CNOTDihedral) and self.key == x.key
+        return isinstance(x, CNOTDihedral) and \
+            self.n_qubits == x.n_qubits and \
+            self._packed_key() == x._packed_key()
+
+    def __hash__(self):
+        return hash(self._packed_key())
 
     def cnot(self, i, j):
         """Apply a CNOT gate to this element.
@@ -432,9 +484,8 @@ class CNOTDihedral():
         assert i < self.n_qubits, "i too big!"
         assert j < self.n_qubits, "j too big!"
         assert i != j, "i == j!"
-        self.linear[j] = [(self.linear[i][k] + self.linear[j][k]) % 2
-                          for k in range(self.n_qubits)]
-        self.shift[j] = (self.shift[i] + self.shift[j]) % 2
+        self.linear[j] ^= self.linear[i]
+        self.shift[j] ^= self.shift[i]
 
     def phase(self, k, i):
         """Apply an k-th power of T to this element.
@@ -448,18 +499,10 @@ class CNOTDihedral():
         # Take all subsets \alpha of the support of row i
         # of weight up to 3 and add k*(-2)**(|\alpha| - 1) mod 8
         # to the corresponding term.
-        support = [j for j, e in enumerate(self.linear[i]) if e != 0]
-        subsets_2 = itertools.combinations(support, 2)
-        subsets_3 = itertools.combinations(support, 3)
-        for j in support:
-            value = self.poly.get_term([j])
-            self.poly.set_term([j], (value + k) % 8)
-        for j in subsets_2:
-            value = self.poly.get_term(list(j))
-            self.poly.set_term(list(j), (value + -2 * k) % 8)
-        for j in subsets_3:
-            value = self.poly.get_term(list(j))
-            self.poly.set_term(list(j), (value + 4 * k) % 8)
+        support = int(np.dot(self.linear[i], 1 << np.arange(self.n_qubits)))
+        terms, coeffs = _pj_terms(self.n_qubits, support)
+        weights = self.poly.weights
+        weights[terms] = (weights[terms] + (k % 8) * coeffs) % 8
 
     def flip(self, i):
         """Apply X to this element.
@@ -467,7 +510,7 @@ class CNOTDihedral():
         """
         assert i >= 0, "i negative!"
         assert i < self.n_qubits, "i too big!"
-        self.shift[i] = (self.shift[i] + 1) % 2
+        self.shift[i] ^= 1
 
     def __str__(self):
         """Return formatted string representation."""
@@ -532,20 +575,25 @@ def make_dict_next(n_qubits, dicts_prior):
     """
     assert n_qubits >= 1, "n_qubits too small!"
     obj = {}
+    # the elements are compared by their packed arrays, so that only
+    # the new elements need a string key
+    # pylint: disable=protected-access
+    seen = set()
+    for prior in dicts_prior:
+        seen.update(elem._packed_key() for elem, _ in prior.values())
     for elem, circ in dicts_prior[-1].values():
         for i in range(n_qubits):
             for j in range(n_qubits):
                 if i != j:
                     for tpower in range(4):
-                        new_elem = copy.deepcopy(elem)
-                        new_circ = copy.deepcopy(circ)
+                        new_elem = elem.copy()
+                        new_circ = circ + [("cx", i, j)]
                         new_elem.cnot(i, j)
-                        new_circ.append(("cx", i, j))
                         if tpower > 0:
                             new_elem.phase(tpower, j)
                             new_circ.append(("u1", tpower, j))
-                        if True not in [(new_elem.key in d)
-                                        for d in dicts_prior] \
-                                and new_elem.key not in obj:
+                        packed = new_elem._packed_key()
+                        if packed not in seen:
+                            seen.add(packed)
                             obj[new_elem.key] = (new_elem, new_circ)
     return obj
@@ -26,6 +26,8 @@ Advanced CNOT-dihedral operations needed for randomized benchmarking.
 import numpy as np
 from .dihedral import make_dict_0, make_dict_next
 from .basic_utils import BasicUtils
+from .group_tables import get_group_table
+from .binary_tables import load_binary_table, CNOT_DIHEDRAL_TABLE
 
 try:
     import cPickle as pickle
@@ -164,27 +166,24 @@ class DihedralUtils(BasicUtils):
         """
 
         # load the cnot-dihedral tables, but only if we're using
-        # that particular num_qubits
+        # that particular num_qubits. The tables are cached for the
+        # whole process.
         if num_qubits == 1:
             # 1Q - load table programmatically
-            dihedral_tables = self.cnot_dihedral_tables(1)
+            dihedral_tables = get_group_table(
+                'cnot_dihedral_1', lambda: self.cnot_dihedral_tables(1))
         elif num_qubits == 2:
             # 2Q
-            # Try to load the table in from file. If it doesn't exist then make
-            # the file
-            try:
-                dihedral_tables = self.load_dihedral_table(
-                    picklefile='cnot_dihedral_%d.pickle' % num_qubits)
-            except (OSError, EOFError):
-                # table doesn't exist, so save it
-                # this will save time next run
+            # Try to load the table in from file. If it doesn't exist then
+            # make the file
+            def make_table():
                 print('Making the n=%d CNOT-dihedral Table' % num_qubits)
-                self.pickle_dihedral_table(num_qubits=num_qubits)
-                dihedral_tables = self.load_dihedral_table(
-                    picklefile='cnot_dihedral_%d.pickle' % num_qubits)
-            except pickle.UnpicklingError:
-                # handle error
-                dihedral_tables = self.cnot_dihedral_tables(num_qubits)
+                return self.cnot_dihedral_tables(num_qubits)
+
+            dihedral_tables = get_group_table(
+                'cnot_dihedral_2', lambda: load_binary_table(
+                    'cnot_dihedral_%d.bin' % num_qubits, CNOT_DIHEDRAL_TABLE, num_qubits,
+                    make_table))
         else:
             raise ValueError("The number of qubits should be only 1 or 2")
 
@@ -255,12 +254,14 @@ class DihedralUtils(BasicUtils):
     # ---------------------------------------------------------
     # Main function that generates a random CNOT-dihedral gate
     # ---------------------------------------------------------
-    def random_gates(self, num_qubits):
+    def random_gates(self, num_qubits, rng=None):
         """
         Pick a random CNOT-dihedral element on num_qubits.
 
         Args:
             num_qubits (int): number of qubits of the CNOTDihedral object.
+            rng (numpy.random.Generator): a random number generator to
+                draw from instead of the global ``numpy.random`` state.
 
         Returns:
             CNOTDihedral: A CNOTDihedral object.
@@ -276,8 +277,11 @@ class DihedralUtils(BasicUtils):
         G_table = self.load_tables(num_qubits)
         G_keys = list(G_table.keys())
 
-        elem = self.cnot_dihedral_gates(np.random.randint(
-            0, len(G_table)), G_table, G_keys)
+        if rng is None:
+            idx = np.random.randint(0, len(G_table))
+        else:
+            idx = int(rng.integers(len(G_table)))
+        elem = self.cnot_dihedral_gates(idx, G_table, G_keys)
         self._elmnt = elem
         self._gatelist = elem[1]
         self._num_qubits = num_qubits
@@ -344,6 +348,7 @@ class DihedralUtils(BasicUtils):
         Returns:
             str: A unique key to the CNOT-dihedral group table.
         """
+        # the tables are cached, so this does not read the table file
         G_table = self.load_tables(num_qubits)
         elem.poly.weight_0 = 0  # set global phase
         assert elem.key in G_table, \
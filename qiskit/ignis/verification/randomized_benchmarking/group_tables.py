@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Process-wide cache and on-disk location of the group tables.
+
+The group tables are loaded (or generated) once per process and kept
+in memory until they are cleared with :func:`clear_group_tables`.
+The table files are stored in a versioned directory: by default the
+``tables`` directory of this package, or ``~/.qiskit/ignis_tables``
+if the package directory is not writable. The ``QISKIT_IGNIS_TABLES_DIR``
+environment variable overrides the default.
+"""
+
+import os
+
+# Version of the table files, increase it when their content changes
+TABLES_VERSION = 2
+
+_GROUP_TABLES = {}
+
+
+def tables_dir():
+    """
+    Return the versioned directory of the group table files.
+
+    Returns:
+        str: the path of the directory.
+    """
+    base_dir = os.environ.get('QISKIT_IGNIS_TABLES_DIR')
+    if base_dir is None:
+        base_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'tables')
+        if not os.access(os.path.dirname(base_dir), os.W_OK):
+            base_dir = os.path.join(os.path.expanduser('~'), '.qiskit',
+                                    'ignis_tables')
+    return os.path.join(base_dir, 'v%d' % TABLES_VERSION)
+
+
+def table_path(filename):
+    """
+    Return the path of a group table file.
+
+    Args:
+        filename (str): the file name of the table.
+
+    Returns:
+        str: the path of the file in the versioned tables directory.
+    """
+    return os.path.join(tables_dir(), filename)
+
+
+def get_group_table(name, make_table):
+    """
+    Return a group table from the process-wide cache.
+
+    Args:
+        name (str): a unique name of the table.
+        make_table (callable): a function with no arguments that loads
+            or generates the table. It is only called if the table is
+            not in the cache.
+
+    Returns:
+        object: the cached table.
+    """
+    if name not in _GROUP_TABLES:
+        _GROUP_TABLES[name] = make_table()
+    return _GROUP_TABLES[name]
+
+
+def clear_group_tables(name=None):
+    """
+    Remove group tables from the process-wide cache, so that they are
+    loaded again the next time they are used.
+
+    Args:
+        name (str): the name of the table to remove.
+            If ``None`` (default) remove all the tables.
+    """
+    if name is None:
+        _GROUP_TABLES.clear()
+    else:
+        _GROUP_TABLES.pop(name, None)
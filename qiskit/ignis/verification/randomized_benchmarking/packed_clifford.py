@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=invalid-name
+
+"""
+Bit-packed Clifford Operator class
+"""
+
+import numpy as np
+from .Clifford import Clifford
+
+
+class PackedClifford:
+    """Clifford Operator Class with a bit-packed tableau.
+
+    The symplectic table has the same layout as in :class:`Clifford`,
+    but it is stored column by column: every column of the table,
+    and the phase vector, is a bit string over the :math:`2n` rows
+    packed into a single integer word (bit ``r`` holds row ``r``),
+    which is one 64-bit word for up to 32 qubits.
+    Every gate is a handful of word-wise operations on the columns
+    of the qubits it acts on, updated in place in the column list,
+    and the results are bit-identical to :class:`Clifford`.
+    """
+
+    def __init__(self, num_qubits=None, table=None, phases=None):
+        # Initialize an n-qubit Clifford table.
+        # If table is None initialize to identity.
+
+        # Initialize internal variables
+        self._num_qubits = None
+        self._cols = None
+        self._phases = None
+
+        if table is not None or num_qubits is not None:
+            clifford = Clifford(num_qubits=num_qubits, table=table,
+                                phases=phases)
+            self._num_qubits = clifford.num_qubits
+            self._cols = [self._pack(col) for col in clifford.table.T]
+            self._phases = self._pack(clifford.phases)
+
+    def __repr__(self):
+        return repr(self.to_clifford())
+
+    # ---------------------------------------------------------------------
+    # Packing helpers
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _pack(bits):
+        """Pack a boolean vector into an integer word (bit r = bits[r])."""
+        packed = np.packbits(np.asarray(bits, dtype=bool), bitorder='little')
+        return int.from_bytes(packed.tobytes(), 'little')
+
+    def _unpack(self, words):
+        """Unpack integer words into boolean vectors over the rows."""
+        num_rows = 2 * self._num_qubits
+        num_bytes = (num_rows + 7) // 8
+        packed = np.frombuffer(
+            b''.join(word.to_bytes(num_bytes, 'little') for word in words),
+            dtype=np.uint8).reshape(len(words), num_bytes)
+        bits = np.unpackbits(packed, axis=1, bitorder='little')
+        return bits[:, :num_rows].astype(bool)
+
+    # ---------------------------------------------------------------------
+    # Data accessors
+    # ---------------------------------------------------------------------
+
+    @property
+    def num_qubits(self):
+        """Return the number of qubits for the Clifford."""
+        return self._num_qubits
+
+    @property
+    def table(self):
+        """Return a copy of the Clifford table."""
+        return self._unpack(self._cols).T
+
+    @property
+    def phases(self):
+        """Return a copy of the Clifford phases."""
+        return self._unpack([self._phases])[0]
+
+    def __getitem__(self, index):
+        """Get element from internal symplectic table."""
+        return self.table[index]
+
+    def __setitem__(self, index, value):
+        """Set element of internal symplectic table."""
+        clifford = self.to_clifford()
+        clifford[index] = value
+        self._cols = [self._pack(col) for col in clifford.table.T]
+
+    # ---------------------------------------------------------------------
+    # Conversion to and from the Clifford class
+    # ---------------------------------------------------------------------
+
+    def to_clifford(self):
+        """Return the equivalent :class:`Clifford` object."""
+        return Clifford(table=self.table, phases=list(self.phases))
+
+    @classmethod
+    def from_clifford(cls, clifford):
+        """Return a packed copy of a :class:`Clifford` object."""
+        return cls(table=clifford.table, phases=list(clifford.phases))
+
+    def as_dict(self):
+        """Return dictionary (JSON) represenation of Clifford object"""
+        return self.to_clifford().as_dict()
+
+    @classmethod
+    def from_dict(cls, clifford_dict):
+        """Load a Clifford from a dictionary."""
+        return cls.from_clifford(Clifford.from_dict(clifford_dict))
+
+    def index(self):
+        """
+        Returns a unique index for the Clifford.
+
+        Returns:
+            int: A unique index (integer) for the Clifford object,
+            the same as :meth:`Clifford.index`.
+        """
+        # Read the table row by row, followed by the phases
+        ret = 0
+        for row in range(2 * self._num_qubits):
+            for col in self._cols:
+                ret = (ret << 1) | ((col >> row) & 1)
+        for row in range(2 * self._num_qubits):
+            ret = (ret << 1) | ((self._phases >> row) & 1)
+        return ret
+
+    # ---------------------------------------------------------------------
+    # Canonical gate operations
+    # ---------------------------------------------------------------------
+
+    def x(self, qubit):
+        """Apply a Pauli "x" gate to a qubit."""
+        self._phases ^= self._cols[qubit]
+
+    def y(self, qubit):
+        """Apply an Pauli "y" gate to a qubit."""
+        self._phases ^= self._cols[qubit] ^ self._cols[self._num_qubits + qubit]
+
+    def z(self, qubit):
+        """Apply an Pauli "z" gate to qubit."""
+        self._phases ^= self._cols[self._num_qubits + qubit]
+
+    def h(self, qubit):
+        """Apply an Hadamard "h" gate to qubit."""
+        cols, iz, ix = self._cols, qubit, self._num_qubits + qubit
+        z, x = cols[iz], cols[ix]
+        self._phases ^= z & x
+        cols[iz], cols[ix] = x, z
+
+    def s(self, qubit):
+        """Apply a phase "s" gate to qubit."""
+        cols, iz, ix = self._cols, qubit, self._num_qubits + qubit
+        z, x = cols[iz], cols[ix]
+        self._phases ^= z & x
+        cols[iz] = z ^ x
+
+    def sdg(self, qubit):
+        """Apply an adjoint phase "sdg" gate to qubit."""
+        cols, iz, ix = self._cols, qubit, self._num_qubits + qubit
+        z, x = cols[iz], cols[ix]
+        self._phases ^= x & ~z
+        cols[iz] = z ^ x
+
+    def v(self, qubit):
+        """Apply v gate v = sdg.h ."""
+        cols, iz, ix = self._cols, qubit, self._num_qubits + qubit
+        z, x = cols[iz], cols[ix]
+        cols[iz], cols[ix] = x, z ^ x
+
+    def w(self, qubit):
+        """Apply w gate w = v.v ."""
+        cols, iz, ix = self._cols, qubit, self._num_qubits + qubit
+        z, x = cols[iz], cols[ix]
+        cols[iz], cols[ix] = z ^ x, z
+
+    def cx(self, qubit_ctrl, qubit_trgt):
+        """Apply a Controlled-NOT "cx" gate."""
+        cols, num_qubits = self._cols, self._num_qubits
+        iz_c, ix_c = qubit_ctrl, num_qubits + qubit_ctrl
+        iz_t, ix_t = qubit_trgt, num_qubits + qubit_trgt
+        z_c, x_c, z_t, x_t = cols[iz_c], cols[ix_c], cols[iz_t], cols[ix_t]
+        self._phases ^= x_c & z_t & ~(x_t ^ z_c)
+        cols[ix_t] = x_t ^ x_c
+        cols[iz_c] = z_c ^ z_t
+
+    def cz(self, qubit_ctrl, qubit_trgt):
+        """Apply a Controlled-z "cz" gate."""
+        cols, num_qubits = self._cols, self._num_qubits
+        iz_c, ix_c = qubit_ctrl, num_qubits + qubit_ctrl
+        iz_t, ix_t = qubit_trgt, num_qubits + qubit_trgt
+        z_c, x_c, z_t, x_t = cols[iz_c], cols[ix_c], cols[iz_t], cols[ix_t]
+        self._phases ^= x_c & x_t & (z_c ^ z_t)
+        cols[iz_c] = z_c ^ x_t
+        cols[iz_t] = z_t ^ x_c
+
+    def swap(self, qubit0, qubit1):
+        """Apply SWAP gate between two qubits."""
+        cols, num_qubits = self._cols, self._num_qubits
+        iz0, ix0 = qubit0, num_qubits + qubit0
+        iz1, ix1 = qubit1, num_qubits + qubit1
+        cols[iz0], cols[iz1] = cols[iz1], cols[iz0]
+        cols[ix0], cols[ix1] = cols[ix1], cols[ix0]
+
+    def copy(self):
+        """Return a copy of the Clifford."""
+        ret = PackedClifford()
+        ret._num_qubits = self._num_qubits
+        ret._cols = list(self._cols)
+        ret._phases = self._phases
+        return ret
@@ -19,13 +19,15 @@
 RB Helper functions
 """
 
-from typing import List, Union, Dict, Optional
+from typing import List, Union, Dict, Optional, Tuple
 from warnings import warn
 
 import numpy as np
 from qiskit import QuantumCircuit, QiskitError
 from qiskit.qobj import QasmQobj
 
+from .circuits import clifford_instructions
+
 
 def count_gates(qobj, basis, qubits):
     """
@@ -144,12 +146,11 @@ def gates_per_clifford(
         else:
             for transpiled_circuit in transpiled_circuits:
                 if isinstance(transpiled_circuit, QuantumCircuit):
-                    for instr, qregs, _ in transpiled_circuit.data:
-                        for qreg in qregs:
-                            try:
-                                ngates[qreg.index][instr.name] += 1
-                            except KeyError:
-                                pass
+                    counts = _count_basis_gates(transpiled_circuit, basis)
+                    for qubit in qubits:
+                        if qubit < counts.shape[1]:
+                            for base_ind, base in enumerate(basis):
+                                ngates[qubit][base] += counts[base_ind, qubit]
                 else:
                     raise QiskitError('Input object is not `QuantumCircuit`.')
 
@@ -163,6 +164,95 @@ def gates_per_clifford(
     return ngates
 
 
+def _count_basis_gates(circuit: QuantumCircuit, basis: List[str]) -> np.ndarray:
+    """Count the gates of each basis gate on each qubit of a circuit.
+
+    A qubit is identified by its index in its register, as ``Qubit.index``
+    (the qubits of a transpiled circuit are in a single register).
+    Multi-qubit gates are counted on each of their qubits.
+
+    Returns:
+        An array of shape ``(len(basis), n)`` of the counts, where ``n``
+        is the largest qubit index plus one.
+    """
+    qubit_index = {qubit: index for index, qubit in enumerate(circuit.qubits)}
+    for qreg in circuit.qregs:
+        qubit_index.update({qubit: index for index, qubit in enumerate(qreg)})
+    base_index = {base: index for index, base in enumerate(basis)}
+    # a compact table of the (basis gate, qubit) of each gate on a qubit
+    stride = max(qubit_index.values(), default=-1) + 1
+    codes = []
+    for instr, qargs, _ in circuit.data:
+        base = base_index.get(instr.name)
+        if base is not None:
+            codes.extend(base * stride + qubit_index[qarg] for qarg in qargs)
+    return np.bincount(np.array(codes, dtype=np.int64),
+                       minlength=len(basis) * stride).reshape(
+                           len(basis), stride)
+
+
+def expected_gates_per_clifford(
+        rb_pattern: List[List[int]],
+        basis_gates: List[str],
+        clifford_lengths: Optional[Union[np.ndarray, List[int]]] = None
+) -> Dict[int, Dict[str, float]]:
+    """Calculate the number of gates per Clifford of the RB sequences
+    generated with ``basis_gates``, without counting the gates of circuits.
+
+    The circuits of :func:`randomized_benchmarking_seq` with the
+    ``basis_gates`` argument are built from the cached instructions of
+    each Clifford in the basis, so the expected number of gates per
+    Clifford is the average of the gates of all the Cliffords (and of
+    their inverses) in this cache. For circuits that are not transpiled
+    further, it is the expected value of :func:`gates_per_clifford`.
+
+    Args:
+        rb_pattern: the RB pattern of the sequences, of patterns of
+            1 or 2 qubits.
+        basis_gates: the basis gates of the sequences.
+        clifford_lengths: number of Cliffords in each circuit. The inverse
+            Clifford of each circuit is counted as a Clifford, as in
+            :func:`gates_per_clifford`. If ``None``, count only the random
+            Cliffords.
+
+    Returns:
+        Nested dictionary of gate counts per Clifford.
+
+    Raises:
+        QiskitError: when a pattern has more than 2 qubits.
+    """
+    ngates = {qubit: {base: 0.0 for base in basis_gates}
+              for pattern in rb_pattern for qubit in pattern}
+    if max(len(pattern) for pattern in rb_pattern) > 2:
+        raise QiskitError('The Clifford group of more than 2 qubits '
+                          'is too large to average its gate counts.')
+    # weights of the Cliffords and of their inverses
+    if clifford_lengths is None:
+        weights = (1, 0)
+    else:
+        lengths = np.asarray(clifford_lengths)
+        weights = (lengths.sum() / (lengths + 1).sum(),
+                   len(lengths) / (lengths + 1).sum())
+
+    for pattern in rb_pattern:
+        for inverse, weight in zip((False, True), weights):
+            elements = clifford_instructions(len(pattern), basis_gates,
+                                             inverse)
+            counts = {qubit: {base: 0 for base in basis_gates}
+                      for qubit in pattern}
+            for data in elements:
+                for instr, qargs, _ in data:
+                    if instr.name in basis_gates:
+                        for pos in qargs:
+                            counts[pattern[pos]][instr.name] += 1
+            for qubit in pattern:
+                for base in basis_gates:
+                    ngates[qubit][base] += \
+                        weight * counts[qubit][base] / len(elements)
+
+    return ngates
+
+
 def coherence_limit(nQ=2, T1_list=None, T2_list=None,
                     gatelen=0.1):
 
@@ -634,3 +724,158 @@ def calculate_2q_epc(gate_per_cliff: Dict[int, Dict[str, float]],
     alpha_c_2q = 1 / 5 * (alpha_1q[0] + alpha_1q[1] + 3 * alpha_1q[0] * alpha_1q[1]) * alpha_2q
 
     return 3 / 4 * (1 - alpha_c_2q)
+
+
+def calculate_device_epgs(
+        gate_per_cliff_1q: Dict[int, Dict[str, float]],
+        epc_1q: Dict[int, float],
+        gate_per_cliff_2q: Optional[Dict[Tuple[int, int], Dict[int, Dict[str, float]]]] = None,
+        epc_2q: Optional[Dict[Tuple[int, int], float]] = None,
+        epc_1q_err: Optional[Dict[int, float]] = None,
+        epc_2q_err: Optional[Dict[Tuple[int, int], float]] = None,
+        two_qubit_name: Optional[str] = 'cx') -> Dict[str, dict]:
+    r"""
+    Convert the EPCs of the 1Q and 2Q RB experiments of a whole device
+    into EPGs, with their uncertainties.
+
+    The EPGs of all the qubits and pairs are solved at once from arrays of
+    the gate counts, instead of calling :func:`calculate_1q_epg` and
+    :func:`calculate_2q_epg` for each qubit and pair, with the same model
+    and results. Given the 1Q EPGs, the EPC of each RB experiment depends
+    on the EPG of a single basis gate, so the EPGs are the solution of
+    a diagonal linear system:
+
+    .. math::
+
+        EPC_q &= EPG_{U2, q} (N_{U2, q} + 2 N_{U3, q}) \\
+        \frac{3}{4} \left(1 - \frac{1 - 4 EPC_{qq'} / 3}{\alpha_{1Q, qq'}}\right)
+        &= EPG_{CX, qq'} N_{CX, qq'}
+
+    where :math:`\alpha_{1Q, qq'}` is the depolarizing parameter of the 1Q gates
+    of the 2Q RB sequence, calculated from the 1Q EPGs of the qubits.
+    The uncertainties of the EPCs (and of the 1Q EPGs, for the 2Q EPGs)
+    are propagated to first order.
+
+    .. jupyter-execute::
+
+        import pprint
+        import qiskit.ignis.verification.randomized_benchmarking as rb
+
+        # simultaneous 1Q RB of qubits 0, 1 and 2
+        gpc_1q = {0: {'cx': 0, 'u1': 0.13, 'u2': 0.31, 'u3': 0.51},
+                  1: {'cx': 0, 'u1': 0.10, 'u2': 0.33, 'u3': 0.51},
+                  2: {'cx': 0, 'u1': 0.12, 'u2': 0.32, 'u3': 0.50}}
+        epc_1q = {0: 1.5e-3, 1: 5.8e-4, 2: 8.0e-4}
+
+        # 2Q RB of the pairs (0, 1) and (1, 2)
+        gpc_2q = {(0, 1): {0: {'cx': 1.49, 'u1': 0.25, 'u2': 0.95, 'u3': 0.56},
+                           1: {'cx': 1.49, 'u1': 0.24, 'u2': 0.98, 'u3': 0.49}},
+                  (1, 2): {1: {'cx': 1.50, 'u1': 0.25, 'u2': 0.96, 'u3': 0.53},
+                           2: {'cx': 1.50, 'u1': 0.26, 'u2': 0.97, 'u3': 0.51}}}
+        epc_2q = {(0, 1): 2.4e-2, (1, 2): 1.9e-2}
+
+        epgs = rb.calculate_device_epgs(gpc_1q, epc_1q, gpc_2q, epc_2q,
+                                        epc_1q_err={0: 1e-4, 1: 5e-5, 2: 6e-5},
+                                        epc_2q_err={(0, 1): 1e-3, (1, 2): 8e-4})
+        pprint.pprint(epgs)
+
+    Note:
+        This function presupposes the basis gate consists
+        of ``u1``, ``u2``, ``u3`` and ``cx``.
+
+    Args:
+        gate_per_cliff_1q: dictionary of gate per Clifford of the 1Q RB
+            experiments, see :func:`gates_per_clifford`.
+        epc_1q: EPC fit from the 1Q RB experiment of each qubit.
+        gate_per_cliff_2q: dictionary of gate per Clifford of the 2Q RB
+            experiment of each qubit pair.
+        epc_2q: EPC fit from the 2Q RB experiment of each qubit pair.
+        epc_1q_err: uncertainty of the EPC of each qubit (default zero).
+        epc_2q_err: uncertainty of the EPC of each qubit pair (default zero).
+        two_qubit_name: name of two qubit gate in ``basis gates``.
+
+    Returns:
+        Dictionary with the keys ``'epg_1q'`` and ``'epg_1q_err'``: the EPGs
+        of the single qubit basis gates of each qubit and their uncertainties
+        (as :func:`calculate_1q_epg`), and ``'epg_2q'`` and ``'epg_2q_err'``:
+        the EPG of the 2Q gate of each pair and its uncertainty (as
+        :func:`calculate_2q_epg` with the 1Q EPGs of the pair, if known).
+
+    Raises:
+        QiskitError: when ``u2`` or ``u3`` is not found, a 1Q gate count
+            includes a ``cx`` gate, a qubit is not included in the gate count
+            dictionary, or the 2Q gate is not included in a 2Q gate count.
+    """
+    epc_1q_err = epc_1q_err or {}
+    epc_2q_err = epc_2q_err or {}
+    epc_2q = epc_2q or {}
+    gate_per_cliff_2q = gate_per_cliff_2q or {}
+
+    # 1Q EPGs
+    qubits = list(epc_1q)
+    for qubit in qubits:
+        if qubit not in gate_per_cliff_1q:
+            raise QiskitError('Qubit %d is not included in the `gate_per_cliff`' % qubit)
+        gpc_per_qubit = gate_per_cliff_1q[qubit]
+        if 'u3' not in gpc_per_qubit or 'u2' not in gpc_per_qubit:
+            raise QiskitError('Invalid basis set is given. Use `u1`, `u2`, `u3` for basis gates.')
+        if gpc_per_qubit.get('cx', 0) > 0:
+            raise QiskitError('Two qubit gate is included in the RB sequence.')
+    n_u2 = np.array([gate_per_cliff_1q[qubit]['u2'] for qubit in qubits], dtype=float)
+    n_u3 = np.array([gate_per_cliff_1q[qubit]['u3'] for qubit in qubits], dtype=float)
+    epc = np.array([epc_1q[qubit] for qubit in qubits], dtype=float)
+    epc_err = np.array([epc_1q_err.get(qubit, 0) for qubit in qubits], dtype=float)
+    epg_u2 = epc / (n_u2 + 2 * n_u3)
+    epg_u2_err = epc_err / (n_u2 + 2 * n_u3)
+
+    results = {
+        'epg_1q': {qubit: {'u1': 0, 'u2': epg, 'u3': 2 * epg}
+                   for qubit, epg in zip(qubits, epg_u2.tolist())},
+        'epg_1q_err': {qubit: {'u1': 0, 'u2': err, 'u3': 2 * err}
+                       for qubit, err in zip(qubits, epg_u2_err.tolist())},
+        'epg_2q': {},
+        'epg_2q_err': {}}
+    if not epc_2q:
+        return results
+
+    # 2Q EPGs, with arrays of shape (pairs, 2) for the qubits of the pairs
+    pairs = list(epc_2q)
+    qubit_ind = {qubit: ind for ind, qubit in enumerate(qubits)}
+    for pair in pairs:
+        if len(pair) != 2:
+            raise QiskitError('Number of qubit is not 2.')
+        for qubit in pair:
+            if qubit not in gate_per_cliff_2q.get(pair, {}):
+                raise QiskitError('Qubit %d is not included in the `gate_per_cliff`' % qubit)
+    n_2q = np.array([gate_per_cliff_2q[pair][pair[0]].get(two_qubit_name, 0)
+                     for pair in pairs], dtype=float)
+    if np.any(n_2q <= 0):
+        raise QiskitError('Two qubit gate %s is not included in the `gate_per_cliff`. '
+                          'Set correct `two_qubit_name` or use 2Q RB gate count.' % two_qubit_name)
+    # the qubits without 1Q EPGs have no 1Q gate error
+    known = np.array([[qubit in qubit_ind for qubit in pair] for pair in pairs])
+    pair_ind = np.array([[qubit_ind.get(qubit, 0) for qubit in pair] for pair in pairs])
+    epg = np.where(known, epg_u2[pair_ind] if qubits else 0, 0)
+    epg_err = np.where(known, epg_u2_err[pair_ind] if qubits else 0, 0)
+    pair_u2 = np.array([[gate_per_cliff_2q[pair][qubit].get('u2', 0) for qubit in pair]
+                        for pair in pairs], dtype=float)
+    pair_u3 = np.array([[gate_per_cliff_2q[pair][qubit].get('u3', 0) for qubit in pair]
+                        for pair in pairs], dtype=float)
+    epc = np.array([epc_2q[pair] for pair in pairs], dtype=float)
+    epc_err = np.array([epc_2q_err.get(pair, 0) for pair in pairs], dtype=float)
+
+    alpha = (1 - 2 * epg) ** pair_u2 * (1 - 4 * epg) ** pair_u3
+    dalpha = -alpha * (2 * pair_u2 / (1 - 2 * epg) + 4 * pair_u3 / (1 - 4 * epg))
+    alpha_c_1q = (alpha[:, 0] + alpha[:, 1] + 3 * alpha[:, 0] * alpha[:, 1]) / 5
+    alpha_c_2q = (1 - 4 / 3 * epc) / alpha_c_1q
+    epg_2q = 3 / 4 * (1 - alpha_c_2q) / n_2q
+
+    # first order propagation of the uncertainties
+    d_alpha_c_1q = 3 / 4 * alpha_c_2q / alpha_c_1q / n_2q
+    d_alpha = (1 + 3 * alpha[:, ::-1]) / 5 * dalpha
+    epg_2q_err = np.sqrt((epc_err / (alpha_c_1q * n_2q)) ** 2 +
+                         np.sum((d_alpha_c_1q[:, None] * d_alpha * epg_err) ** 2, axis=1))
+
+    results['epg_2q'] = dict(zip(pairs, epg_2q.tolist()))
+    results['epg_2q_err'] = dict(zip(pairs, epg_2q_err.tolist()))
+    return results
@@ -36,6 +36,7 @@ Utility functions
 .. autosummary::
 
     marginal_counts
+    marginal_counts_array
     combine_counts
     expectation_counts
     count_keys
@@ -91,6 +92,7 @@ from .fitters import TomographyFitter
 
 # Utility functions TODO: move to qiskit.quantum_info
 from .data import marginal_counts     # TODO: move to qiskit.tools
+from .data import marginal_counts_array  # TODO: move to qiskit.tools
 from .data import combine_counts      # TODO: move to qiskit.tools
 from .data import expectation_counts  # TODO: move to qiskit.tools
 from .data import count_keys  # TODO: move to qiskit.tools
@@ -14,7 +14,7 @@
 
 """TomographyBasis class
 """
-from typing import Optional, Tuple, Union
+from typing import Callable, Dict, Optional, Sequence, Tuple, Union
 import numpy as np
 from qiskit import QiskitError
 from qiskit.circuit import Qubit, Clbit, QuantumCircuit
@@ -57,6 +57,7 @@ class TomographyBasis:
         self._name = name
         self._measurement = False
         self._preparation = False
+        self.clear_cache()
 
         if measurement is not None and len(measurement) == 3:
             self._measurement = True
@@ -196,7 +197,11 @@ class TomographyBasis:
             error = "'{}' not in {}".format(outcome, allowed_outcomes)
             raise ValueError('Invalid measurement outcome: {}'.format(error))
 
-        return self._measurement_matrix(label, outcome)
+        key = (label, int(outcome))
+        if key not in self._measurement_cache:
+            self._measurement_cache[key] = _read_only(
+                self._measurement_matrix(label, outcome))
+        return self._measurement_cache[key]
 
     def preparation_matrix(self, label: str) -> np.array:
         """Return the preparation matrix for a given preparation operator.
@@ -221,4 +226,88 @@ class TomographyBasis:
             error = "'{}' not in {}".format(label, self._preparation_labels)
             raise ValueError("{0}: {1}".format(msg, error))
 
-        return self._preparation_matrix(label)
+        if label not in self._preparation_cache:
+            self._preparation_cache[label] = _read_only(
+                self._preparation_matrix(label))
+        return self._preparation_cache[label]
+
+    def measurement_operator(self, labels: Sequence[str],
+                             outcomes: Sequence[Union[str, int]],
+                             memo: Optional[Dict] = None
+                             ) -> np.array:
+        """Return the multi-qubit measurement matrix for the measurement
+        labels of the qubits and their expected outcomes.
+
+        With a ``memo``, the products of the single qubit matrices are
+        memoized in it as a prefix tree of the labels, so the operators of
+        labels with a common prefix share their partial products, and the
+        operators are reused by later calls with the same ``memo``. The
+        memo is owned by the caller, e.g. for the operators of one basis
+        matrix, and only the single qubit matrices are cached by the basis.
+
+        Args:
+            labels: the measurement label of each qubit.
+            outcomes: the expected outcome of each qubit, in the order
+                of a count key, i.e. the outcome of the last qubit first.
+            memo: a dictionary to memoize the products in, initially
+                empty (default: None, for no memoization).
+        Returns:
+            The measurement matrix, the tensor product of the measurement
+            matrices of the qubits from the last one to the first one.
+        """
+        keys = ((label, int(outcome))
+                for label, outcome in zip(reversed(labels), outcomes))
+        return _tree_product({} if memo is None else memo, keys,
+                             self.measurement_matrix, prepend=False)
+
+    def preparation_operator(self, labels: Sequence[str],
+                             memo: Optional[Dict] = None) -> np.array:
+        """Return the multi-qubit preparation matrix for the preparation
+        labels of the qubits.
+
+        The products are memoized in ``memo`` as in
+        :meth:`measurement_operator`.
+
+        Args:
+            labels: the preparation label of each qubit.
+            memo: a dictionary to memoize the products in, initially
+                empty (default: None, for no memoization).
+        Returns:
+            The preparation matrix, the tensor product of the preparation
+            matrices of the qubits from the last one to the first one.
+        """
+        keys = ((label,) for label in labels)
+        return _tree_product({} if memo is None else memo, keys,
+                             self.preparation_matrix, prepend=True)
+
+    def clear_cache(self):
+        """Clear the cached single qubit matrices."""
+        self._measurement_cache = {}
+        self._preparation_cache = {}
+
+
+def _tree_product(tree: Dict, keys: Sequence[Tuple],
+                  matrix_fn: Callable[..., np.array],
+                  prepend: bool) -> np.array:
+    """Return the tensor product of the matrices of a sequence of keys.
+
+    Each node of the prefix tree maps the next key to the product of the
+    keys of the path and to the child node of that path.
+    """
+    node = tree
+    op = np.eye(1, dtype=complex)
+    for key in keys:
+        key = tuple(key)
+        if key not in node:
+            mat = matrix_fn(*key)
+            prod = np.kron(mat, op) if prepend else np.kron(op, mat)
+            node[key] = (_read_only(prod), {})
+        op, node = node[key]
+    return op
+
+
+def _read_only(mat: np.array) -> np.array:
+    """Return a read-only array of a matrix, to be shared by the cache."""
+    mat = np.array(mat)
+    mat.flags.writeable = False
+    return mat
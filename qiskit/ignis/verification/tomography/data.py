@@ -18,10 +18,9 @@ Quantum tomography data
 
 # Needed for functions
 from itertools import combinations
-from functools import reduce
-from re import match
 from typing import Dict, Union, List
 import numpy as np
+from ...counts_array import _counts_to_arrays, _marginalize
 
 
 ###########################################################################
@@ -50,55 +49,54 @@ def marginal_counts(counts: Dict[str, int],
         the input dictionary, but with whitespace trimmed from the keys.
     """
 
-    # Extract total number of qubits from first count key
-    # We trim the whitespace seperating classical registers
-    # and count the number of digits
-    num_qubits = len(next(iter(counts)).replace(' ', ''))
-
     # Check if we do not need to marginalize. In this case we just trim
     # whitespace from count keys
-    if (meas_qubits is True) or (num_qubits == len(meas_qubits)):
+    if (meas_qubits is True) or (counts and len(
+            next(iter(counts)).replace(' ', '')) == len(meas_qubits)):
         ret = {}
         for key, val in counts.items():
             key = key.replace(' ', '')
             ret[key] = val
         return ret
 
-    # Sort the measured qubits into decending order
-    # Since bitstrings have qubit-0 as least significant bit
-    if meas_qubits is True:
-        meas_qubits = range(num_qubits)  # All measured
-    qubits = sorted(meas_qubits, reverse=True)
-
-    # Generate bitstring keys for measured qubits
-    meas_keys = count_keys(len(qubits))
-
-    # Get regex match strings for suming outcomes of other qubits
-    rgx = []
-    for key in meas_keys:
-        def helper(x, y):
-            if y in qubits:
-                return key[qubits.index(y)] + x
-            return '\\d' + x
-        rgx.append(reduce(helper, range(num_qubits), ''))
-
-    # Build the return list
-    meas_counts = []
-    for m in rgx:
-        c = 0
-        for key, val in counts.items():
-            if match(m, key.replace(' ', '')):
-                c += val
-        meas_counts.append(c)
+    # Bitstrings have qubit-0 as least significant bit, so the bits of
+    # the marginal outcomes are the measured qubits in ascending order
+    outcomes, values = _counts_to_arrays(counts)
+    num_meas = len(meas_qubits)
+    meas_counts = _marginalize(outcomes, values, sorted(meas_qubits))
 
     # Return as counts dict on measured qubits only
     if pad_zeros is True:
-        return dict(zip(meas_keys, meas_counts))
-    ret = {}
-    for key, val in zip(meas_keys, meas_counts):
-        if val != 0:
-            ret[key] = val
-    return ret
+        return dict(zip(count_keys(num_meas), meas_counts.tolist()))
+    return {bin(outcome)[2:].zfill(num_meas): meas_counts[outcome].item()
+            for outcome in np.flatnonzero(meas_counts)}
+
+
+def marginal_counts_array(counts: Dict[str, int],
+                          meas_qubits: Union[bool, List[int]] = True
+                          ) -> np.ndarray:
+    """
+    Compute marginal counts from a counts dictionary as an array.
+
+    Args:
+        counts: a counts dictionary.
+        meas_qubits: (default: True) the qubits to NOT be marinalized over
+            if this is True meas_qubits will be all measured qubits.
+
+    Returns:
+        An array of length ``2 ** len(meas_qubits)``, whose entry ``i`` is
+        the count of the outcome ``count_keys(len(meas_qubits))[i]`` of
+        :func:`marginal_counts` (including the zero counts).
+
+    Example:
+        >>> marginal_counts_array({'001': 5, '011': 2, '101': 3}, [0, 1])
+        array([0, 8, 0, 2])
+    """
+    outcomes, values = _counts_to_arrays(counts)
+    if meas_qubits is True:
+        num_qubits = len(next(iter(counts)).replace(' ', '')) if counts else 0
+        meas_qubits = range(num_qubits)
+    return _marginalize(outcomes, values, sorted(meas_qubits))
 
 
 def count_keys(num_qubits: int) -> List[str]:
@@ -181,20 +179,22 @@ def expectation_counts(counts: Dict[str, int]) -> Dict[str, int]:
         subsets += list(combinations(range(numq), r + 1))
 
     # Compute expectation values
+    outcomes, values = _counts_to_arrays(counts)
     exp_data = {'00': shots}
     for subset in subsets:
-        exp_counts = 0
         exp_op = numq * ['0']
 
         # Get expectation operator
         for qubit in subset:
             exp_op[qubit] = '1'
 
-        # Get expectation value
-        for key, val in marginal_counts(counts,
-                                        subset,
-                                        pad_zeros=True).items():
-            exp_counts += (-1) ** (key.count('1')) * val
-        exp_data[''.join(exp_op)] = exp_counts
+        # Get expectation value: the parity weighted sum of the
+        # marginal counts on the subset
+        meas_counts = _marginalize(outcomes, values, sorted(subset))
+        parity = np.array([bin(outcome).count('1') % 2
+                           for outcome in range(len(meas_counts))])
+        exp_data[''.join(exp_op)] = \
+            (meas_counts[parity == 0].sum() -
+             meas_counts[parity == 1].sum()).item()
 
     return exp_data
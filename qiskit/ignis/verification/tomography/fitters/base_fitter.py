@@ -28,9 +28,12 @@ from qiskit import QiskitError
 from qiskit import QuantumCircuit
 from qiskit.result import Result
 from ..basis import TomographyBasis, default_basis
+from ....counts_array import CountsArray
 from ..data import marginal_counts, combine_counts, count_keys
 from .cvx_fit import cvxpy, cvx_fit
-from .lstsq_fit import lstsq_fit
+from .lstsq_fit import lstsq_fit, lstsq_fit_batch
+from .pgd_fit import pgd_fit
+from .basis_matrix import BasisMatrix
 
 # Create logger
 logger = logging.getLogger(__name__)
@@ -40,7 +43,7 @@ class TomographyFitter:
     """Base maximum-likelihood estimate tomography fitter class"""
 
     def __init__(self,
-                 result: Result,
+                 result: Union[Result, CountsArray],
                  circuits: Union[List[QuantumCircuit], List[str]],
                  meas_basis: Union[TomographyBasis, str] = 'Pauli',
                  prep_basis: Union[TomographyBasis, str] = 'Pauli'):
@@ -48,7 +51,7 @@ class TomographyFitter:
 
         Args:
             result: a Qiskit Result object obtained from executing
-                tomography circuits.
+                tomography circuits, or its counts as a CountsArray.
             circuits: a list of circuits or circuit names to extract
                 count information from the result object.
             meas_basis: (default: 'Pauli') A function to return
@@ -113,6 +116,7 @@ class TomographyFitter:
             psd: bool = True,
             trace: Optional[int] = None,
             trace_preserving: bool = False,
+            structured: Optional[bool] = None,
             **kwargs) -> np.array:
         r"""Reconstruct a quantum state using CVXPY convex optimization.
 
@@ -120,6 +124,8 @@ class TomographyFitter:
 
         The ``cvx`` fitter method used CVXPY convex optimization package.
         The ``lstsq`` method uses least-squares fitting (linear inversion).
+        The ``pgd`` method solves the same problem as ``cvx`` with a native
+        accelerated projected gradient solver, which does not need CVXPY.
         The ``auto`` method will use 'cvx' if the CVXPY package is found on
         the system, otherwise it will default to 'lstsq'.
 
@@ -158,6 +164,18 @@ class TomographyFitter:
         This constraint should not be used for process tomography and the
         trace preserving constraint should be used instead.
 
+        **Structured basis matrix**
+
+        The basis matrix ``a`` of many qubits is too large to be built.
+        With ``structured=True`` it is represented by a
+        :class:`~qiskit.ignis.verification.tomography.fitters.BasisMatrix`
+        operator of the tensor products of the single qubit operators, which
+        is never built. The ``lstsq`` method then solves the least-squares
+        problem iteratively with :func:`scipy.sparse.linalg.lsqr`, and the
+        ``cvx`` method minimizes an equivalent objective of the size of
+        ``x``. By default the operator is used when the dense basis matrix
+        would have more than :math:`2^{20}` elements.
+
         **CVXPY Solvers:**
 
         Various solvers can be called in CVXPY using the `solver` keyword
@@ -172,7 +190,7 @@ class TomographyFitter:
             `arXiv:1106.5458 <https://arxiv.org/abs/1106.5458>`_ [quant-ph].
 
         Args:
-            method: The fitter method 'auto', 'cvx' or 'lstsq'.
+            method: The fitter method 'auto', 'cvx', 'pgd' or 'lstsq'.
             standard_weights: (default: True) Apply weights to
                 tomography data based on count probability
             beta: hedging parameter for converting counts
@@ -183,6 +201,8 @@ class TomographyFitter:
                 trace preserving when fitting a Choi-matrix in quantum process
                 tomography. Note this method does not apply for 'lstsq' fitter
                 method.
+            structured: Use a structured operator instead of the dense
+                basis matrix (default: automatic by size).
             **kwargs: kwargs for fitter method.
         Raises:
             QiskitError: In case the fitting method is unrecognized.
@@ -192,7 +212,7 @@ class TomographyFitter:
         """
         # Get fitter data
         data, basis_matrix, weights = self._fitter_data(standard_weights,
-                                                        beta)
+                                                        beta, structured)
         # Choose automatic method
         if method == 'auto':
             if cvxpy is None:
@@ -214,8 +234,60 @@ class TomographyFitter:
                            trace_preserving=trace_preserving,
                            **kwargs)
 
+        if method == 'pgd':
+            return pgd_fit(data, basis_matrix,
+                           weights=weights,
+                           psd=psd,
+                           trace=trace,
+                           trace_preserving=trace_preserving,
+                           **kwargs)
+
         raise QiskitError('Unrecognized fit method {}'.format(method))
 
+    @classmethod
+    def fit_batch(cls,
+                  fitters: List['TomographyFitter'],
+                  standard_weights: bool = True,
+                  beta: float = 0.5,
+                  psd: bool = True,
+                  trace: Optional[int] = None,
+                  **kwargs) -> np.array:
+        r"""Reconstruct the quantum states of many fitters of the same
+        tomography circuits using least-squares fitting.
+
+        This is equivalent to calling :meth:`fit` with ``method='lstsq'``
+        for each fitter, but the basis matrix is only built once as the
+        fitters must have the same circuit labels and bases, such as the
+        fitters of tomography experiments run on many sets of qubits or at
+        many times. Without ``standard_weights`` the basis matrix is also
+        factorized only once, and the least-squares problems of all the
+        fitters are solved together.
+
+        Args:
+            fitters: the tomography fitters.
+            standard_weights: (default: True) Apply weights to
+                tomography data based on count probability
+            beta: hedging parameter for converting counts
+                to probabilities
+            psd: Enforced the fitted matrices to be positive semidefinite.
+            trace: trace constraint for the fitted matrices.
+            **kwargs: kwargs for the
+                :func:`~qiskit.ignis.verification.tomography.fitters.lstsq_fit.lstsq_fit_batch`
+                fitter function.
+        Raises:
+            QiskitError: If there are no fitters, or if they have different
+                circuit labels or bases.
+        Returns:
+            The array of shape (len(fitters), dim, dim) of the fitted
+            matrices of the fitters.
+        """
+        if not fitters:
+            raise QiskitError("No tomography fitters to fit.")
+        data, basis_matrix, weights = fitters[0]._batch_fitter_data(
+            fitters[1:], standard_weights, beta)
+        return lstsq_fit_batch(data, basis_matrix, weights=weights,
+                               psd=psd, trace=trace, **kwargs)
+
     @property
     def data(self):
         """
@@ -227,8 +299,8 @@ class TomographyFitter:
         """Add tomography data from a Qiskit Result object.
 
         Args:
-            result (Result): a Qiskit Result object obtained from executing
-                tomography circuits.
+            result (Result or CountsArray): a Qiskit Result object obtained
+                from executing tomography circuits, or its counts.
             circuits (list): a list of circuits or circuit names to extract
                 count information from the result object.
         """
@@ -237,9 +309,12 @@ class TomographyFitter:
         else:
             marginalize = True
 
+        # Read the counts of the result once
+        if not isinstance(result, CountsArray):
+            result = CountsArray.from_result(result)
+
         # Process measurement counts into probabilities
         for circ in circuits:
-            counts = result.get_counts(circ)
             if isinstance(circ, str):
                 tup = literal_eval(circ)
             elif isinstance(circ, QuantumCircuit):
@@ -247,13 +322,15 @@ class TomographyFitter:
             else:
                 tup = circ
             if marginalize:
-                counts = marginal_counts(counts, range(len(tup[0])))
+                counts = result.get_counts(circ, range(len(tup[0])))
+            else:
+                counts = result.get_counts(circ)
             if tup in self._data:
                 self._data[tup] = combine_counts(self._data[tup], counts)
             else:
                 self._data[tup] = counts
 
-    def _fitter_data(self, standard_weights, beta):
+    def _fitter_data(self, standard_weights, beta, structured=False):
         """Generate tomography fitter data from a tomography data dictionary.
 
         Args:
@@ -261,6 +338,10 @@ class TomographyFitter:
                 and data based on count probability (default: True)
             beta (float): hedging parameter for 0, 1
             probabilities (default: 0.5)
+            structured (bool): return the basis matrix as a
+                :class:`BasisMatrix` operator instead of a dense array,
+                ``None`` to use it when the dense array would have more
+                than ``2 ** 20`` elements (default: False).
 
         Returns:
             tuple: (data, basis_matrix, weights) where `data`
@@ -287,24 +368,83 @@ class TomographyFitter:
         else:
             preparation = None
 
-        data = []
         basis_blocks = []
+        basis_indices = []
+        # the products of the operators of this basis matrix
+        prep_memo = {}
+        meas_memo = {}
+
+        # Check if input data is state or process tomography data based
+        # on the label tuples
+        label = next(iter(self._data))
+        is_qpt = self._is_process_label(label)
+        if structured is None:
+            num_qubits = len(label[1]) if is_qpt else len(label)
+            size = len(self._data) * 2 ** num_qubits * 4 ** num_qubits
+            if is_qpt:
+                size *= 4 ** num_qubits
+            structured = size > 2 ** 20
+        data, weights = self._fitter_probabilities(self._data,
+                                                   standard_weights, beta)
+        for label in self._data:
+
+            # Get reconstruction basis operators
+            if is_qpt:
+                prep_label = label[0]
+                meas_label = label[1]
+            else:
+                prep_label = None
+                meas_label = label
+            if structured:
+                basis_indices.append((prep_label, meas_label))
+                continue
+            prep_op = self._preparation_op(prep_label, self._prep_basis,
+                                           prep_memo)
+            meas_ops = self._measurement_ops(meas_label, self._meas_basis,
+                                             meas_memo)
+            block = self._basis_operator_matrix(
+                [np.kron(prep_op.T, mop) for mop in meas_ops])
+            basis_blocks.append(block)
+
+        if structured:
+            return data, self._basis_matrix_operator(
+                basis_indices, preparation, measurement), weights
+        return data, np.vstack(basis_blocks), weights
+
+    @staticmethod
+    def _is_process_label(label) -> bool:
+        """Return whether a data label is a process tomography label."""
+        return (isinstance(label, tuple) and len(label) == 2 and
+                isinstance(label[0], tuple) and isinstance(label[1], tuple))
+
+    def _fitter_probabilities(self, labels, standard_weights, beta):
+        """Return the fitter data and weights of some tomography data labels.
+
+        Args:
+            labels (list): the labels of the data, in the order of the
+                rows of the basis matrix.
+            standard_weights (bool): compute the binomial weights.
+            beta (float): hedging parameter for the weights.
+
+        Returns:
+            tuple: (data, weights) the lists of the probabilities of the
+            outcomes of each label, and of their weights or ``None`` if
+            not ``standard_weights``.
+        """
+        data = []
         if standard_weights:
             weights = []
         else:
             weights = None
 
-        # Check if input data is state or process tomography data based
-        # on the label tuples
-        label = next(iter(self._data))
-        is_qpt = (isinstance(label, tuple) and len(label) == 2 and
-                  isinstance(label[0], tuple) and isinstance(label[1], tuple))
         # Generate counts keys for converting to np array
-        if is_qpt:
+        label = next(iter(labels))
+        if self._is_process_label(label):
             ctkeys = count_keys(len(label[1]))
         else:
             ctkeys = count_keys(len(label))
-        for label, cts in self._data.items():
+        for label in labels:
+            cts = self._data[label]
 
             # Convert counts dict to numpy array
             if isinstance(cts, dict):
@@ -319,21 +459,112 @@ class TomographyFitter:
             if standard_weights is True:
                 wts = self._binomial_weights(cts, beta)
                 weights += list(wts)
+        return data, weights
 
-            # Get reconstruction basis operators
-            if is_qpt:
-                prep_label = label[0]
-                meas_label = label[1]
-            else:
-                prep_label = None
-                meas_label = label
-            prep_op = self._preparation_op(prep_label, preparation)
-            meas_ops = self._measurement_ops(meas_label, measurement)
-            block = self._basis_operator_matrix(
-                [np.kron(prep_op.T, mop) for mop in meas_ops])
-            basis_blocks.append(block)
+    def _batch_fitter_data(self,
+                           fitters: List['TomographyFitter'],
+                           standard_weights: bool,
+                           beta: float
+                           ) -> Tuple[np.array, np.array, Optional[np.array]]:
+        """Generate the fitter data of many fitters of a common basis matrix.
 
-        return data, np.vstack(basis_blocks), weights
+        Args:
+            fitters: tomography fitters of the same labels and bases as
+                this fitter.
+            standard_weights: Apply weights to basis matrix and data
+                based on count probability.
+            beta: hedging parameter for 0, 1 probabilities.
+
+        Raises:
+            QiskitError: If the fitters have different labels or bases.
+
+        Returns:
+            tuple: (data, basis_matrix, weights) where `data` and `weights`
+            are arrays of the probabilities and of their weights for the
+            rows of the common `basis_matrix`, with a row for this fitter
+            followed by a row for each fitter, and `weights` is ``None``
+            without ``standard_weights``.
+        """
+        labels = list(self._data)
+        for fitter in fitters:
+            if fitter.measure_basis is not self._meas_basis or \
+                    fitter.preparation_basis is not self._prep_basis:
+                raise QiskitError("Batch fitted tomography data must have "
+                                  "the same bases.")
+            if len(fitter.data) != len(labels) or \
+                    any(label not in fitter.data for label in labels):
+                raise QiskitError("Batch fitted tomography data must have "
+                                  "the same labels.")
+
+        data, basis_matrix, weights = self._fitter_data(standard_weights, beta,
+                                                        structured=False)
+        data = [data]
+        weights = [weights]
+        for fitter in fitters:
+            fitter_data, fitter_weights = fitter._fitter_probabilities(
+                labels, standard_weights, beta)
+            data.append(fitter_data)
+            weights.append(fitter_weights)
+        if not standard_weights:
+            return np.array(data), basis_matrix, None
+        return np.array(data), basis_matrix, np.array(weights)
+
+    def _basis_matrix_operator(self,
+                               labels: List[Tuple[Optional[Tuple[str]], Tuple[str]]],
+                               prep_matrix_fn: Callable[[str], np.array],
+                               meas_matrix_fn: Callable[[str, int], np.array]
+                               ) -> BasisMatrix:
+        """Return the basis matrix of the labels as a BasisMatrix operator.
+
+        The rows are ordered as the rows built by :meth:`_preparation_op`
+        and :meth:`_measurement_ops`: the sites of the tensor products are
+        the preparations of the qubits from the last one to the first one,
+        followed by their measurements in the same order.
+
+        Args:
+            labels: the (preparation, measurement) label of each circuit,
+                with a ``None`` preparation label for state tomography.
+            prep_matrix_fn: a function that returns the matrix
+                corresponding to a single qubit preparation label.
+            meas_matrix_fn: a function that returns the matrix
+                corresponding to a single qubit measurement label
+                for a given outcome.
+
+        Returns:
+            The basis matrix operator.
+        """
+        num_qubits = len(labels[0][1])
+        has_prep = labels[0][0] is not None
+
+        # the distinct labels of each qubit
+        prep_names = [{} for _ in range(num_qubits)]
+        meas_names = [{} for _ in range(num_qubits)]
+        label_indices = []
+        for prep_label, meas_label in labels:
+            prep_index = [] if not has_prep else \
+                [prep_names[qubit].setdefault(name, len(prep_names[qubit]))
+                 for qubit, name in enumerate(prep_label)]
+            meas_index = [meas_names[qubit].setdefault(name, len(meas_names[qubit]))
+                          for qubit, name in enumerate(meas_label)]
+            label_indices.append(prep_index[::-1] + meas_index[::-1])
+        label_indices = np.array(label_indices, dtype=np.intp)
+
+        # the measurement sites index the (label, outcome) pairs
+        outcomes = np.array(sorted(it.product((0, 1), repeat=num_qubits)),
+                            dtype=np.intp)
+        offset = num_qubits if has_prep else 0
+        indices = np.repeat(label_indices, len(outcomes), axis=0)
+        indices[:, offset:] = 2 * indices[:, offset:] + \
+            np.tile(outcomes, (len(label_indices), 1))
+
+        local_ops = []
+        if has_prep:
+            for names in reversed(prep_names):
+                local_ops.append([np.transpose(prep_matrix_fn(name)) for name in names])
+        for names in reversed(meas_names):
+            local_ops.append([meas_matrix_fn(name, outcome)
+                              for name in names for outcome in (0, 1)])
+        return BasisMatrix(local_ops, indices)
 
     def _binomial_weights(self, counts: Dict[str, int],
                           beta: float = 0.5
@@ -415,7 +646,9 @@ class TomographyFitter:
 
     def _preparation_op(self,
                         label: Tuple[str],
-                        prep_matrix_fn: Callable[[str], np.array]
+                        prep_matrix_fn: Union[TomographyBasis,
+                                              Callable[[str], np.array]],
+                        memo: Optional[Dict] = None
                         ) -> np.array:
         """
         Return the multi-qubit matrix for a state preparation label.
@@ -427,6 +660,10 @@ class TomographyFitter:
                 corresponding to a single qubit preparation label.
                 The functions should have signature:
                     ``prep_matrix_fn(str) -> np.array``
+                For a TomographyBasis the operator of
+                :meth:`TomographyBasis.preparation_operator` is returned.
+            memo: the memo of the products of the TomographyBasis
+                operators (default: None).
         Returns:
             A Numpy array for the multi-qubit preparation operator specified
             by label.
@@ -441,6 +678,9 @@ class TomographyFitter:
         if label is None:
             return np.eye(1, dtype=complex)
 
+        if isinstance(prep_matrix_fn, TomographyBasis):
+            return prep_matrix_fn.preparation_operator(label, memo)
+
         # Construct preparation matrix
         op = np.eye(1, dtype=complex)
         for label_inst in label:
@@ -449,7 +689,9 @@ class TomographyFitter:
 
     def _measurement_ops(self,
                          label: Tuple[str],
-                         meas_matrix_fn: Callable[[str, int], np.array]
+                         meas_matrix_fn: Union[TomographyBasis,
+                                               Callable[[str, int], np.array]],
+                         memo: Optional[Dict] = None
                          ) -> List[np.array]:
         """
         Return a list multi-qubit matrices for a measurement label.
@@ -461,6 +703,10 @@ class TomographyFitter:
                 corresponding to a single qubit measurement label
                 for a given outcome. The functions should have
                 signature meas_matrix_fn(str, int) -> np.array
+                For a TomographyBasis the operators of
+                :meth:`TomographyBasis.measurement_operator` are returned.
+            memo: the memo of the products of the TomographyBasis
+                operators (default: None).
 
         Returns:
             A list of Numpy array for the multi-qubit measurement operators
@@ -479,6 +725,10 @@ class TomographyFitter:
         # Construct measurement POVM for all measurement outcomes for a given
         # measurement label. This will be a list of 2 ** n operators.
 
+        if isinstance(meas_matrix_fn, TomographyBasis):
+            return [meas_matrix_fn.measurement_operator(label, outcomes, memo)
+                    for outcomes in sorted(it.product((0, 1), repeat=num_qubits))]
+
         for outcomes in sorted(it.product((0, 1), repeat=num_qubits)):
             op = np.eye(1, dtype=complex)
             # Reverse label to correspond to QISKit bit ordering
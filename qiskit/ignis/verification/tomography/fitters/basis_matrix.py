@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Tomography basis matrix as a structured linear operator
+"""
+
+from typing import List
+import numpy as np
+from scipy.sparse.linalg import LinearOperator
+
+
+class BasisMatrix(LinearOperator):
+    r"""Tomography basis matrix of tensor product operators.
+
+    Each row of a tomography basis matrix is the conjugated column-major
+    vectorization :math:`\text{vec}(K_r)^\dagger` of an operator
+
+    .. math::
+
+        K_r = k^{(0)}_{a_{r,0}} \otimes k^{(1)}_{a_{r,1}} \otimes \dots
+        \otimes k^{(S-1)}_{a_{r,S-1}}
+
+    where :math:`k^{(s)}_a` are the single qubit preparation and measurement
+    matrices of the site :math:`s` of the tensor product. The rows are
+    represented by the indices :math:`a_{r,s}` into these local matrices,
+    and the products with vectors are computed by contracting each site in
+    turn, without building the basis matrix.
+    """
+
+    def __init__(self, local_ops: List[np.array], indices: np.array):
+        """Initialize a basis matrix.
+
+        Args:
+            local_ops: the local matrices of each site, as arrays of
+                shape (m, d, d) of the m matrices of dimension d.
+            indices: (rows, sites) the index of the local matrix of
+                each site for each row.
+        """
+        self._local_ops = [np.asarray(ops, dtype=complex) for ops in local_ops]
+        self._dims = tuple(ops.shape[1] for ops in self._local_ops)
+        self._grid = tuple(len(ops) for ops in self._local_ops)
+        self._dim = int(np.prod(self._dims, dtype=int))
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1, len(self._local_ops))
+        if self._local_ops:
+            self._rows = np.ravel_multi_index(indices.T, self._grid)
+        else:
+            self._rows = np.zeros(len(indices), dtype=np.intp)
+        self._unique_rows = np.unique(self._rows).size == self._rows.size
+        super().__init__(complex, (len(self._rows), self._dim ** 2))
+
+    @property
+    def local_ops(self):
+        """The local matrices of each site."""
+        return self._local_ops
+
+    def toarray(self) -> np.array:
+        """Return the basis matrix as a dense array.
+
+        Returns:
+            The dense basis matrix, as built by
+            :class:`~qiskit.ignis.verification.tomography.TomographyFitter`.
+        """
+        return self.matmat(np.eye(self.shape[1]))
+
+    def _matvec(self, x):
+        return self._matmat(np.reshape(x, (-1, 1)))[:, 0]
+
+    def _rmatvec(self, x):
+        return self._rmatmat(np.reshape(x, (-1, 1)))[:, 0]
+
+    def _matmat(self, X):
+        nsites = len(self._local_ops)
+        ncols = X.shape[1]
+        # axes (i_0, ..., i_S-1, j_0, ..., j_S-1, cols) of each vec(rho)
+        tensor = np.reshape(np.asarray(X, dtype=complex),
+                            (self._dim, self._dim, ncols), order='F')
+        tensor = np.reshape(tensor, self._dims + self._dims + (ncols,))
+        # contract each site in turn, appending its local matrix axis
+        for site, ops in enumerate(self._local_ops):
+            tensor = np.tensordot(tensor, ops.conj(),
+                                  axes=([0, nsites - site], [1, 2]))
+        tensor = np.reshape(tensor, (ncols, -1))
+        return tensor[:, self._rows].T
+
+    def _rmatmat(self, X):
+        ncols = X.shape[1]
+        X = np.asarray(X, dtype=complex)
+        grid = np.zeros((int(np.prod(self._grid, dtype=int)), ncols), dtype=complex)
+        if self._unique_rows:
+            grid[self._rows] = X
+        else:
+            np.add.at(grid, self._rows, X)
+        # axes (a_0, ..., a_S-1, cols), replace each site with (i_s, j_s)
+        tensor = np.reshape(grid, self._grid + (ncols,))
+        for ops in self._local_ops:
+            tensor = np.tensordot(tensor, ops, axes=([0], [0]))
+        # axes (cols, i_0, j_0, ..., i_S-1, j_S-1) to vec(rho) of each column
+        nsites = len(self._local_ops)
+        tensor = np.transpose(tensor, [0] + list(range(1, 2 * nsites + 1, 2)) +
+                              list(range(2, 2 * nsites + 1, 2)))
+        tensor = np.reshape(tensor, (ncols, self._dim, self._dim))
+        return np.reshape(np.transpose(tensor, (2, 1, 0)), (-1, ncols))
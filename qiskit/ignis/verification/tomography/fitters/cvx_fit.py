@@ -17,9 +17,11 @@
 CVXPY convex optimization quantum tomography fitter
 """
 
-from typing import Optional
+from typing import Optional, Tuple, Union
 import numpy as np
+from scipy import linalg as la
 from scipy import sparse as sps
+from scipy.sparse.linalg import LinearOperator, aslinearoperator
 
 # Check if CVXPY package is installed
 try:
@@ -29,7 +31,7 @@ except ImportError:
 
 
 def cvx_fit(data: np.array,
-            basis_matrix: np.array,
+            basis_matrix: Union[np.array, LinearOperator],
             weights: Optional[np.array] = None,
             psd: bool = True,
             trace: Optional[int] = None,
@@ -79,6 +81,14 @@ def cvx_fit(data: np.array,
     trace constraint is also specified that differs from this value the fit
     will likely fail.
 
+    **Linear operators**
+
+    If the basis matrix is a linear operator, such as a
+    :class:`~qiskit.ignis.verification.tomography.fitters.BasisMatrix`,
+    the objective is replaced with the equivalent :math:`||r * x - c||_2`
+    where :math:`r^T r = a^T a`, which has the size of x instead of the
+    size of the data (see :func:`compress_basis_matrix`).
+
     **CVXPY Solvers**
 
     Various solvers can be called in CVXPY using the `solver` keyword
@@ -88,7 +98,8 @@ def cvx_fit(data: np.array,
 
     Args:
         data: (vector like) vector of expectation values
-        basis_matrix: (matrix like) measurement operators
+        basis_matrix: (matrix like) measurement operators, or a
+            :class:`~scipy.sparse.linalg.LinearOperator` of them
         weights: (vector like) weights to apply to the
             objective function (default: None)
         psd: (default: True) enforces the fitted matrix to be positive
@@ -167,7 +178,10 @@ def cvx_fit(data: np.array,
     if weights is not None:
         w = np.array(weights)
         w = w / np.sqrt(sum(w**2))
-        basis_matrix = w[:, None] * basis_matrix
+        if isinstance(basis_matrix, LinearOperator):
+            basis_matrix = aslinearoperator(sps.diags(w)) @ basis_matrix
+        else:
+            basis_matrix = w[:, None] * basis_matrix
         data = w * data
 
     # OBJECTIVE FUNCTION
@@ -181,8 +195,11 @@ def cvx_fit(data: np.array,
     #                 = bm_r * vec(rho_r) - bm_i * vec(rho_i)
     # where we drop the imaginary part since the expectation value is real
 
-    bm_r = np.real(basis_matrix)
-    bm_i = np.imag(basis_matrix)
+    if isinstance(basis_matrix, LinearOperator):
+        bm_r, bm_i, data = compress_basis_matrix(basis_matrix, data)
+    else:
+        bm_r = np.real(basis_matrix)
+        bm_i = np.imag(basis_matrix)
 
     # CVXPY doesn't seem to handle sparse matrices very well so we convert
     # sparse matrices to Numpy arrays.
@@ -254,3 +271,53 @@ def partial_trace_super(dim1: int, dim2: int) -> np.array:
         ptr += sps.kron(tmp, tmp)
 
     return ptr
+
+
+def compress_basis_matrix(basis_matrix: LinearOperator,
+                          data: np.array,
+                          block_size: int = 2 ** 22
+                          ) -> Tuple[np.array, np.array, np.array]:
+    """
+    Return a compressed real objective of a basis matrix operator.
+
+    The real objective ``||bm_r * x_r - bm_i * x_i - data||_2`` of the
+    real and imaginary parts of ``x`` equals ``||b * z - data||_2`` for
+    ``z = [x_r; x_i]``. This returns ``r`` and ``c`` with ``r^T r = b^T b``
+    and ``r^T c = b^T data``, so that ``||r * z - c||_2`` has the same
+    minimum, from the Gram matrix ``b^T b`` which is computed from products
+    of the operator with blocks of columns.
+
+    Args:
+        basis_matrix: the basis matrix operator.
+        data: the vector of expectation values.
+        block_size: the maximal number of elements of the blocks of
+            the basis matrix.
+
+    Returns:
+        The ``(bm_r, bm_i, data)`` of the compressed objective.
+    """
+    rows, size = basis_matrix.shape
+    data = np.asarray(data, dtype=float)
+
+    # b.T * v = [Re(a.H * v); Im(a.H * v)] for real v
+    gram = np.zeros((2 * size, 2 * size))
+    step = max(1, block_size // max(rows, 1))
+    for start in range(0, size, step):
+        stop = min(start + step, size)
+        cols = np.zeros((size, stop - start))
+        cols[np.arange(start, stop), np.arange(stop - start)] = 1
+        block = basis_matrix.matmat(cols)
+        for offset, real_block in [(0, np.real(block)), (size, -np.imag(block))]:
+            adj = basis_matrix.rmatmat(real_block)
+            gram[:size, offset + start:offset + stop] = np.real(adj)
+            gram[size:, offset + start:offset + stop] = np.imag(adj)
+    adj = basis_matrix.rmatvec(data)
+    proj = np.concatenate([np.real(adj), np.imag(adj)])
+
+    # drop the null space of the anti-Hermitian part of x
+    vals, vecs = la.eigh(gram)
+    keep = vals > 1e-12 * max(vals[-1], 0)
+    sqrt_vals = np.sqrt(vals[keep])
+    mat = sqrt_vals[:, None] * vecs[:, keep].T
+    vec = (vecs[:, keep].T @ proj) / sqrt_vals
+    return mat[:, :size], -mat[:, size:], vec
@@ -16,14 +16,15 @@
 """
 Maximum-Likelihood estimation quantum tomography fitter
 """
-from typing import Optional
+from typing import Optional, Union
 import numpy as np
-from scipy import linalg as la
+from scipy import sparse as sps
 from scipy.linalg import lstsq
+from scipy.sparse.linalg import LinearOperator, aslinearoperator, lsqr
 
 
 def lstsq_fit(data: np.array,
-              basis_matrix: np.array,
+              basis_matrix: Union[np.array, LinearOperator],
               weights: Optional[np.array] = None,
               psd: bool = True,
               trace: Optional[int] = None
@@ -33,7 +34,9 @@ def lstsq_fit(data: np.array,
 
     Args:
         data: (vector like) expectation values
-        basis_matrix: (matrix like) measurement operators
+        basis_matrix: (matrix like) measurement operators, or a
+            :class:`~scipy.sparse.linalg.LinearOperator` of them such as
+            :class:`~qiskit.ignis.verification.tomography.fitters.BasisMatrix`
         weights: (vector like) of weights to apply to the
             objective function (default: None)
         psd: (default: true) Enforced the fitted matrix to be positive
@@ -68,6 +71,12 @@ def lstsq_fit(data: np.array,
         constraint the fitted matrix is rescaled using the method proposed in
         Reference [1].
 
+        Linear operators
+        ----------------
+        If the basis matrix is a linear operator, the least-squares
+        problem is solved iteratively with `scipy.sparse.linalg.lsqr`,
+        which only uses products of the operator with vectors.
+
         Trace constraint
         ----------------
         In general the trace of the fitted matrix will be determined by the
@@ -93,11 +102,16 @@ def lstsq_fit(data: np.array,
     # Optionally apply a weights vector to the data and projectors
     if weights is not None:
         weights_array = np.array(weights)
-        meas_matrix = weights_array[:, None] * meas_matrix
+        meas_matrix = scale_rows(meas_matrix, weights_array)
         exp_values = weights_array * exp_values
 
-    # Perform least squares fit using Scipy.linalg lstsq function
-    rho_fit, _, _, _ = lstsq(meas_matrix, exp_values)
+    if isinstance(meas_matrix, LinearOperator):
+        # Perform iterative least squares fit of the operator
+        rho_fit = lsqr(meas_matrix, exp_values, atol=1e-14, btol=1e-14,
+                       iter_lim=10 * meas_matrix.shape[1])[0]
+    else:
+        # Perform least squares fit using Scipy.linalg lstsq function
+        rho_fit, _, _, _ = lstsq(meas_matrix, exp_values)
 
     # Reshape fit to a density matrix
     size = len(rho_fit)
@@ -117,6 +131,93 @@ def lstsq_fit(data: np.array,
     return rho_fit
 
 
+def lstsq_fit_batch(data: np.array,
+                    basis_matrix: np.array,
+                    weights: Optional[np.array] = None,
+                    psd: bool = True,
+                    trace: Optional[int] = None
+                    ) -> np.array:
+    r"""
+    Reconstruct many density matrices of a common basis matrix using MLE
+    least-squares fitting.
+
+    This is equivalent to calling :func:`lstsq_fit` for each data vector,
+    but the basis matrix is only factorized once when the weights are
+    the same for all the data vectors, and all the least-squares problems
+    are solved together. The PSD and trace constraints are applied to
+    all the fitted matrices at once.
+
+    Args:
+        data: (matrix like) the expectation values of each data set as an
+            array of shape (num_data, rows).
+        basis_matrix: (matrix like) measurement operators common to all
+            the data sets.
+        weights: (vector or matrix like) the weights of each data set of
+            shape (num_data, rows), or common weights of shape (rows,)
+            (default: None)
+        psd: (default: true) Enforced the fitted matrices to be positive
+            semidefinite (default: True)
+        trace: trace constraint for the fitted matrices
+            (default: None).
+    Raises:
+        ValueError: If the fitted vectors are not square matrices
+    Returns:
+        The array of shape (num_data, dim, dim) of the fitted matrices.
+    """
+    meas_matrix = np.asarray(basis_matrix)
+    exp_values = np.array(data, dtype=float, ndmin=2)
+
+    if weights is not None:
+        weights_array = np.array(weights, dtype=float)
+        if weights_array.ndim == 2 and np.all(weights_array == weights_array[:1]):
+            weights_array = weights_array[0]
+        exp_values = weights_array * exp_values
+
+    if weights is None or weights_array.ndim == 1:
+        # Factorize the (weighted) basis matrix once for all the data
+        if weights is not None:
+            meas_matrix = scale_rows(meas_matrix, weights_array)
+        rho_fit = lstsq(meas_matrix, exp_values.T)[0].T
+    else:
+        rho_fit = np.array([lstsq(scale_rows(meas_matrix, wts), vals)[0]
+                            for wts, vals in zip(weights_array, exp_values)])
+
+    # Reshape fits to density matrices
+    size = rho_fit.shape[1]
+    dim = int(np.sqrt(size))
+    if dim * dim != size:
+        raise ValueError("fitted vector is not a square matrix.")
+    # Devectorize in column-major (Fortran order in Numpy)
+    rho_fit = np.swapaxes(rho_fit.reshape(-1, dim, dim), 1, 2)
+
+    # Rescale fitted density matrices be positive-semidefinite
+    if psd is True:
+        rho_fit = make_positive_semidefinite(rho_fit)
+
+    # Rescale fitted density matrices to satisfy trace constraint
+    if trace is not None:
+        rho_fit *= trace / np.trace(rho_fit, axis1=1, axis2=2)[:, None, None]
+    return rho_fit
+
+
+def scale_rows(basis_matrix: Union[np.array, LinearOperator],
+               weights: np.array) -> Union[np.array, LinearOperator]:
+    """
+    Multiply the rows of a basis matrix by weights.
+
+    Args:
+        basis_matrix: a basis matrix, or a linear operator of it.
+        weights: the weight of each row.
+
+    Returns:
+        The weighted basis matrix, as a linear operator if the basis
+        matrix is one.
+    """
+    if isinstance(basis_matrix, LinearOperator):
+        return aslinearoperator(sps.diags(weights)) @ basis_matrix
+    return weights[:, None] * basis_matrix
+
+
 ###########################################################################
 # Wizard Method rescaling
 ###########################################################################
@@ -128,7 +229,8 @@ def make_positive_semidefinite(mat: np.array,
     Rescale a Hermitian matrix to nearest postive semidefinite matrix.
 
     Args:
-        mat: a hermitian matrix.
+        mat: a hermitian matrix, or an array of shape (..., dim, dim) of
+            hermitian matrices which are rescaled together.
         epsilon: (default: 0) the threshold for setting
             eigenvalues to zero. If epsilon > 0 positive eigenvalues
             below epsilon will also be set to zero.
@@ -147,25 +249,19 @@ def make_positive_semidefinite(mat: np.array,
 
     # Get the eigenvalues and eigenvectors of rho
     # eigenvalues are sorted in increasing order
-    # v[i] <= v[i+1]
+    # v[..., i] <= v[..., i+1]
 
-    dim = len(mat)
-    v, w = la.eigh(mat)
+    dim = np.shape(mat)[-1]
+    v, w = np.linalg.eigh(mat)
     for j in range(dim):
-        if v[j] < epsilon:
-            tmp = v[j]
-            v[j] = 0.
-            # Rescale remaining eigenvalues
-            x = 0.
-            for k in range(j + 1, dim):
-                x += tmp / (dim - (j + 1))
-                v[k] = v[k] + tmp / (dim - (j + 1))
+        # Set the eigenvalues below epsilon of all the matrices to zero
+        tmp = np.where(v[..., j] < epsilon, v[..., j], 0.)
+        v[..., j] -= tmp
+        # Rescale remaining eigenvalues
+        if j + 1 < dim:
+            v[..., j + 1:] += tmp[..., None] / (dim - (j + 1))
 
     # Build positive matrix from the rescaled eigenvalues
     # and the original eigenvectors
-
-    mat_psd = np.zeros([dim, dim], dtype=complex)
-    for j in range(dim):
-        mat_psd += v[j] * np.outer(w[:, j], np.conj(w[:, j]))
-
-    return mat_psd
+    mat_psd = (w * v[..., None, :]) @ np.conj(np.swapaxes(w, -1, -2))
+    return mat_psd.astype(complex)
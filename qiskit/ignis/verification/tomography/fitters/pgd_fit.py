@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+
+"""
+Projected gradient quantum tomography fitter
+"""
+
+from typing import Optional, Union
+import numpy as np
+from scipy import linalg as la
+from scipy.sparse.linalg import LinearOperator, aslinearoperator
+
+from .lstsq_fit import scale_rows
+
+
+def pgd_fit(data: np.array,
+            basis_matrix: Union[np.array, LinearOperator],
+            weights: Optional[np.array] = None,
+            psd: bool = True,
+            trace: Optional[int] = None,
+            trace_preserving: bool = False,
+            max_iter: int = 5000,
+            tol: float = 1e-8,
+            ) -> np.array:
+    r"""
+    Reconstruct a quantum state using accelerated projected gradient descent.
+
+    **Objective function**
+
+    This fitter solves the same constrained least-squares minimization as
+    :func:`~qiskit.ignis.verification.tomography.fitters.cvx_fit.cvx_fit`:
+    :math:`minimize: ||a * x - b ||_2`
+
+    subject to:
+
+    * :math:`x >> 0` (PSD, optional)
+    * :math:`\text{trace}(x) = t` (trace, optional)
+    * :math:`\text{partial_trace}(x)` = identity (trace_preserving, optional)
+
+    where:
+    * a is the matrix of measurement operators :math:`a[i] = vec(M_i).H`
+    * b is the vector of expectation value data for each projector
+      :math:`b[i] ~ \text{Tr}[M_i.H * x] = (a * x)[i]`
+    * x is the vectorized density matrix (or Choi-matrix) to be fitted
+
+    **Algorithm**
+
+    The minimization uses the accelerated projected gradient method
+    (FISTA) with adaptive restarts, with NumPy only. Each step is a
+    gradient step of the objective followed by the projection of the
+    Hermitian matrix onto the constraints. For the PSD and trace
+    constraints the projection replaces the eigenvalues with their
+    projection onto the non-negative numbers of sum ``trace``. For the
+    trace preserving constraint, the projection onto the intersection of
+    the PSD cone and of the trace preserving matrices is computed with
+    Dykstra's alternating projections, and its result is mixed with the
+    completely depolarizing channel as needed to be exactly PSD (up to
+    rounding errors). The trace preserving constraint
+    implies the trace of the fitted matrix, so the trace constraint is not
+    used with it.
+
+    The basis matrix may be a :class:`~scipy.sparse.linalg.LinearOperator`,
+    such as a
+    :class:`~qiskit.ignis.verification.tomography.fitters.BasisMatrix`,
+    as it is only used in products with vectors.
+
+    Args:
+        data: (vector like) vector of expectation values
+        basis_matrix: (matrix like) measurement operators, or a
+            :class:`~scipy.sparse.linalg.LinearOperator` of them
+        weights: (vector like) weights to apply to the
+            objective function (default: None)
+        psd: (default: True) enforces the fitted matrix to be positive
+            semidefinite (default: True)
+        trace: trace constraint for the fitted matrix
+            (default: None).
+        trace_preserving: (default: False) Enforce the fitted matrix to be
+            trace preserving when fitting a Choi-matrix in quantum process
+            tomography (default: False).
+        max_iter: the maximal number of gradient steps (default: 5000).
+        tol: the fit stops when a step changes the fitted matrix by less
+            than this relative tolerance in Frobenius norm
+            (default: 1e-8).
+    Raises:
+        ValueError: If the fitted vector is not a square matrix, or the
+            Choi-matrix is not of a channel with the same input and output
+            dimensions.
+    Returns:
+        The fitted matrix rho that minimizes
+            :math:`||basis_matrix * vec(rho) - data||_2`.
+    """
+    data = np.asarray(data, dtype=float)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=float)
+        basis_matrix = scale_rows(basis_matrix, weights)
+        data = weights * data
+    basis_matrix = aslinearoperator(basis_matrix)
+
+    size = basis_matrix.shape[1]
+    dim = int(np.sqrt(size))
+    if dim * dim != size:
+        raise ValueError("fitted vector is not a square matrix.")
+    sdim = None
+    if trace_preserving:
+        sdim = int(np.sqrt(dim))
+        if sdim * sdim != dim:
+            raise ValueError("Input data does not correspond "
+                             "to a process matrix.")
+        trace = None
+
+    def project(mat, precision=tol):
+        if sdim is not None:
+            return _project_trace_preserving(mat, sdim, psd, tol=precision)
+        return _project_hermitian(mat, psd, trace)
+
+    def gradient(mat):
+        # the residuals of a Hermitian matrix are real
+        res = np.real(basis_matrix.matvec(mat.ravel(order='F'))) - data
+        grad = basis_matrix.rmatvec(res).reshape((dim, dim), order='F')
+        return (grad + grad.conj().T) / 2
+
+    # the Lipschitz constant of the gradient is the largest eigenvalue
+    # of a.H * a, estimated by power iterations
+    rng = np.random.default_rng(0)
+    vec = rng.normal(size=size) + 1j * rng.normal(size=size)
+    lipschitz = 0
+    for _ in range(100):
+        vec = basis_matrix.rmatvec(basis_matrix.matvec(vec / la.norm(vec)))
+        new_lipschitz = la.norm(vec)
+        if new_lipschitz - lipschitz <= 1e-4 * new_lipschitz:
+            break
+        lipschitz = new_lipschitz
+    step = 1 / (1.1 * max(new_lipschitz, np.finfo(float).tiny))
+
+    # start from the maximally mixed state
+    rho = project(np.eye(dim, dtype=complex) * (trace or 1) / dim)
+    point = rho
+    momentum = 1
+    change = np.inf
+    for _ in range(max_iter):
+        # the iterative projections only need the precision of the step
+        precision = max(tol, min(1e-3, 1e-2 * change / max(la.norm(rho), 1)))
+        new_rho = project(point - step * gradient(point), precision)
+        new_momentum = (1 + np.sqrt(1 + 4 * momentum ** 2)) / 2
+        change = la.norm(new_rho - rho)
+        if np.real(np.vdot(point - new_rho, new_rho - rho)) > 0:
+            # restart the momentum when it goes against the gradient
+            new_momentum = 1
+            point = new_rho
+        else:
+            point = new_rho + (momentum - 1) / new_momentum * (new_rho - rho)
+        rho, momentum = new_rho, new_momentum
+        if change <= tol * max(la.norm(rho), 1) and precision <= tol:
+            break
+    return rho
+
+
+###########################################################################
+# Projections
+###########################################################################
+
+def _project_simplex(vals: np.array, total: float) -> np.array:
+    """Return the projection of a vector onto the simplex of sum ``total``."""
+    if total <= 0:
+        return np.zeros_like(vals)
+    desc = np.sort(vals)[::-1]
+    cumsum = np.cumsum(desc) - total
+    ind = np.arange(1, len(vals) + 1)
+    rho = ind[desc - cumsum / ind > 0][-1]
+    return np.maximum(vals - cumsum[rho - 1] / rho, 0)
+
+
+def _project_hermitian(mat: np.array, psd: bool,
+                       trace: Optional[float]) -> np.array:
+    """Return the projection of a Hermitian matrix onto the constraints."""
+    dim = len(mat)
+    if not psd:
+        if trace is None:
+            return mat
+        return mat + (trace - np.real(np.trace(mat))) / dim * np.eye(dim)
+    vals, vecs = la.eigh(mat)
+    if trace is None:
+        vals = np.maximum(vals, 0)
+    else:
+        vals = _project_simplex(vals, trace)
+    return (vecs * vals) @ vecs.conj().T
+
+
+def _project_tp(mat: np.array, sdim: int) -> np.array:
+    """Return the projection of a Choi-matrix onto the trace preserving
+    matrices, which have the identity as partial trace over the output."""
+    ptr = np.einsum('ajbj->ab', mat.reshape((sdim,) * 4))
+    return mat - np.kron(ptr - np.eye(sdim), np.eye(sdim)) / sdim
+
+
+def _project_trace_preserving(mat: np.array, sdim: int, psd: bool,
+                              max_iter: int = 200,
+                              tol: float = 1e-12) -> np.array:
+    """Return the projection of a Choi-matrix onto the trace preserving
+    matrices, which are also PSD if ``psd``, by Dykstra's algorithm.
+
+    Dykstra's iterates are only PSD up to the tolerance, so the last one
+    is mixed with the completely depolarizing channel, which is trace
+    preserving, to make it exactly PSD.
+    """
+    if not psd:
+        return _project_tp(mat, sdim)
+    tp_mat = mat
+    psd_inc = np.zeros_like(mat)
+    tp_inc = np.zeros_like(mat)
+    for _ in range(max_iter):
+        psd_mat = _project_hermitian(tp_mat + psd_inc, True, None)
+        psd_inc = tp_mat + psd_inc - psd_mat
+        new_tp_mat = _project_tp(psd_mat + tp_inc, sdim)
+        tp_inc = psd_mat + tp_inc - new_tp_mat
+        change = la.norm(new_tp_mat - tp_mat)
+        tp_mat = new_tp_mat
+        if change <= tol * max(la.norm(tp_mat), 1):
+            break
+    # the smallest t such that (1 - t) * tp_mat + t * I / sdim is PSD
+    min_eig = la.eigvalsh(tp_mat)[0]
+    if min_eig < 0:
+        mix = -min_eig / (1 / sdim - min_eig)
+        tp_mat = (1 - mix) * tp_mat + mix * np.eye(len(tp_mat)) / sdim
+    return tp_mat
@@ -17,12 +17,14 @@
 Maximum-Likelihood estimation quantum process tomography fitter
 """
 
+from typing import List, Optional
 import numpy as np
 from qiskit import QiskitError
 from qiskit.quantum_info.operators import Choi
 from .base_fitter import TomographyFitter
 from .cvx_fit import cvxpy, cvx_fit
 from .lstsq_fit import lstsq_fit
+from .pgd_fit import pgd_fit
 
 
 class ProcessTomographyFitter(TomographyFitter):
@@ -32,6 +34,7 @@ class ProcessTomographyFitter(TomographyFitter):
             method: str = 'auto',
             standard_weights: bool = True,
             beta: float = 0.5,
+            structured: Optional[bool] = None,
             **kwargs) -> Choi:
         r"""Reconstruct a quantum channel using CVXPY convex optimization.
 
@@ -47,6 +50,8 @@ class ProcessTomographyFitter(TomographyFitter):
 
         The ``cvx`` fitter method used CVXPY convex optimization package.
         The ``lstsq`` method uses least-squares fitting (linear inversion).
+        The ``pgd`` method solves the same problem as ``cvx`` with a native
+        accelerated projected gradient solver, which does not need CVXPY.
         The ``auto`` method will use ``cvx`` if the CVXPY package is found on
         the system, otherwise it will default to ``lstsq``.
 
@@ -108,11 +113,15 @@ class ProcessTomographyFitter(TomographyFitter):
             (2012). Open access: arXiv:1106.5458 [quant-ph].
 
         Args:
-            method: (default: 'auto') the fitter method 'auto', 'cvx' or 'lstsq'.
+            method: (default: 'auto') the fitter method 'auto', 'cvx', 'pgd'
+                or 'lstsq'.
             standard_weights: (default: True) apply weights
                 to tomography data based on count probability
             beta: (default: 0.5) hedging parameter for converting counts
                 to probabilities
+            structured: Use a structured operator instead of the dense
+                basis matrix (default: automatic by size), see
+                :meth:`TomographyFitter.fit`.
             **kwargs: kwargs for fitter method.
 
         Raises:
@@ -127,7 +136,7 @@ class ProcessTomographyFitter(TomographyFitter):
         """
         # Get fitter data
         data, basis_matrix, weights = self._fitter_data(standard_weights,
-                                                        beta)
+                                                        beta, structured)
 
         # Calculate trace of Choi-matrix from projector length
         _, cols = np.shape(basis_matrix)
@@ -147,4 +156,45 @@ class ProcessTomographyFitter(TomographyFitter):
         if method == 'cvx':
             return Choi(cvx_fit(data, basis_matrix, weights=weights, trace=dim,
                                 trace_preserving=True, **kwargs))
+        if method == 'pgd':
+            return Choi(pgd_fit(data, basis_matrix, weights=weights, trace=dim,
+                                trace_preserving=True, **kwargs))
         raise QiskitError('Unrecognized fit method {}'.format(method))
+
+    @classmethod
+    def fit_batch(cls,  # pylint: disable=arguments-differ
+                  fitters: List['ProcessTomographyFitter'],
+                  standard_weights: bool = True,
+                  beta: float = 0.5,
+                  **kwargs) -> List[Choi]:
+        r"""Reconstruct the quantum channels of many fitters of the same
+        tomography circuits using least-squares fitting.
+
+        This is equivalent to calling :meth:`fit` with ``method='lstsq'``
+        for each fitter, but the basis matrix is only built once, see
+        :meth:`TomographyFitter.fit_batch`.
+
+        Args:
+            fitters: the process tomography fitters.
+            standard_weights: (default: True) Apply weights to
+                tomography data based on count probability
+            beta: (default: 0.5) hedging parameter for converting counts
+                to probabilities
+            **kwargs: kwargs for the
+                :func:`~qiskit.ignis.verification.tomography.fitters.lstsq_fit.lstsq_fit_batch`
+                fitter function.
+
+        Raises:
+            QiskitError: If there are no fitters, or if they have different
+                circuit labels or bases.
+
+        Returns:
+            The fitted Choi-matrices of the fitters.
+        """
+        if not fitters:
+            raise QiskitError("No tomography fitters to fit.")
+        # Trace of the Choi-matrix from the number of prepared qubits
+        dim = 2 ** len(next(iter(fitters[0].data))[0])
+        chois = super().fit_batch(fitters, standard_weights, beta,
+                                  trace=dim, **kwargs)
+        return [Choi(choi) for choi in chois]
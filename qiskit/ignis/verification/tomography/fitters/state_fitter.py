@@ -15,19 +15,29 @@
 
 """Maximum-Likelihood estimation quantum state tomography fitter
 """
-from typing import List, Union
+import itertools as it
+from typing import List, Union, Optional
 import numpy as np
 from qiskit.result import Result
 from qiskit import QuantumCircuit
-from ..basis import TomographyBasis
+from ....counts_array import CountsArray
+from ....utils import walsh_hadamard
+from ..basis import TomographyBasis, PauliBasis
+from ..data import count_keys
 from .base_fitter import TomographyFitter
+from .cvx_fit import cvxpy
+from .lstsq_fit import make_positive_semidefinite
+
+# Pauli matrices I, X, Y, Z
+_PAULIS = np.array([[[1, 0], [0, 1]], [[0, 1], [1, 0]],
+                    [[0, -1j], [1j, 0]], [[1, 0], [0, -1]]], dtype=complex)
 
 
 class StateTomographyFitter(TomographyFitter):
     """Maximum-Likelihood estimation state tomography fitter."""
 
     def __init__(self,
-                 result: Result,
+                 result: Union[Result, CountsArray],
                  circuits: List[QuantumCircuit],
                  meas_basis: Union[TomographyBasis, str] = 'Pauli'
                  ):
@@ -35,7 +45,7 @@ class StateTomographyFitter(TomographyFitter):
 
         Args:
             result: a Qiskit Result object obtained from executing
-                tomography circuits.
+                tomography circuits, or its counts as a CountsArray.
             circuits: a list of circuits or circuit names to extract
                 count information from the result object.
             meas_basis: (default: 'Pauli') A function to return measurement
@@ -48,6 +58,7 @@ class StateTomographyFitter(TomographyFitter):
             method: str = 'auto',
             standard_weights: bool = True,
             beta: float = 0.5,
+            structured: Optional[bool] = None,
             **kwargs) -> np.array:
         r"""Reconstruct a quantum state using CVXPY convex optimization.
 
@@ -55,9 +66,16 @@ class StateTomographyFitter(TomographyFitter):
 
         The ``cvx`` fitter method used CVXPY convex optimization package.
         The ``lstsq`` method uses least-squares fitting (linear inversion).
+        The ``pgd`` method solves the same problem as ``cvx`` with a native
+        accelerated projected gradient solver, which does not need CVXPY.
         The ``auto`` method will use 'cvx' if the CVXPY package is found on
         the system, otherwise it will default to 'lstsq'.
 
+        For the measurement of all the bases of the built-in ``'Pauli'``
+        basis, the unweighted ``lstsq`` fit (``standard_weights=False``)
+        is computed directly by linear inversion of the Pauli expectation
+        values of the counts, without solving the least-squares problem.
+
         **Objective function**
 
         This fitter solves the constrained least-squares minimization:
@@ -106,11 +124,14 @@ class StateTomographyFitter(TomographyFitter):
             (2012). Open access: arXiv:1106.5458 [quant-ph].
 
         Args:
-            method: The fitter method 'auto', 'cvx' or 'lstsq'.
+            method: The fitter method 'auto', 'cvx', 'pgd' or 'lstsq'.
             standard_weights: (default: True) Apply weights to
                 tomography data based on count probability
             beta: (default: 0.5) hedging parameter for converting counts
                 to probabilities
+            structured: Use a structured operator instead of the dense
+                basis matrix (default: automatic by size), see
+                :meth:`TomographyFitter.fit`.
             **kwargs: kwargs for fitter method.
         Raises:
             QiskitError: In case the fitting method is unrecognized.
@@ -119,5 +140,103 @@ class StateTomographyFitter(TomographyFitter):
             :math:`||\text{basis_matrix} \cdot
             \text{vec}(\text{rho}) - \text{data}||_2`.
         """
+        if method == 'auto' and cvxpy is None:
+            method = 'lstsq'
+        if method == 'lstsq' and not standard_weights and not kwargs:
+            expvals = self._pauli_expectation_values()
+            if expvals is not None:
+                rho = make_positive_semidefinite(_pauli_to_matrix(expvals))
+                return rho / np.trace(rho)
         return super().fit(method, standard_weights, beta,
-                           trace=1, psd=True, **kwargs)
+                           trace=1, psd=True, structured=structured, **kwargs)
+
+    @classmethod
+    def fit_batch(cls,  # pylint: disable=arguments-differ
+                  fitters: List['StateTomographyFitter'],
+                  standard_weights: bool = True,
+                  beta: float = 0.5,
+                  **kwargs) -> np.array:
+        r"""Reconstruct the quantum states of many fitters of the same
+        tomography circuits using least-squares fitting.
+
+        This is equivalent to calling :meth:`fit` with ``method='lstsq'``
+        for each fitter, but the basis matrix is only built once, see
+        :meth:`TomographyFitter.fit_batch`. Without ``standard_weights``
+        it is also factorized only once.
+
+        Args:
+            fitters: the state tomography fitters, such as the fitters of
+                the same tomography circuits on many sets of qubits.
+            standard_weights: (default: True) Apply weights to
+                tomography data based on count probability
+            beta: (default: 0.5) hedging parameter for converting counts
+                to probabilities
+            **kwargs: kwargs for the
+                :func:`~qiskit.ignis.verification.tomography.fitters.lstsq_fit.lstsq_fit_batch`
+                fitter function.
+        Raises:
+            QiskitError: If there are no fitters, or if they have different
+                circuit labels or bases.
+        Returns:
+            The array of shape (len(fitters), dim, dim) of the fitted
+            density matrices of the fitters.
+        """
+        return super().fit_batch(fitters, standard_weights, beta,
+                                 trace=1, psd=True, **kwargs)
+
+    def _pauli_expectation_values(self) -> Optional[np.array]:
+        r"""Return the Pauli expectation values of complete Pauli data.
+
+        The unweighted least-squares fit of the measurements of all the
+        Pauli bases is the linear inversion of the expectation values of
+        all the Pauli operators, each averaged over all the measurement
+        bases which measure it.
+
+        Returns:
+            The expectation value of the Pauli operator
+            :math:`\sigma_{i_{n-1}} \otimes \dots \otimes \sigma_{i_0}`
+            at index :math:`\sum_q i_q 4^q` with :math:`\sigma_{0, 1, 2, 3}
+            = I, X, Y, Z`, or ``None`` if the data is not the measurement of
+            all the Pauli bases.
+        """
+        if self._meas_basis is not PauliBasis:
+            return None
+        labels = list(self._data)
+        num_qubits = len(labels[0])
+        if len(labels) != 3 ** num_qubits or \
+                set(labels) != set(it.product('XYZ', repeat=num_qubits)):
+            return None
+
+        ctkeys = count_keys(num_qubits)
+        probs = []
+        for cts in self._data.values():
+            if isinstance(cts, dict):
+                cts = [cts.get(key, 0) for key in ctkeys]
+            probs.append(np.array(cts) / np.sum(cts))
+        # the Z-correlators of the outcomes of each basis
+        expvals = walsh_hadamard(np.array(probs))
+
+        # the Pauli operator of each basis and correlator
+        digits = np.array([['IXYZ'.index(name) for name in label] for label in labels])
+        masks = (np.arange(2 ** num_qubits)[:, None] >> np.arange(num_qubits)) & 1
+        paulis = (digits * 4 ** np.arange(num_qubits)) @ masks.T
+        sums = np.bincount(paulis.ravel(), expvals.ravel(), minlength=4 ** num_qubits)
+        nums = np.bincount(paulis.ravel(), minlength=4 ** num_qubits)
+        return sums / nums
+
+
+def _pauli_to_matrix(expvals: np.array) -> np.array:
+    """Return the density matrix of Pauli expectation values.
+
+    Contracts the Pauli index of each qubit with the Pauli matrices in
+    turn, in :math:`O(n 4^n)` time for ``n`` qubits.
+    """
+    num_qubits = int(round(np.log2(len(expvals)) / 2))
+    tensor = np.reshape(expvals, num_qubits * (4,))
+    for _ in range(num_qubits):
+        tensor = np.tensordot(tensor, _PAULIS, axes=([0], [0]))
+    # axes (row, col) of each qubit to (rows, cols)
+    tensor = np.transpose(tensor, list(range(0, 2 * num_qubits, 2)) +
+                          list(range(1, 2 * num_qubits, 2)))
+    dim = 2 ** num_qubits
+    return np.reshape(tensor, (dim, dim)) / dim
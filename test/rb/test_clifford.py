@@ -19,6 +19,10 @@ Test Clifford functions:
 - Generating a pseudo-random Clifford (using the tables):
   clifford_utils.random_gates
 - Inverting a Clifford: clifford_utils.find_inverse_gates
+- Random Cliffords on any number of qubits and their synthesis:
+  clifford_utils.random_clifford_gates and clifford_utils.clifford_gates
+- The bit-packed Clifford tableau: PackedClifford
+- The integer-indexed Clifford group: CliffordGroup
 """
 
 import unittest
@@ -29,6 +33,8 @@ import numpy as np
 # Import the clifford_utils functions
 from qiskit.ignis.verification.randomized_benchmarking \
     import CliffordUtils as clutils
+from qiskit.ignis.verification.randomized_benchmarking \
+    import Clifford, PackedClifford, CliffordGroup
 
 
 class TestClifford(unittest.TestCase):
@@ -109,6 +115,108 @@ class TestClifford(unittest.TestCase):
                          "Error: random and/or inverse cliffords are not "
                          "the same")
 
+    def test_packed_clifford(self):
+        """
+            test: the bit-packed tableau gives the same tables, phases
+            and indices as the Clifford class
+        """
+        gates = ['x', 'y', 'z', 'h', 's', 'sdg', 'v', 'w',
+                 'cx', 'cz', 'swap']
+        rng = np.random.RandomState(1234)
+        for num_qubits in [1, 2, 3, 40]:
+            for _ in range(self.number_of_tests):
+                cliff = Clifford(num_qubits)
+                packed = PackedClifford(num_qubits)
+                for _ in range(50):
+                    gate = gates[rng.randint(len(gates))]
+                    if gate in ('cx', 'cz', 'swap'):
+                        if num_qubits == 1:
+                            continue
+                        qubits = rng.choice(num_qubits, 2, replace=False)
+                    else:
+                        qubits = [rng.randint(num_qubits)]
+                    qubits = [int(q) for q in qubits]
+                    getattr(cliff, gate)(*qubits)
+                    getattr(packed, gate)(*qubits)
+                np.testing.assert_array_equal(cliff.table, packed.table)
+                np.testing.assert_array_equal(cliff.phases, packed.phases)
+                self.assertEqual(cliff.index(), packed.index())
+                self.assertEqual(
+                    PackedClifford.from_clifford(cliff).index(),
+                    cliff.index())
+
+    def test_packed_tables(self):
+        """
+            test: generating the tables with the packed tableau
+        """
+        packed_utils = clutils(packed=True)
+        self.assertEqual(self.clutils.clifford1_gates_table(),
+                         packed_utils.clifford1_gates_table())
+        self.assertEqual(self.clutils.clifford2_gates_table(),
+                         packed_utils.clifford2_gates_table())
+
+    def test_clifford_group(self):
+        """
+            test: composing and inverting elements of the
+            integer-indexed Clifford group
+        """
+        rng = np.random.RandomState(1234)
+        for num_qubits in range(1, 1 + self.max_nq):
+            group = CliffordGroup(num_qubits)
+            if num_qubits == 1:
+                table = self.clutils.clifford1_gates_table()
+            else:
+                table = self.clutils.clifford2_gates_table()
+            self.assertEqual(group.size, len(table))
+            for idx in range(group.size):
+                self.assertEqual(group.gatelist(idx),
+                                 table[int(group.keys[idx])])
+            # compare the group product to the tableau simulation
+            for _ in range(10 * self.number_of_tests):
+                idx1, idx2 = [int(x) for x in rng.randint(group.size, size=2)]
+                cliff = self.clutils.clifford_from_gates(
+                    num_qubits, group.gatelist(idx1) + group.gatelist(idx2))
+                self.assertEqual(group.compose(idx1, idx2),
+                                 group.index(cliff))
+                self.assertEqual(
+                    group.compose(np.array([idx1]), np.array([idx2]))[0],
+                    group.index(cliff))
+                cliff = self.clutils.clifford_from_gates(
+                    num_qubits,
+                    group.gatelist(idx1) + group.inverse_gatelist(idx1))
+                self.assertEqual(group.index(cliff), 0)
+                self.assertEqual(group.compose(idx1, group.inverse(idx1)), 0)
+            idx = np.arange(group.size)
+            np.testing.assert_array_equal(
+                group.compose(idx, group.inverse(idx)), 0)
+
+    def test_random_clifford_many_qubits(self):
+        """
+            test: random Cliffords on more than 2 qubits,
+            and their inverse and synthesis from the tableau
+        """
+        rng = np.random.default_rng(10)
+        for num_qubits in range(1, 8):
+            for _ in range(self.number_of_tests):
+                gatelist = self.clutils.random_gates(num_qubits, rng=rng)
+                cliff = self.clutils.clifford_from_gates(num_qubits, gatelist)
+                inv_gatelist = self.clutils.find_inverse_clifford_gates(cliff)
+                self.assertEqual(
+                    self.clutils.clifford_from_gates(
+                        num_qubits, gatelist + inv_gatelist).index(),
+                    Clifford(num_qubits).index())
+                synth = self.clutils.clifford_from_gates(
+                    num_qubits, self.clutils.clifford_gates(cliff))
+                self.assertEqual(synth.index(), cliff.index())
+        # the sampling is uniform
+        group = CliffordGroup(1)
+        counts = np.zeros(24)
+        for _ in range(2400):
+            cliff = self.clutils.clifford_from_gates(
+                1, self.clutils.random_clifford_gates(1, rng=rng))
+            counts[group.index(cliff)] += 1
+        self.assertLess(np.sum((counts - 100) ** 2 / 100), 50)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -16,13 +16,16 @@
 Test CNOT-dihedral functions:
 - Generating CNOT-dihedral group tables on 1 and 2 qubits:
   dihedral_utils.cnot_dihedral_tables
+- Composing CNOT-dihedral elements on 1 to 4 qubits
 """
 
 import unittest
 
+import numpy as np
+
 # Import the dihedral_utils functions
 from qiskit.ignis.verification.randomized_benchmarking \
-    import DihedralUtils as dutils
+    import DihedralUtils as dutils, CNOTDihedral
 
 
 class TestCNOTDihedral(unittest.TestCase):
@@ -55,6 +58,38 @@ class TestCNOTDihedral(unittest.TestCase):
                              'Error: table on %d qubit does not contain '
                              'the expected number of elements' % qubit_num)
 
+    def test_dihedral_compose(self):
+        """
+            test: composing elements is the same as applying their gates
+        """
+        rng = np.random.default_rng(1234)
+        for qubit_num in range(1, 5):
+            for _ in range(self.number_of_tests):
+                elems = [CNOTDihedral(qubit_num) for _ in range(3)]
+                for elem in elems[1:]:
+                    for _ in range(10):
+                        gate = rng.integers(3 if qubit_num > 1 else 2)
+                        if gate == 0:
+                            qubit = int(rng.integers(qubit_num))
+                            power = int(rng.integers(1, 8))
+                            elem.phase(power, qubit)
+                            elems[0].phase(power, qubit)
+                        elif gate == 1:
+                            qubit = int(rng.integers(qubit_num))
+                            elem.flip(qubit)
+                            elems[0].flip(qubit)
+                        else:
+                            i, j = rng.choice(qubit_num, 2, replace=False)
+                            elem.cnot(int(i), int(j))
+                            elems[0].cnot(int(i), int(j))
+                # the gates of elems[2] were applied after those of
+                # elems[1] (up to a global phase)
+                product = elems[2] * elems[1]
+                product.poly.weight_0 = 0
+                self.assertEqual(product, elems[0])
+                self.assertEqual(product.key, elems[0].key)
+                self.assertEqual(hash(product), hash(elems[0]))
+
 
 if __name__ == '__main__':
     unittest.main()
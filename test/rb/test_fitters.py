@@ -20,13 +20,19 @@ Test the fitters
 
 import os
 import unittest
+from unittest import mock
 from test.utils import load_results_from_json
 import json
 
 import numpy as np
 
+from qiskit.ignis import CountsArray
+from qiskit.ignis.utils import walsh_hadamard
 from qiskit.ignis.verification.randomized_benchmarking import \
     RBFitter, InterleavedRBFitter, PurityRBFitter, CNOTDihedralRBFitter
+from qiskit.ignis.verification.randomized_benchmarking import batch_fit
+from qiskit.ignis.verification.randomized_benchmarking.batch_fit import \
+    fit_decays, bootstrap_decays
 
 
 class TestFitters(unittest.TestCase):
@@ -271,6 +277,202 @@ class TestFitters(unittest.TestCase):
                                                tst_cnotdihedral_expected_results['joint_fit'],
                                                tst_index)
 
+    def test_incremental_add_data(self):
+        """ Test that add_data only processes the new results """
+        results_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_results_1.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_pattern = [[0, 1], [2]]
+
+        rb_fit = RBFitter(results_list[0], xdata, rb_pattern)
+        for result in results_list[1:]:
+            with mock.patch.object(CountsArray, 'probabilities',
+                                   autospec=True,
+                                   side_effect=CountsArray.probabilities) \
+                    as mock_probs:
+                rb_fit.add_data(result)
+            # the probabilities of the new circuits of each pattern only
+            self.assertEqual(mock_probs.call_count,
+                             len(rb_pattern) * len(result.results))
+
+        rb_fit_all = RBFitter(results_list, xdata, rb_pattern)
+        np.testing.assert_allclose(rb_fit.raw_data, rb_fit_all.raw_data)
+        for patt_ind, _ in enumerate(rb_pattern):
+            np.testing.assert_allclose(rb_fit.fit[patt_ind]['params'],
+                                       rb_fit_all.fit[patt_ind]['params'],
+                                       rtol=1e-5)
+
+        purity_result_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_purity_results.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [1, 21, 41, 61, 81, 101, 121, 141, 161, 181]])
+        rb_pattern = [[0, 1], [2, 3]]
+        rbfit_purity = PurityRBFitter(purity_result_list[:9], 9, xdata,
+                                      rb_pattern)
+        with mock.patch.object(PurityRBFitter, '_calc_purity',
+                               autospec=True,
+                               side_effect=PurityRBFitter._calc_purity) \
+                as mock_purity:
+            rbfit_purity.add_data(purity_result_list[9:18])
+        # the purities of the new seed only
+        self.assertEqual(mock_purity.call_count,
+                         len(rb_pattern) * len(xdata[0]))
+        rbfit_purity.add_data(purity_result_list[18:])
+        rbfit_purity_all = PurityRBFitter(purity_result_list, 9, xdata,
+                                          rb_pattern)
+        np.testing.assert_allclose(rbfit_purity.raw_data,
+                                   rbfit_purity_all.raw_data)
+
+    def test_inner_fitter_shots(self):
+        """ Test that the inner fitters count the shots of each result once """
+        def load(name):
+            return load_results_from_json(os.path.join(
+                os.path.dirname(__file__), name))
+
+        def assert_shots(inner_fit, results, xdata, rb_pattern):
+            rb_fit = RBFitter(results, xdata, rb_pattern)
+            self.assertEqual(len(inner_fit.results), len(results))
+            names = rb_fit._counts.names
+            self.assertEqual(sorted(inner_fit._counts.names), sorted(names))
+            for name in names:
+                self.assertEqual(inner_fit._counts.shots(name),
+                                 rb_fit._counts.shots(name))
+
+        xdata = np.array([[1, 11, 21, 31, 41, 51, 61, 71, 81, 91],
+                          [3, 33, 63, 93, 123, 153, 183, 213, 243, 273]])
+        rb_pattern = [[0, 2], [1]]
+        original = load('test_fitter_original_results.json')
+        interleaved = load('test_fitter_interleaved_results.json')
+        joint_rb_fit = InterleavedRBFitter(original, interleaved, xdata,
+                                           rb_pattern)
+        assert_shots(joint_rb_fit.rbfit_std, original, xdata, rb_pattern)
+        assert_shots(joint_rb_fit.rbfit_int, interleaved, xdata, rb_pattern)
+
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [1, 21, 41, 61, 81, 101, 121, 141, 161, 181]])
+        rb_pattern = [[0, 1], [2, 3]]
+        purity = load('test_fitter_purity_results.json')
+        rbfit_purity = PurityRBFitter(purity, 9, xdata, rb_pattern)
+        assert_shots(rbfit_purity.rbfit_pur, purity, xdata, rb_pattern)
+
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [3, 63, 123, 183, 243, 303, 363, 423, 483, 543]])
+        rb_pattern = [[0, 2], [1]]
+        cnotdihedral_z = load('test_fitter_cnotdihedral_Z_results.json')
+        cnotdihedral_x = load('test_fitter_cnotdihedral_X_results.json')
+        joint_rb_fit = CNOTDihedralRBFitter(cnotdihedral_z, cnotdihedral_x,
+                                            xdata, rb_pattern)
+        assert_shots(joint_rb_fit.rbfit_Z, cnotdihedral_z, xdata, rb_pattern)
+        assert_shots(joint_rb_fit.rbfit_X, cnotdihedral_x, xdata, rb_pattern)
+
+    def test_purity_zdict_ops(self):
+        """ Test the Z-correlators of the purity fitter """
+        purity_result_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_purity_results.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [1, 21, 41, 61, 81, 101, 121, 141, 161, 181]])
+        rbfit_purity = PurityRBFitter(purity_result_list, 9, xdata,
+                                      [[0, 1], [2, 3]])
+        # the signs of the correlators are the rows of the transform
+        signs = [[zdict[key] for key in sorted(zdict)]
+                 for zdict in rbfit_purity._zdict_ops]
+        np.testing.assert_array_equal(signs, walsh_hadamard(np.eye(4)))
+
+    def test_batched_fit(self):
+        """ Test the batched fit against a fit of each pattern """
+        results_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_results_1.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_pattern = [[0, 1], [2]]
+
+        rb_fit = RBFitter(results_list, xdata, rb_pattern)
+        rb_fit_pattern = RBFitter(results_list, xdata, rb_pattern)
+        for patt_ind, _ in enumerate(rb_pattern):
+            rb_fit_pattern.fit_data_pattern(
+                patt_ind, tuple(rb_fit.fit[patt_ind]['params']))
+            for key in ('params', 'params_err', 'epc', 'epc_err'):
+                np.testing.assert_allclose(
+                    rb_fit.fit[patt_ind][key],
+                    rb_fit_pattern.fit[patt_ind][key], rtol=1e-5)
+
+        # curves with the asymptote at the bounds are left to curve_fit
+        lens = np.arange(1, 200, 20)
+        ydata = np.array([0.5 * 0.99 ** lens + 0.25, 0.9 ** lens])
+        params, _, success = fit_decays(np.tile(lens, (2, 1)), ydata)
+        np.testing.assert_allclose(params[0], [0.5, 0.99, 0.25], rtol=1e-6)
+        self.assertEqual(list(success), [True, False])
+
+    def test_bootstrap(self):
+        """ Test the bootstrap errors of the RB fits """
+        results_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_results_1.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_pattern = [[0, 1], [2]]
+        rb_fit = RBFitter(results_list, xdata, rb_pattern)
+
+        bootstrap = rb_fit.bootstrap(num_resamples=50, rand_seed=5)
+        # the resamples only depend on the seed
+        sharded = rb_fit.bootstrap(num_resamples=50, rand_seed=5,
+                                   num_processes=2)
+        for patt_ind, _ in enumerate(rb_pattern):
+            boot = bootstrap[patt_ind]
+            self.assertEqual(boot['params'].shape, (50, 3))
+            np.testing.assert_array_equal(boot['params'],
+                                          sharded[patt_ind]['params'])
+            np.testing.assert_allclose(boot['params_err'],
+                                       np.std(boot['params'], 0))
+            low, high = boot['epc_interval']
+            self.assertLess(low, rb_fit.fit[patt_ind]['epc'])
+            self.assertGreater(high, rb_fit.fit[patt_ind]['epc'])
+            self.assertGreater(boot['epc_err'], 0)
+            self.assertEqual(boot['num_failed'], 0)
+
+    def test_bootstrap_failed_fits(self):
+        """ Test the bootstrap resamples whose batched fit fails """
+        lens = np.arange(1, 200, 20)
+        # decays to 0, the asymptote of most resamples is at the bound
+        probs = np.tile(0.95 * 0.98 ** lens, (1, 5, 1))
+        shots = np.full((5, len(lens)), 200)
+        args = (1234, lens[None], probs, shots, [[0.9, 0.97, 0.01]])
+        resamples = list(range(20))
+
+        def fit_half(*fit_args):
+            params, pcov, success = fit_decays(*fit_args)
+            success[::3] = False
+            return params, pcov, success
+
+        params = bootstrap_decays(resamples, *args)
+        with mock.patch.object(batch_fit, 'fit_decays',
+                               side_effect=fit_half):
+            refit = bootstrap_decays(resamples, *args)
+        self.assertTrue(np.all(np.isfinite(params)))
+        # the failed resamples are refit with curve_fit
+        np.testing.assert_allclose(refit, params, rtol=1e-4, atol=1e-6)
+
+        # the resamples that curve_fit cannot fit are left out
+        results_list = load_results_from_json(os.path.join(
+            os.path.dirname(__file__), 'test_fitter_results_1.json'))
+        xdata = np.array([[1, 21, 41, 61, 81, 101, 121, 141, 161, 181],
+                          [2, 42, 82, 122, 162, 202, 242, 282, 322, 362]])
+        rb_fit = RBFitter(results_list, xdata, [[0, 1], [2]])
+        with mock.patch.object(batch_fit, 'fit_decays',
+                               side_effect=fit_half), \
+                mock.patch.object(batch_fit, 'curve_fit',
+                                  side_effect=RuntimeError):
+            bootstrap = rb_fit.bootstrap(num_resamples=10, rand_seed=5)
+        for boot in bootstrap:
+            failed = np.isnan(boot['epc'])
+            self.assertEqual(boot['num_failed'], np.count_nonzero(failed))
+            self.assertGreater(boot['num_failed'], 0)
+            self.assertLess(boot['num_failed'], 10)
+            self.assertTrue(np.isfinite(boot['epc_err']))
+            np.testing.assert_allclose(boot['epc_err'],
+                                       np.std(boot['epc'][~failed]))
+            self.assertTrue(np.all(np.isfinite(boot['epc_interval'])))
+
 
 if __name__ == '__main__':
     unittest.main()
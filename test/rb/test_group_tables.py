@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Test the process-wide cache and the location of the group tables
+"""
+
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from qiskit.ignis.verification.randomized_benchmarking import (
+    BinaryGroupTable, Clifford, CliffordUtils, DihedralUtils,
+    clear_group_tables, convert_pickled_table, tables_dir)
+from qiskit.ignis.verification.randomized_benchmarking.binary_tables import \
+    CLIFFORD_TABLE, CNOT_DIHEDRAL_TABLE, write_binary_table
+from qiskit.ignis.verification.randomized_benchmarking.group_tables import \
+    TABLES_VERSION
+
+
+class TestGroupTables(unittest.TestCase):
+    """Test the group tables cache."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(
+            os.environ, {'QISKIT_IGNIS_TABLES_DIR': self.tmp_dir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.addCleanup(clear_group_tables)
+        clear_group_tables()
+
+    def test_tables_dir(self):
+        """Test that the table files are saved in a versioned directory."""
+        self.assertEqual(
+            tables_dir(),
+            os.path.join(self.tmp_dir.name, 'v%d' % TABLES_VERSION))
+        CliffordUtils().load_tables(2)
+        self.assertTrue(os.path.exists(
+            os.path.join(tables_dir(), 'cliffords2.bin')))
+        self.assertFalse(os.path.exists('cliffords2.bin'))
+
+    def test_cache(self):
+        """Test that the tables are loaded once and can be invalidated."""
+        for utils in (CliffordUtils(), DihedralUtils()):
+            for num_qubits in (1, 2):
+                table = utils.load_tables(num_qubits)
+                self.assertIs(utils.load_tables(num_qubits), table)
+                # a new utils object shares the cached table
+                self.assertIs(type(utils)().load_tables(num_qubits), table)
+                clear_group_tables()
+                new_table = utils.load_tables(num_qubits)
+                self.assertIsNot(new_table, table)
+                self.assertEqual(new_table.keys(), table.keys())
+
+    def test_find_key_no_io(self):
+        """Test that find_key does not read the table file."""
+        utils = CliffordUtils()
+        utils.load_tables(2)
+        cliff = utils.clifford_from_gates(2, ['h 0', 'cx 0 1'])
+        with mock.patch('builtins.open') as mock_open:
+            self.assertEqual(utils.find_key(cliff, 2), cliff.index())
+            mock_open.assert_not_called()
+
+    def test_cached_table_reload(self):
+        """Test that a table file is read back after clearing the cache."""
+        table = CliffordUtils().load_tables(2)
+        clear_group_tables()
+        with mock.patch.object(CliffordUtils,
+                               'clifford2_gates_table') as mock_make:
+            self.assertEqual(CliffordUtils().load_tables(2), table)
+            mock_make.assert_not_called()
+        self.assertEqual(len(table), 11520)
+        self.assertIn(Clifford(2).index(), table)
+
+    def test_binary_tables(self):
+        """Test that the binary tables equal the generated tables."""
+        for kind, table in (
+                (CLIFFORD_TABLE, CliffordUtils().clifford2_gates_table()),
+                (CNOT_DIHEDRAL_TABLE, DihedralUtils().cnot_dihedral_tables(2))):
+            filename = os.path.join(self.tmp_dir.name, 'table.bin')
+            write_binary_table(filename, table, kind, 2)
+            bin_table = BinaryGroupTable(filename)
+            self.assertEqual(len(bin_table), len(table))
+            # same keys in the same order
+            self.assertEqual(list(bin_table), list(table))
+            for key, value in table.items():
+                self.assertIn(key, bin_table)
+                if kind == CLIFFORD_TABLE:
+                    self.assertEqual(bin_table[key], value)
+                else:
+                    self.assertEqual(bin_table[key][0].key, key)
+                    self.assertEqual(bin_table[key][1], value[1])
+            self.assertNotIn(-1, bin_table)
+            self.assertNotIn('not a key', bin_table)
+            with self.assertRaises(KeyError):
+                _ = bin_table[-1]
+
+    def test_convert_pickled_table(self):
+        """Test the conversion of a pickled table."""
+        picklefile = os.path.join(self.tmp_dir.name, 'cnot_dihedral_2.pickle')
+        filename = os.path.join(self.tmp_dir.name, 'cnot_dihedral_2.bin')
+        table = DihedralUtils().cnot_dihedral_tables(2)
+        with open(picklefile, 'wb') as pf:
+            pickle.dump(table, pf)
+        convert_pickled_table(picklefile, filename, CNOT_DIHEDRAL_TABLE, 2)
+        self.assertEqual(list(BinaryGroupTable(filename)), list(table))
+
+    def test_corrupt_table(self):
+        """Test that a corrupt table file is generated again."""
+        os.makedirs(tables_dir())
+        with open(os.path.join(tables_dir(), 'cliffords2.bin'), 'wb') as fd:
+            fd.write(b'corrupt')
+        table = CliffordUtils().load_tables(2)
+        self.assertIsInstance(table, BinaryGroupTable)
+        self.assertEqual(len(table), 11520)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -29,6 +29,8 @@ from ddt import ddt, data, unpack
 import qiskit
 import qiskit.ignis.verification.randomized_benchmarking as rb
 from qiskit import QiskitError
+from qiskit.ignis.verification.randomized_benchmarking.circuits import \
+    clifford_instructions
 
 
 @ddt
@@ -696,6 +698,166 @@ class TestRB(unittest.TestCase):
         self.assertEqual(circ_index, len(rb_circs),
                          "Error: additional circuits exist")
 
+    @data('Clifford', 'CNOT-Dihedral')
+    def test_rb_seed_streams(self, group_gates):
+        """Test that the sequences do not depend on the number of
+        worker processes."""
+        rb_opts = {'nseeds': 4,
+                   'length_vector': [1, 5, 10],
+                   'rb_pattern': [[0, 2], [1]],
+                   'group_gates': group_gates,
+                   'rand_seed': 1234}
+        if group_gates == 'Clifford':
+            rb_opts['interleaved_gates'] = [['cx 0 1'], ['x 0']]
+
+        def qasms(rb_opts):
+            circuits = rb.randomized_benchmarking_seq(**rb_opts)
+            return [[[circ.qasm() for circ in seed_circs]
+                     for seed_circs in circs] for circs in circuits
+                    if isinstance(circs, list)]
+
+        expected = qasms(rb_opts)
+        for num_processes in [1, 2, 3]:
+            rb_opts['num_processes'] = num_processes
+            self.assertEqual(qasms(rb_opts), expected)
+        # the seeds are independent streams
+        self.assertEqual(len(set(map(str, expected[0]))), 4)
+        # adding seeds later with seed_offset
+        rb_opts['nseeds'] = 2
+        rb_opts['seed_offset'] = 2
+        offset = qasms(rb_opts)
+        self.assertEqual(offset[0], expected[0][2:])
+        # another root seed
+        rb_opts['rand_seed'] = 4321
+        self.assertNotEqual(qasms(rb_opts)[0], offset[0])
+
+    def test_rb_shared_prefix(self):
+        """Test that the sequences of all the lengths share the
+        instructions of their common prefix."""
+        circuits, _, circuits_interleaved = rb.randomized_benchmarking_seq(
+            nseeds=1, length_vector=[1, 20, 50], rb_pattern=[[0, 2], [1]],
+            interleaved_gates=[['cx 0 1'], ['h 0']], align_cliffs=True)
+        for circs in (circuits[0], circuits_interleaved[0]):
+            short, long = circs[1].data, circs[2].data
+            # the prefix ends at the last barrier before the inverse
+            prefix = max(i for i, inst in enumerate(short)
+                         if inst[0].name == 'barrier')
+            for inst_short, inst_long in zip(short[:prefix],
+                                             long[:prefix]):
+                self.assertIs(inst_short[0], inst_long[0])
+                self.assertEqual(inst_short[1], inst_long[1])
+        # the interleaved sequences share the random elements
+        self.assertIs(circuits[0][0].data[0][0],
+                      circuits_interleaved[0][0].data[0][0])
+
+    def test_rb_element_templates(self):
+        """Test that the instructions of each group element are built
+        once, and mapped to the qubits of each pattern."""
+        rb.clear_group_tables('rb_templates')
+        rb_opts = {'nseeds': 2, 'length_vector': [1, 30],
+                   'rb_pattern': [[0], [2]], 'rand_seed': 7}
+        expected = [circ.qasm() for circ in
+                    rb.randomized_benchmarking_seq(**rb_opts)[0][1]]
+        self.assertEqual([circ.qasm() for circ in
+                          rb.randomized_benchmarking_seq(**rb_opts)[0][1]],
+                         expected)
+        circ = rb.randomized_benchmarking_seq(**rb_opts)[0][0][1]
+        # the operations of the gates (h, v, w and Paulis) are shared by
+        # all their occurrences, on both qubits
+        data = [(instr, qargs) for instr, qargs, _ in circ.data
+                if instr.name not in ('barrier', 'measure')]
+        self.assertLessEqual(len({id(instr) for instr, _ in data}), 8)
+        self.assertEqual({qargs[0].index for _, qargs in data}, {0, 2})
+
+    def test_rb_basis_gates(self):
+        """Test generating the sequences in basis gates."""
+        backend = qiskit.Aer.get_backend('qasm_simulator')
+        basis = ['rz', 'sx', 'x', 'cx']
+        rb_opts = {'nseeds': 2, 'length_vector': [1, 10, 20],
+                   'rb_pattern': [[0, 2], [1]], 'rand_seed': 3}
+        circuits, xdata = rb.randomized_benchmarking_seq(
+            basis_gates=basis, **rb_opts)
+        transpiled = [qiskit.transpile(circs, basis_gates=basis)
+                      for circs in rb.randomized_benchmarking_seq(
+                          **rb_opts)[0]]
+        for circs in circuits:
+            self.assertLessEqual(
+                {instr.name for circ in circs for instr, _, _ in circ.data},
+                set(basis + ['barrier', 'measure']))
+            result = qiskit.execute(circs, backend=backend,
+                                    basis_gates=basis, optimization_level=0,
+                                    shots=20).result()
+            for circ in circs:
+                self.assertEqual(result.get_counts(circ), {'000': 20})
+
+        # the same gates as transpiled circuits
+        ngates = rb.gates_per_clifford(circuits, xdata[0], basis, [0, 1, 2])
+        expected = rb.gates_per_clifford(transpiled, xdata[0], basis,
+                                         [0, 1, 2])
+        analytic = rb.expected_gates_per_clifford(
+            rb_opts['rb_pattern'], basis, xdata[0])
+        for qubit in [0, 1, 2]:
+            for base in basis:
+                self.assertAlmostEqual(ngates[qubit][base],
+                                       expected[qubit][base])
+                self.assertAlmostEqual(analytic[qubit][base],
+                                       expected[qubit][base], delta=0.5)
+        self.assertAlmostEqual(analytic[0]['cx'], 1.5)
+        self.assertEqual(analytic[1]['cx'], 0)
+        # patterns of more than 2 qubits raise the same error
+        with self.assertRaises(QiskitError):
+            rb.expected_gates_per_clifford([[0, 1, 2]], basis)
+        with self.assertRaises(QiskitError):
+            clifford_instructions(3, basis)
+
+    def test_rb_many_qubits(self):
+        """Test Clifford RB sequences on more than 2 qubits."""
+        backend = qiskit.Aer.get_backend('qasm_simulator')
+        circuits, _, circuits_interleaved = rb.randomized_benchmarking_seq(
+            nseeds=2, length_vector=[1, 10], rb_pattern=[[0, 1, 3], [2]],
+            interleaved_gates=[['cx 0 1', 'h 2'], ['x 0']], rand_seed=10)
+        for circs in circuits + circuits_interleaved:
+            result = qiskit.execute(circs, backend=backend,
+                                    shots=20).result()
+            # the sequences are the identity
+            for circ in circs:
+                self.assertEqual(result.get_counts(circ), {'0000': 20})
+
+    @data(({}, 2), ({'interleaved_gates': [['cx 0 1'], ['x 0']]}, 3),
+          ({'group_gates': 'CNOT-Dihedral'}, 3),
+          ({'rb_pattern': [[0, 1]], 'is_purity': True}, 3))
+    @unpack
+    def test_rb_seq_iter(self, rb_opts, num_outputs):
+        """Test that the lazy generator yields the same circuits."""
+        rb_opts = dict({'nseeds': 3, 'length_vector': [1, 4, 8],
+                        'rb_pattern': [[0, 2], [1]], 'rand_seed': 100},
+                       **rb_opts)
+        outputs = rb.randomized_benchmarking_seq(**rb_opts)
+        self.assertEqual(len(outputs), num_outputs)
+        if rb_opts.get('is_purity'):
+            expected = [[circ for circs in outputs[0][seed] for circ in circs]
+                        for seed in range(3)]
+        else:
+            expected = [[circ for circs in outputs[:1] + outputs[2:]
+                         for circ in circs[seed]] for seed in range(3)]
+        circuits_iter, xdata = rb.randomized_benchmarking_seq_iter(
+            **rb_opts)[:2]
+        np.testing.assert_array_equal(xdata, outputs[1])
+        circuits = list(circuits_iter)
+        self.assertEqual(len(circuits), 3)
+        for seed in range(3):
+            self.assertEqual([circ.name for circ in circuits[seed]],
+                             [circ.name for circ in expected[seed]])
+            self.assertEqual([circ.qasm() for circ in circuits[seed]],
+                             [circ.qasm() for circ in expected[seed]])
+        # batches
+        flat = [circ.name for circs in circuits for circ in circs]
+        batches = list(rb.randomized_benchmarking_seq_iter(
+            batch_size=5, **rb_opts)[0])
+        self.assertTrue(all(len(batch) == 5 for batch in batches[:-1]))
+        self.assertEqual([circ.name for batch in batches for circ in batch],
+                         flat)
+
 
 class TestRBUtils(unittest.TestCase):
     """Test for RB utilities."""
@@ -757,6 +919,27 @@ class TestRBUtils(unittest.TestCase):
         self.assertAlmostEqual(gpc[0]['cx'],
                                (num_gates[0][3] + num_gates[1][3]) / ncliffs)
 
+    def test_gates_per_clifford_qubits(self):
+        """Test gate per Clifford of multi-qubit gates and registers."""
+        qr = qiskit.QuantumRegister(3)
+        qr2 = qiskit.QuantumRegister(2)
+        circ = qiskit.QuantumCircuit(qr, qr2)
+        circ.u1(0.1, qr[0])
+        circ.cx(qr[0], qr[2])
+        circ.cx(qr[2], qr[1])
+        circ.u2(0.1, 0.2, qr2[1])
+        circ.h(qr[2])
+        circ.barrier(qr)
+        gpc = rb.rb_utils.gates_per_clifford(transpiled_circuits_list=[[circ]],
+                                             clifford_lengths=[1],
+                                             basis=['u1', 'u2', 'cx'],
+                                             qubits=[0, 1, 2, 4])
+        # the qubits are counted by their index in their register
+        self.assertEqual(gpc, {0: {'u1': 0.5, 'u2': 0, 'cx': 0.5},
+                               1: {'u1': 0, 'u2': 0.5, 'cx': 0.5},
+                               2: {'u1': 0, 'u2': 0, 'cx': 1},
+                               4: {'u1': 0, 'u2': 0, 'cx': 0}})
+
     def test_gates_per_clifford_with_invalid_basis(self):
         """Test gate per Clifford when invalid gate is included in basis."""
         num_gates = [[1, 1, 1, 1]]
@@ -925,6 +1108,64 @@ class TestRBUtils(unittest.TestCase):
             3 / 4 * (1 - alpha_c)
         )
 
+    def test_calculate_device_epgs(self):
+        """Test calculating the EPGs of all the qubits and pairs at once."""
+        rng = np.random.default_rng(7)
+        qubits = [0, 1, 2, 3]
+        pairs = [(0, 1), (1, 2), (2, 3), (3, 4)]
+        gpc_1q = {qubit: {'cx': 0, 'u1': rng.uniform(0.1, 0.2),
+                          'u2': rng.uniform(0.2, 0.4), 'u3': rng.uniform(0.4, 0.6)}
+                  for qubit in qubits}
+        epc_1q = {qubit: rng.uniform(1e-4, 1e-3) for qubit in qubits}
+        gpc_2q = {pair: {qubit: {'cx': 1.5, 'u1': rng.uniform(0.2, 0.3),
+                                 'u2': rng.uniform(0.9, 1.0), 'u3': rng.uniform(0.5, 0.6)}
+                         for qubit in pair}
+                  for pair in pairs}
+        epc_2q = {pair: rng.uniform(1e-2, 3e-2) for pair in pairs}
+        epc_1q_err = {qubit: epc / 10 for qubit, epc in epc_1q.items()}
+        epc_2q_err = {pair: epc / 10 for pair, epc in epc_2q.items()}
+
+        epgs = rb.calculate_device_epgs(gpc_1q, epc_1q, gpc_2q, epc_2q,
+                                        epc_1q_err, epc_2q_err)
+
+        for qubit in qubits:
+            ref = rb.calculate_1q_epg(gpc_1q, epc_1q[qubit], qubit)
+            ref_err = rb.calculate_1q_epg(gpc_1q, epc_1q_err[qubit], qubit)
+            for gate in ['u1', 'u2', 'u3']:
+                self.assertAlmostEqual(epgs['epg_1q'][qubit][gate], ref[gate])
+                self.assertAlmostEqual(epgs['epg_1q_err'][qubit][gate], ref_err[gate])
+
+        def epg_2q(pair, epc, epg_1q):
+            # qubit 4 has no 1Q RB, so its 1Q gates are taken as ideal
+            list_epgs_1q = [epg_1q.get(qubit, {'u1': 0, 'u2': 0, 'u3': 0})
+                            for qubit in pair]
+            return rb.calculate_2q_epg(gpc_2q[pair], epc, pair, list_epgs_1q)
+
+        for pair in pairs:
+            self.assertAlmostEqual(epgs['epg_2q'][pair],
+                                   epg_2q(pair, epc_2q[pair], epgs['epg_1q']))
+
+            # compare the propagated uncertainty with finite differences
+            step = 1e-3
+            var = ((epg_2q(pair, epc_2q[pair] + step * epc_2q_err[pair], epgs['epg_1q']) -
+                    epgs['epg_2q'][pair]) / step) ** 2
+            for qubit in set(pair) & set(qubits):
+                shifted = dict(epc_1q)
+                shifted[qubit] += step * epc_1q_err[qubit]
+                shifted_epg_1q = {qubit: rb.calculate_1q_epg(gpc_1q, epc, qubit)
+                                  for qubit, epc in shifted.items()}
+                var += ((epg_2q(pair, epc_2q[pair], shifted_epg_1q) -
+                         epgs['epg_2q'][pair]) / step) ** 2
+            self.assertAlmostEqual(epgs['epg_2q_err'][pair], np.sqrt(var), delta=1e-6)
+
+        # test raise error when the 2Q gate is not in the 2Q gate count
+        with self.assertRaises(QiskitError):
+            rb.calculate_device_epgs(gpc_1q, epc_1q, gpc_2q, epc_2q, two_qubit_name='cz')
+
+        # test raise error when a 1Q gate count includes a 2Q gate
+        with self.assertRaises(QiskitError):
+            rb.calculate_device_epgs(gpc_2q[(0, 1)], {0: 1e-3})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+"""
+Test the CountsArray
+"""
+
+import unittest
+
+import numpy as np
+
+import qiskit
+from qiskit import QiskitError
+from qiskit.providers.aer import QasmSimulator
+from qiskit.ignis import CountsArray
+from qiskit.ignis.verification import (randomized_benchmarking_seq,
+                                       RBFitter, marginal_counts)
+
+
+class TestCountsArray(unittest.TestCase):
+
+    def setUp(self):
+        qr = qiskit.QuantumRegister(3)
+        circuits = []
+        for name in ('a', 'b'):
+            circ = qiskit.QuantumCircuit(qr, qiskit.ClassicalRegister(2),
+                                         qiskit.ClassicalRegister(1),
+                                         name=name)
+            circ.h(qr[0])
+            circ.cx(qr[0], qr[2])
+            circ.measure(qr, circ.clbits)
+            circuits.append(circ)
+        backend = QasmSimulator()
+        self.results = [
+            qiskit.execute(circuits, backend, shots=100,
+                           seed_simulator=seed).result()
+            for seed in (1, 2)]
+
+    def test_from_result(self):
+        counts = CountsArray.from_result(self.results)
+        self.assertEqual(counts.names, ['a', 'b'])
+        self.assertEqual(counts.num_clbits('a'), 3)
+        self.assertEqual(counts.shots('a'), 200)
+        expected = {}
+        for result in self.results:
+            for key, val in marginal_counts(result.get_counts('a')).items():
+                expected[key] = expected.get(key, 0) + val
+        self.assertEqual(counts.get_counts('a'), expected)
+        self.assertEqual(counts.get_counts(1),
+                         counts.get_counts(self.results[0].results[1]
+                                           .header.name))
+        with self.assertRaises(QiskitError):
+            counts.get_counts('c')
+
+    def test_marginal(self):
+        dense = CountsArray.from_result(self.results)
+        sparse = CountsArray.from_result(self.results, dense_clbits=0)
+        for qubits in (None, [0], [2, 0], [0, 1, 2], [1, 2]):
+            np.testing.assert_array_equal(dense.marginal('b', qubits),
+                                          sparse.marginal('b', qubits))
+        probs = dense.probabilities('b', [2, 0])
+        self.assertAlmostEqual(probs.sum(), 1)
+        # bit j of the index is the outcome of qubits[j]
+        self.assertEqual(probs[1] + probs[2], 0)
+        self.assertEqual(dense.get_counts('b', [0]),
+                         marginal_counts(dense.get_counts('b'), [0]))
+
+    def test_add(self):
+        counts = CountsArray.from_result(self.results[0])
+        counts.add(CountsArray.from_result(self.results[1], dense_clbits=0))
+        self.assertEqual(counts.get_counts('a'),
+                         CountsArray.from_result(self.results).get_counts('a'))
+        counts.add_counts('c', {'01': 3, '1 1': 2})
+        self.assertEqual(counts.get_counts('c'), {'01': 3, '11': 2})
+        with self.assertRaises(QiskitError):
+            counts.add_counts('c', {'001': 1})
+
+    def test_wide_register(self):
+        counts = CountsArray.from_counts(
+            {'wide': {'1' + 69 * '0' + '1': 3, 71 * '0': 4}})
+        np.testing.assert_array_equal(counts.marginal('wide', [0, 70]),
+                                      [4, 0, 0, 3])
+        self.assertEqual(counts.shots('wide'), 7)
+
+    def test_rb_fitter(self):
+        rb_circs, xdata = randomized_benchmarking_seq(
+            nseeds=2, length_vector=[1, 5], rb_pattern=[[0, 1]])
+        results = [qiskit.execute(circs, QasmSimulator(), shots=100,
+                                  seed_simulator=0).result()
+                   for circs in rb_circs]
+        fitter = RBFitter(results, xdata, [[0, 1]])
+        counts_fitter = RBFitter(CountsArray.from_result(results), xdata,
+                                 [[0, 1]])
+        self.assertEqual(counts_fitter.seeds, fitter.seeds)
+        np.testing.assert_allclose(counts_fitter.raw_data, fitter.raw_data)
+
+    def test_missing_experiment(self):
+        rb_circs, xdata = randomized_benchmarking_seq(
+            nseeds=2, length_vector=[1, 5])
+        results = [qiskit.execute(circs, QasmSimulator(), shots=100,
+                                  seed_simulator=0).result()
+                   for circs in rb_circs]
+        counts = CountsArray.from_result(results)
+        partial = CountsArray()
+        for name in counts:
+            if name != 'rb_length_1_seed_1':
+                partial.add_outcomes(name, *counts.outcomes(name),
+                                     num_clbits=counts.num_clbits(name))
+        fitter = RBFitter(partial, xdata, [[0]])
+        self.assertEqual(fitter.raw_data[0][0],
+                         RBFitter(counts, xdata, [[0]]).raw_data[0][0])
+        self.assertTrue(np.isnan(fitter.raw_data[0][1][1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+# pylint: disable=missing-docstring
+
+import unittest
+
+import numpy as np
+
+from qiskit.ignis.verification.tomography import (marginal_counts,
+                                                  marginal_counts_array,
+                                                  expectation_counts)
+
+
+class TestMarginalCounts(unittest.TestCase):
+    counts = {'00 010': 3, '00 011': 5, '01 110': 2, '10 111': 7}
+
+    def test_no_marginalization(self):
+        self.assertEqual(marginal_counts(self.counts),
+                         {'00010': 3, '00011': 5, '01110': 2, '10111': 7})
+
+    def test_marginal_counts(self):
+        self.assertEqual(marginal_counts(self.counts, [0, 2]),
+                         {'00': 3, '01': 5, '10': 2, '11': 7})
+        self.assertEqual(marginal_counts(self.counts, [4, 3]),
+                         {'00': 8, '01': 2, '10': 7})
+        self.assertEqual(list(marginal_counts(self.counts, [4, 3],
+                                              pad_zeros=True).items()),
+                         [('00', 8), ('01', 2), ('10', 7), ('11', 0)])
+        self.assertEqual(marginal_counts(self.counts, np.arange(1, 3)),
+                         {'01': 8, '11': 9})
+
+    def test_marginal_counts_array(self):
+        np.testing.assert_array_equal(
+            marginal_counts_array(self.counts, [4, 3]), [8, 2, 7, 0])
+        np.testing.assert_array_equal(
+            marginal_counts_array(self.counts, [1]), [0, 17])
+        self.assertEqual(marginal_counts_array(self.counts).tolist()[0b00011],
+                         5)
+        # non-integer counts, e.g. from measurement error mitigation
+        np.testing.assert_allclose(
+            marginal_counts_array({'01': 0.5, '11': 1.25}, [0]), [0, 1.75])
+
+    def test_many_qubits(self):
+        counts = {'1' + 69 * '0' + '1': 3, 71 * '0': 4}
+        self.assertEqual(marginal_counts(counts, [0, 70]),
+                         {'00': 4, '11': 3})
+
+    def test_expectation_counts(self):
+        counts = {'00': 6, '01': 1, '10': 2, '11': 1}
+        self.assertEqual(expectation_counts(counts),
+                         {'00': 10, '10': 6, '01': 4, '11': 4})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -70,6 +70,41 @@ class TestPauliBasis(unittest.TestCase):
         result_Z = Z0 - Z1
         self.assertMatricesAlmostEqual(self.Z, result_Z)
 
+    def test_cached_operators(self):
+        basis = paulibasis.PauliBasis
+        basis.clear_cache()
+        memo = {}
+        meas = basis.measurement_operator(('X', 'Y', 'Z'), (1, 0, 1), memo)
+        expected = numpy.kron(numpy.kron(
+            paulibasis.pauli_measurement_matrix('Z', 1),
+            paulibasis.pauli_measurement_matrix('Y', 0)),
+            paulibasis.pauli_measurement_matrix('X', 1))
+        self.assertMatricesAlmostEqual(meas, expected)
+        self.assertIs(basis.measurement_operator(('X', 'Y', 'Z'), '101', memo),
+                      meas)
+        # without a memo the products are not kept
+        meas_new = basis.measurement_operator(('X', 'Y', 'Z'), (1, 0, 1))
+        self.assertIsNot(meas_new, meas)
+        self.assertMatricesAlmostEqual(meas_new, expected)
+        self.assertIs(basis.measurement_matrix('Y', 0),
+                      basis.measurement_matrix('Y', '0'))
+
+        memo = {}
+        prep = basis.preparation_operator(('Xp', 'Zm'), memo)
+        expected = numpy.kron(paulibasis.pauli_preparation_matrix('Zm'),
+                              paulibasis.pauli_preparation_matrix('Xp'))
+        self.assertMatricesAlmostEqual(prep, expected)
+        self.assertIs(basis.preparation_operator(('Xp', 'Zm'), memo), prep)
+        # operators of labels with a common prefix share the partial products
+        self.assertEqual(len(memo), 1)
+        basis.preparation_operator(('Xp', 'Yp'), memo)
+        self.assertEqual(len(memo), 1)
+        self.assertEqual(len(memo[('Xp',)][1]), 2)
+
+        # the cached matrices are shared, so they cannot be modified
+        with self.assertRaises(ValueError):
+            prep[0, 0] = 0
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -18,6 +18,7 @@
 
 import unittest
 
+import numpy
 import qiskit
 from qiskit import QuantumRegister, QuantumCircuit, Aer
 from qiskit.quantum_info import state_fidelity
@@ -51,6 +52,49 @@ class TestProcessTomography(unittest.TestCase):
         F_bell_mle = state_fidelity(choi_ideal/4, choi_mle/4, validate=False)
         self.assertAlmostEqual(F_bell_mle, 1, places=1)
 
+    def test_structured_basis_matrix(self):
+        q2 = QuantumRegister(2)
+        bell = QuantumCircuit(q2)
+        bell.h(q2[0])
+        bell.cx(q2[0], q2[1])
+        qpt = tomo.process_tomography_circuits(bell, q2)
+        job = qiskit.execute(qpt, Aer.get_backend('qasm_simulator'),
+                             shots=1000, seed_simulator=42)
+        tomo_fit = tomo.ProcessTomographyFitter(job.result(), qpt)
+
+        data, basis_matrix, weights = tomo_fit._fitter_data(True, 0.5)
+        data_op, basis_op, weights_op = tomo_fit._fitter_data(
+            True, 0.5, structured=True)
+        self.assertIsInstance(basis_op, tomo.fitters.BasisMatrix)
+        self.assertEqual(data, data_op)
+        self.assertEqual(weights, weights_op)
+        self.assertEqual(basis_op.shape, basis_matrix.shape)
+        self.assertTrue(numpy.allclose(basis_op.toarray(), basis_matrix))
+
+    def test_pgd_trace_preserving(self):
+        q2 = QuantumRegister(2)
+        bell = QuantumCircuit(q2)
+        bell.h(q2[0])
+        bell.cx(q2[0], q2[1])
+        qpt = tomo.process_tomography_circuits(bell, q2)
+        job = qiskit.execute(qpt, Aer.get_backend('qasm_simulator'),
+                             shots=1000, seed_simulator=42)
+        tomo_fit = tomo.ProcessTomographyFitter(job.result(), qpt)
+
+        choi = tomo_fit.fit(method='pgd').data
+        ptr = numpy.einsum('ajbj->ab', choi.reshape((4,) * 4))
+        self.assertTrue(numpy.allclose(ptr, numpy.eye(4), atol=1e-6))
+        self.assertGreater(min(numpy.linalg.eigvalsh(choi)), -1e-12)
+        # CX(0, 1) H(0), with qubit 0 the least significant
+        hadamard = numpy.array([[1, 1], [1, -1]]) / numpy.sqrt(2)
+        cnot = numpy.array([[1, 0, 0, 0], [0, 0, 0, 1],
+                            [0, 0, 1, 0], [0, 1, 0, 0]])
+        unitary = cnot @ numpy.kron(numpy.eye(2), hadamard)
+        choi_ideal = numpy.outer(unitary.ravel(order='F'),
+                                 unitary.ravel(order='F').conj())
+        fid = numpy.real(numpy.trace(choi_ideal @ choi)) / 16
+        self.assertGreater(fid, 0.9)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -24,6 +24,7 @@ from qiskit import QuantumRegister, QuantumCircuit, Aer
 from qiskit.quantum_info import state_fidelity, partial_trace, Statevector
 import qiskit.ignis.verification.tomography as tomo
 import qiskit.ignis.verification.tomography.fitters.cvx_fit as cvx_fit
+import qiskit.ignis.verification.tomography.fitters.pgd_fit as pgd_fit
 
 
 def run_circuit_and_tomography(circuit, qubits):
@@ -56,6 +57,24 @@ class TestFitter(unittest.TestCase):
             rho = cvx_fit.cvx_fit(p, A, trace=trace_value)
             self.assertAlmostEqual(numpy.trace(rho), trace_value, places=3)
 
+    def test_pgd_fit(self):
+        p = numpy.array([1/2, 1/2, 1/2, 1/2, 1/2, 1/2])
+        A = numpy.array([
+            [0.5 + 0.j, 0.5 + 0.j, 0.5 + 0.j, 0.5 + 0.j],
+            [0.5 + 0.j, -0.5 + 0.j, -0.5 + 0.j, 0.5 + 0.j],
+            [0.5 + 0.j, 0. - 0.5j, 0. + 0.5j, 0.5 + 0.j],
+            [0.5 + 0.j, 0. + 0.5j, 0. - 0.5j, 0.5 + 0.j],
+            [1. + 0.j, 0. + 0.j, 0. + 0.j, 0. + 0.j],
+            [0. + 0.j, 0. + 0.j, 0. + 0.j, 1. + 0.j]
+        ])
+
+        for trace_value in [1, 0.3, 2, 0, 42]:
+            rho = pgd_fit.pgd_fit(p, A, trace=trace_value)
+            self.assertAlmostEqual(numpy.trace(rho), trace_value, places=6)
+            self.assertGreater(min(numpy.linalg.eigvalsh(rho)), -1e-10)
+            rho_cvx = cvx_fit.cvx_fit(p, A, trace=trace_value)
+            self.assertTrue(numpy.allclose(rho, rho_cvx, atol=1e-3))
+
 
 class TestStateTomography(unittest.TestCase):
 
@@ -139,6 +158,123 @@ class TestStateTomography(unittest.TestCase):
         F_bell_mle = state_fidelity(psi, rho_mle, validate=False)
         self.assertAlmostEqual(F_bell_mle, 1, places=1)
 
+    def test_structured_basis_matrix(self):
+        q3 = QuantumRegister(3)
+        ghz = QuantumCircuit(q3)
+        ghz.h(q3[0])
+        ghz.cx(q3[0], q3[1])
+        ghz.cx(q3[1], q3[2])
+        qst = tomo.state_tomography_circuits(ghz, q3)
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=1000, seed_simulator=42)
+        tomo_fit = tomo.StateTomographyFitter(job.result(), qst)
+
+        _, basis_matrix, _ = tomo_fit._fitter_data(True, 0.5)
+        _, basis_op, _ = tomo_fit._fitter_data(True, 0.5, structured=True)
+        self.assertTrue(numpy.allclose(basis_op.toarray(), basis_matrix))
+
+        rho = tomo_fit.fit(method='lstsq', structured=False)
+        rho_op = tomo_fit.fit(method='lstsq', structured=True)
+        self.assertTrue(numpy.allclose(rho, rho_op, atol=1e-8))
+
+        rho = tomo_fit.fit(method='cvx', structured=False)
+        rho_op = tomo_fit.fit(method='cvx', structured=True)
+        self.assertTrue(numpy.allclose(rho, rho_op, atol=1e-3))
+
+    def test_structured_threshold(self):
+        # the dense basis matrix of 4 qubits has 81 * 16 * 256 elements,
+        # and that of 5 qubits 243 * 32 * 1024 > 2 ** 20 elements
+        for num_qubits in [4, 5]:
+            qr = QuantumRegister(num_qubits)
+            circ = QuantumCircuit(qr)
+            circ.h(qr[0])
+            for qubit in range(1, num_qubits):
+                circ.cx(qr[0], qr[qubit])
+            qst = tomo.state_tomography_circuits(circ, qr)
+            job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                                 shots=100, seed_simulator=42)
+            tomo_fit = tomo.StateTomographyFitter(job.result(), qst)
+
+            _, basis_matrix, _ = tomo_fit._fitter_data(True, 0.5, None)
+            self.assertEqual(isinstance(basis_matrix, tomo.fitters.BasisMatrix),
+                             num_qubits == 5)
+            rho_auto = tomo_fit.fit(method='lstsq')
+            rho_dense = tomo_fit.fit(method='lstsq', structured=False)
+            self.assertTrue(numpy.allclose(rho_auto, rho_dense, atol=1e-10))
+
+    def test_pauli_linear_inversion(self):
+        q3 = QuantumRegister(3)
+        circ = QuantumCircuit(q3)
+        circ.h(q3[0])
+        circ.s(q3[0])
+        circ.cx(q3[0], q3[1])
+        circ.rx(0.3, q3[2])
+        circ.cx(q3[1], q3[2])
+        qst = tomo.state_tomography_circuits(circ, [q3[2], q3[0], q3[1]])
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=500, seed_simulator=42)
+        tomo_fit = tomo.StateTomographyFitter(job.result(), qst)
+
+        # unweighted complete Pauli data is fitted by linear inversion
+        rho = tomo_fit.fit(method='lstsq', standard_weights=False)
+        rho_lstsq = tomo.TomographyFitter.fit(
+            tomo_fit, method='lstsq', standard_weights=False,
+            trace=1, psd=True)
+        self.assertTrue(numpy.allclose(rho, rho_lstsq, atol=1e-10))
+
+        # without the data of one basis the general fit is used
+        del tomo_fit.data[next(iter(tomo_fit.data))]
+        self.assertIsNone(tomo_fit._pauli_expectation_values())
+        rho = tomo_fit.fit(method='lstsq', standard_weights=False)
+        rho_lstsq = tomo.TomographyFitter.fit(
+            tomo_fit, method='lstsq', standard_weights=False,
+            trace=1, psd=True)
+        self.assertTrue(numpy.allclose(rho, rho_lstsq, atol=1e-10))
+
+    def test_pgd_method(self):
+        q2 = QuantumRegister(2)
+        bell = QuantumCircuit(q2)
+        bell.h(q2[0])
+        bell.cx(q2[0], q2[1])
+        qst = tomo.state_tomography_circuits(bell, q2)
+        job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                             shots=1000, seed_simulator=42)
+        tomo_fit = tomo.StateTomographyFitter(job.result(), qst)
+
+        rho_pgd = tomo_fit.fit(method='pgd')
+        rho_cvx = tomo_fit.fit(method='cvx')
+        self.assertAlmostEqual(numpy.trace(rho_pgd), 1, places=6)
+        self.assertGreater(min(numpy.linalg.eigvalsh(rho_pgd)), -1e-10)
+        self.assertTrue(numpy.allclose(rho_pgd, rho_cvx, atol=1e-3))
+        rho_op = tomo_fit.fit(method='pgd', structured=True)
+        self.assertTrue(numpy.allclose(rho_pgd, rho_op, atol=1e-6))
+
+    def test_fit_batch(self):
+        q2 = QuantumRegister(2)
+        circ = QuantumCircuit(q2)
+        circ.h(q2[0])
+        circ.cx(q2[0], q2[1])
+        qst = tomo.state_tomography_circuits(circ, q2)
+        fitters = []
+        for seed in range(3):
+            job = qiskit.execute(qst, Aer.get_backend('qasm_simulator'),
+                                 shots=200, seed_simulator=seed)
+            fitters.append(tomo.StateTomographyFitter(job.result(), qst))
+
+        for standard_weights in [True, False]:
+            rhos = tomo.StateTomographyFitter.fit_batch(
+                fitters, standard_weights=standard_weights)
+            self.assertEqual(rhos.shape, (3, 4, 4))
+            for rho, tomo_fit in zip(rhos, fitters):
+                rho_lstsq = tomo_fit.fit(method='lstsq',
+                                         standard_weights=standard_weights)
+                self.assertTrue(numpy.allclose(rho, rho_lstsq, atol=1e-10))
+
+        # the fitters must have the same labels
+        del fitters[1].data[next(iter(fitters[1].data))]
+        self.assertRaises(qiskit.QiskitError,
+                          tomo.StateTomographyFitter.fit_batch, fitters)
+
 
 if __name__ == '__main__':
     unittest.main()
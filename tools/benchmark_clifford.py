@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmark the Clifford and PackedClifford tableau implementations, and
+the sampling of random Cliffords of more than 2 qubits."""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from qiskit.ignis.verification.randomized_benchmarking import (
+    Clifford, PackedClifford, CliffordUtils)
+
+
+def random_gatelist(num_qubits, num_gates, seed):
+    """Return a random list of Clifford gates."""
+    rng = np.random.RandomState(seed)
+    gates_1q = ['x', 'y', 'z', 'h', 's', 'sdg', 'v', 'w']
+    gates_2q = ['cx', 'cz', 'swap']
+    gatelist = []
+    for _ in range(num_gates):
+        if num_qubits > 1 and rng.randint(4) == 0:
+            qubits = rng.choice(num_qubits, 2, replace=False)
+            gatelist.append('%s %d %d' % (gates_2q[rng.randint(3)],
+                                          qubits[0], qubits[1]))
+        else:
+            gatelist.append('%s %d' % (gates_1q[rng.randint(8)],
+                                       rng.randint(num_qubits)))
+    return gatelist
+
+
+def main():
+    """Run the benchmarks and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--samples', type=int, default=1000)
+    args = parser.parse_args()
+
+    print('%-8s %-10s %14s %14s %8s' % ('qubits', 'gates', 'Clifford',
+                                        'PackedClifford', 'speedup'))
+    for num_qubits in [1, 2, 5, 20, 100]:
+        gatelist = random_gatelist(num_qubits, 1000, seed=num_qubits)
+        times = []
+        for cls in (Clifford, PackedClifford):
+            utils = CliffordUtils()
+            times.append(min(timeit.repeat(
+                lambda: utils.compose_gates(cls(num_qubits), gatelist),
+                number=1, repeat=args.repeat)))
+        print('%-8d %-10d %13.2fms %13.2fms %7.1fx' % (
+            num_qubits, len(gatelist), 1e3 * times[0], 1e3 * times[1],
+            times[0] / times[1]))
+
+    print()
+    for packed in (False, True):
+        utils = CliffordUtils(packed=packed)
+        elapsed = min(timeit.repeat(utils.clifford2_gates_table,
+                                    number=1, repeat=args.repeat))
+        print('clifford2_gates_table (packed=%s): %.2fs' % (packed, elapsed))
+
+    print()
+    print('%-8s %14s %12s' % ('qubits', 'per Clifford', 'gates'))
+    utils = CliffordUtils()
+    for num_qubits in range(3, 11):
+        rng = np.random.default_rng(num_qubits)
+        elapsed = min(timeit.repeat(
+            lambda: [utils.random_clifford_gates(num_qubits, rng)
+                     for _ in range(args.samples)],
+            number=1, repeat=args.repeat))
+        num_gates = np.mean([len(utils.random_clifford_gates(num_qubits, rng))
+                             for _ in range(100)])
+        print('%-8d %12.3fms %12.1f' % (num_qubits,
+                                        1e3 * elapsed / args.samples,
+                                        num_gates))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmark loading the 2-qubit group tables from pickle and binary files."""
+
+import argparse
+import os
+import pickle
+import tempfile
+import timeit
+
+from qiskit.ignis.verification.randomized_benchmarking import (
+    BinaryGroupTable, CliffordUtils, DihedralUtils)
+from qiskit.ignis.verification.randomized_benchmarking.binary_tables import (
+    CLIFFORD_TABLE, CNOT_DIHEDRAL_TABLE, write_binary_table)
+
+
+def load_pickle(filename):
+    """Load a pickled table."""
+    with open(filename, 'rb') as pf:
+        return pickle.load(pf)
+
+
+def main():
+    """Run the benchmarks and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    tables = [('cliffords2', CLIFFORD_TABLE,
+               CliffordUtils().clifford2_gates_table()),
+              ('cnot_dihedral_2', CNOT_DIHEDRAL_TABLE,
+               DihedralUtils().cnot_dihedral_tables(2))]
+
+    print('%-16s %10s %10s %12s %12s %12s' % (
+        'table', 'pickle', 'binary', 'unpickle', 'memmap', 'memmap+get'))
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, kind, table in tables:
+            picklefile = os.path.join(tmp_dir, name + '.pickle')
+            binfile = os.path.join(tmp_dir, name + '.bin')
+            with open(picklefile, 'wb') as pf:
+                pickle.dump(table, pf)
+            write_binary_table(binfile, table, kind, 2)
+            # a few lookups, as in the generation of a RB sequence
+            keys = list(table)[::len(table) // 100]
+
+            def load_and_get(binfile=binfile, keys=keys):
+                bin_table = BinaryGroupTable(binfile)
+                for key in keys:
+                    _ = bin_table[key]
+
+            times = [min(timeit.repeat(func, number=1, repeat=args.repeat))
+                     for func in (lambda: load_pickle(picklefile),
+                                  lambda: BinaryGroupTable(binfile),
+                                  load_and_get)]
+            print('%-16s %9.0fk %9.0fk %10.2fms %10.2fms %10.2fms' % (
+                name, os.path.getsize(picklefile) / 1024,
+                os.path.getsize(binfile) / 1024,
+                1e3 * times[0], 1e3 * times[1], 1e3 * times[2]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmark the batched RB decay fit against a curve_fit per pattern."""
+
+import argparse
+import timeit
+
+import numpy as np
+from scipy.optimize import curve_fit
+
+from qiskit.ignis.verification.randomized_benchmarking.batch_fit import (
+    decay_fit_guess, fit_decays)
+
+
+def rb_fit_fun(x, a, alpha, b):
+    """The RB decay, as fit by RBFitter."""
+    return a * alpha ** x + b
+
+
+def random_data(num_patterns, num_lengths, num_seeds, shots, rng):
+    """Sample the mean and std over seeds of random 1 and 2 qubit decays."""
+    lengths = np.tile(np.arange(1, 20 * num_lengths, 20), (num_patterns, 1))
+    asymptote = 1 / 2 ** rng.integers(1, 3, size=num_patterns)
+    alpha = rng.uniform(0.95, 0.999, size=num_patterns)
+    amp = (1 - asymptote) * rng.uniform(0.8, 1, size=num_patterns)
+    probs = amp[:, None] * alpha[:, None] ** lengths + asymptote[:, None]
+    samples = rng.binomial(shots, np.repeat(probs[:, None], num_seeds, 1)) / shots
+    return lengths, samples.mean(1), samples.std(1), asymptote
+
+
+def curve_fit_loop(xdata, ydata, sigma, p0):
+    """Fit each pattern with curve_fit, as RBFitter.fit_data_pattern."""
+    params = []
+    for args in zip(xdata, ydata, sigma, p0):
+        params.append(curve_fit(rb_fit_fun, args[0], args[1], sigma=args[2],
+                                p0=args[3], bounds=([0, 0, 0], [1, 1, 1]))[0])
+    return np.array(params)
+
+
+def batched_fit(xdata, ydata, sigma, p0):
+    """Fit all the patterns together, as RBFitter.fit_data, and refit the
+    patterns whose batched fit fails with curve_fit."""
+    params, _, success = fit_decays(xdata, ydata, sigma, p0)
+    failed = ~success
+    if failed.any():
+        params[failed] = curve_fit_loop(xdata[failed], ydata[failed],
+                                        sigma[failed], p0[failed])
+    return params, success
+
+
+def main():
+    """Run the benchmarks and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--patterns', type=int, nargs='+',
+                        default=[10, 100, 500])
+    parser.add_argument('--lengths', type=int, default=10)
+    parser.add_argument('--seeds', type=int, default=5)
+    parser.add_argument('--shots', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    rng = np.random.default_rng(1234)
+
+    print('%-9s %10s %10s %8s %10s %16s' % (
+        'patterns', 'batched', 'curve_fit', 'speedup', 'refit',
+        'max rel. diff'))
+    for num_patterns in args.patterns:
+        xdata, ydata, sigma, asymptote = random_data(
+            num_patterns, args.lengths, args.seeds, args.shots, rng)
+        p0 = decay_fit_guess(xdata, ydata, asymptote)
+
+        fits = {}
+        times = [min(timeit.repeat(
+            lambda func=func: fits.__setitem__(func, func(xdata, ydata, sigma, p0)),
+            number=1, repeat=args.repeat))
+                 for func in (batched_fit, curve_fit_loop)]
+        params, success = fits[batched_fit]
+        diff = np.abs(params - fits[curve_fit_loop]) / \
+            np.abs(fits[curve_fit_loop])
+        # refit: the patterns whose batched fit failed, fit with curve_fit
+        print('%-9d %9.3fs %9.3fs %7.0fx %10d %16.1e' % (
+            num_patterns, times[0], times[1], times[1] / times[0],
+            np.count_nonzero(~success), diff[success].max()))
+
+
+if __name__ == '__main__':
+    main()
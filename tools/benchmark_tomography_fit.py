@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Benchmark the cvx, pgd and lstsq state tomography fitters."""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from qiskit import QuantumCircuit
+from qiskit.ignis.counts_array import CountsArray
+from qiskit.ignis.verification.tomography import (StateTomographyFitter,
+                                                  state_tomography_circuits)
+
+# the rotations to the measurement basis of each Pauli label
+ROTATIONS = {'X': np.array([[1, 1], [1, -1]]) / np.sqrt(2),
+             'Y': np.array([[1, -1j], [1, 1j]]) / np.sqrt(2),
+             'Z': np.eye(2)}
+
+
+def random_counts(num_qubits, circuits, shots, rng):
+    """Sample the counts of the tomography circuits of a random pure state."""
+    psi = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    psi /= np.linalg.norm(psi)
+    counts = CountsArray()
+    for circ in circuits:
+        label = eval(circ.name)  # pylint: disable=eval-used
+        amps = psi.reshape(num_qubits * (2,))
+        # axis k of the amplitudes is qubit num_qubits - 1 - k
+        for qubit, name in enumerate(label):
+            axis = num_qubits - 1 - qubit
+            amps = np.moveaxis(np.tensordot(ROTATIONS[name], amps, axes=([1], [axis])),
+                               0, axis)
+        probs = np.abs(amps.ravel()) ** 2
+        values = rng.multinomial(shots, probs / probs.sum())
+        counts.add_outcomes(circ.name, np.arange(2 ** num_qubits), values,
+                            num_qubits)
+    return np.outer(psi, psi.conj()), counts
+
+
+def main():
+    """Run the benchmarks and print the timings."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--max-qubits', type=int, default=6)
+    parser.add_argument('--max-cvx-qubits', type=int, default=5)
+    parser.add_argument('--shots', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args()
+    rng = np.random.default_rng(1234)
+
+    print('%-7s %8s %10s %10s %10s %9s %9s %9s %11s' % (
+        'qubits', 'rows', 'lstsq', 'pgd', 'cvx', 'F lstsq', 'F pgd', 'F cvx',
+        '|pgd - cvx|'))
+    for num_qubits in range(1, args.max_qubits + 1):
+        circuits = state_tomography_circuits(QuantumCircuit(num_qubits),
+                                             list(range(num_qubits)))
+        rho, counts = random_counts(num_qubits, circuits, args.shots, rng)
+        fitter = StateTomographyFitter(counts, circuits)
+
+        methods = ['lstsq', 'pgd']
+        if num_qubits <= args.max_cvx_qubits:
+            methods.append('cvx')
+        times = {}
+        fits = {}
+        for method in methods:
+            times[method] = min(timeit.repeat(
+                lambda method=method: fits.__setitem__(method, fitter.fit(method)),
+                number=1, repeat=args.repeat))
+        fids = {method: np.real(np.trace(rho @ fit)) for method, fit in fits.items()}
+
+        def fmt(values, method, form):
+            return form % values[method] if method in values else '-'
+        diff = np.abs(fits['pgd'] - fits['cvx']).max() if 'cvx' in fits else None
+        print('%-7d %8d %10s %10s %10s %9s %9s %9s %11s' % (
+            num_qubits, 6 ** num_qubits,
+            fmt(times, 'lstsq', '%.3fs'), fmt(times, 'pgd', '%.3fs'),
+            fmt(times, 'cvx', '%.3fs'),
+            fmt(fids, 'lstsq', '%.4f'), fmt(fids, 'pgd', '%.4f'),
+            fmt(fids, 'cvx', '%.4f'),
+            '-' if diff is None else '%.1e' % diff))
+
+
+if __name__ == '__main__':
+    main()
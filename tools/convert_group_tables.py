@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Convert pickled Clifford and CNOT-dihedral group tables to the
+binary format used by the randomized benchmarking module."""
+
+import argparse
+import os
+import sys
+
+from qiskit.ignis.verification.randomized_benchmarking import (
+    BinaryGroupTable, convert_pickled_table, tables_dir)
+from qiskit.ignis.verification.randomized_benchmarking.binary_tables import (
+    CLIFFORD_TABLE, CNOT_DIHEDRAL_TABLE)
+
+_KINDS = {'clifford': CLIFFORD_TABLE, 'cnot_dihedral': CNOT_DIHEDRAL_TABLE}
+
+# Default file names of the pickled tables
+_DEFAULT_KINDS = {'cliffords2.pickle': ('clifford', 2),
+                  'cnot_dihedral_2.pickle': ('cnot_dihedral', 2)}
+
+
+def main():
+    """Convert the pickled tables given on the command line."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('picklefiles', nargs='+',
+                        help='pickled table files, e.g. cliffords2.pickle')
+    parser.add_argument('--kind', choices=sorted(_KINDS),
+                        help='kind of the tables (guessed from the default '
+                             'file names if not given)')
+    parser.add_argument('--num-qubits', type=int, default=2)
+    parser.add_argument('--output-dir', default=None,
+                        help='output directory (default: tables_dir())')
+    args = parser.parse_args()
+
+    output_dir = args.output_dir or tables_dir()
+    os.makedirs(output_dir, exist_ok=True)
+    for picklefile in args.picklefiles:
+        kind, num_qubits = args.kind, args.num_qubits
+        if kind is None:
+            try:
+                kind, num_qubits = _DEFAULT_KINDS[os.path.basename(picklefile)]
+            except KeyError:
+                sys.exit('Cannot guess the kind of %s, use --kind' % picklefile)
+        name = os.path.splitext(os.path.basename(picklefile))[0]
+        filename = os.path.join(output_dir, name + '.bin')
+        convert_pickled_table(picklefile, filename, _KINDS[kind], num_qubits)
+        print('%s -> %s (%d entries, %d bytes)' % (
+            picklefile, filename, len(BinaryGroupTable(filename)),
+            os.path.getsize(filename)))
+
+
+if __name__ == '__main__':
+    main()